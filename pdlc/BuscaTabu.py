@@ -0,0 +1,154 @@
+"""
+Busca Tabu para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+=========================================================================
+
+Descrição:
+----------
+Terceira metaheurística, ao lado do Simulated Annealing e do Particle Swarm. Parte do plano
+guloso e, a cada iteração, aplica o melhor movimento (deslocamento, divisão ou união de lotes,
+ver movimento.py) que não seja tabu, mesmo que piore o custo.
+
+- Memória tabu: um dicionário indexado pelo atributo do movimento (criar ou remover a fronteira
+  de lote em um período) guarda até que iteração ele está proibido; a consulta é O(1). Um
+  movimento tabu só é aceito se levar a um custo menor que o melhor já encontrado (aspiração).
+- Planos visitados: cada plano tem um hash de Zobrist (XOR de uma chave aleatória de 64 bits
+  por fim de lote), atualizado em O(1) a cada movimento. Movimentos que levariam a um plano já
+  visitado são descartados antes de terem o custo calculado.
+
+Usa o mesmo ProblemaLote (custo de estoque exponencial) do Simulated Annealing.
+"""
+
+import random
+import time
+
+from .historico import HistoricoCustos
+from .movimento import TIPOS, aplicar_movimento, movimentos
+from .plano import Plano
+from .progresso import Progresso, Prazo
+from .SimulatedAnnealing import ConstrutorPlano, ProblemaLote
+
+
+class OtimizadorPlano:
+    def __init__(self, problema: ProblemaLote, tenure: int = 10, max_visitados: int = 1_000_000, rng=random):
+        self.problema = problema
+        self.tenure = tenure
+        self.max_visitados = max_visitados
+        self.rng = rng
+
+        # Chave de Zobrist de cada período como fim de lote
+        self.chaves = [rng.getrandbits(64) for _ in range(len(problema.demanda))]
+
+    def hash_plano(self, plano: Plano) -> int:
+        h = 0
+        for fim in plano.fins:
+            h ^= self.chaves[fim]
+        return h
+
+    def hash_movimento(self, h: int, plano: Plano, tipo: str, indice: int, fim: int) -> int:
+        """Hash do plano resultante do movimento, sem aplicá-lo"""
+        if tipo == "deslocamento":
+            return h ^ self.chaves[plano.fins[indice]] ^ self.chaves[fim]
+        if tipo == "divisao":
+            return h ^ self.chaves[fim]
+        return h ^ self.chaves[plano.fins[indice]]
+
+    def atributos(self, plano: Plano, tipo: str, indice: int, fim: int) -> tuple[tuple, ...]:
+        """Atributos tabu que o movimento usa: fronteiras que ele cria e que ele remove"""
+        if tipo == "deslocamento":
+            return ("cria", fim), ("remove", plano.fins[indice])
+        if tipo == "divisao":
+            return (("cria", fim),)
+        return (("remove", plano.fins[indice]),)
+
+    def busca_tabu(self, temp_exec=60, max_iter=None, amostra=None, tipos=TIPOS, historico: HistoricoCustos = None,
+                   progresso: Progresso = None, verificar_tempo_a_cada=1):
+        """
+        - amostra: se informado, cada iteração considera apenas os movimentos sobre `amostra` lotes
+          sorteados, em vez da vizinhança inteira (útil em horizontes longos)
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        plano = ConstrutorPlano(self.problema).construir()
+        custo_atual = plano.custo(self.problema)
+        progresso.mensagem("Custo guloso:", custo_atual)
+
+        melhor_plano, melhor_custo = plano.copia(), custo_atual
+        h = self.hash_plano(plano)
+        visitados = {h: None}
+        tabu_ate = {}
+
+        num_iter = 0
+        avaliacoes = 0
+        repetidos = 0
+
+        def ignorar(tipo, indice, fim):
+            nonlocal repetidos
+            if self.hash_movimento(h, plano, tipo, indice, fim) in visitados:
+                repetidos += 1
+                return True
+            return False
+
+        prazo = Prazo(temp_exec, verificar_tempo_a_cada)
+        progresso.iniciar()
+        while (max_iter is None or num_iter < max_iter) and not prazo.esgotado():
+            indices = None
+            if amostra is not None and amostra < len(plano):
+                indices = sorted(self.rng.sample(range(len(plano)), amostra))
+
+            escolhido = None
+            for movimento in movimentos(plano, self.problema, tipos, indices, ignorar):
+                avaliacoes += 1
+                if escolhido is not None and movimento.delta >= escolhido.delta:
+                    continue
+                tabu = any(tabu_ate.get(atributo, -1) >= num_iter
+                           for atributo in self.atributos(plano, *movimento[:3]))
+                if tabu and custo_atual + movimento.delta >= melhor_custo:
+                    continue
+                escolhido = movimento
+
+            num_iter += 1
+            if escolhido is None:
+                # Vizinhança inteira tabu ou já visitada
+                if indices is None:
+                    break
+                continue
+
+            # O movimento inverso fica tabu: recriar o que foi removido e remover o que foi criado
+            for acao, periodo in self.atributos(plano, *escolhido[:3]):
+                inverso = ("remove" if acao == "cria" else "cria", periodo)
+                tabu_ate[inverso] = num_iter + self.tenure
+
+            h = self.hash_movimento(h, plano, *escolhido[:3])
+            aplicar_movimento(plano, escolhido)
+            custo_atual += escolhido.delta
+
+            visitados[h] = None
+            if len(visitados) > self.max_visitados:
+                del visitados[next(iter(visitados))]
+
+            if custo_atual < melhor_custo:
+                melhor_plano, melhor_custo = plano.copia(), custo_atual
+
+            if historico is not None:
+                historico.registrar(custo_atual)
+            progresso.informar(num_iter, melhor_custo, avaliacoes=avaliacoes, repetidos=repetidos)
+
+        progresso.finalizar(num_iter, melhor_custo, avaliacoes=avaliacoes, repetidos=repetidos)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+    otimizador = OtimizadorPlano(problema, tenure=10)
+
+    t0 = time.time()
+    melhor_plano, custo_total = otimizador.busca_tabu(temp_exec=10)
+
+    print("Melhor plano:", melhor_plano)
+    print("Custo total:", custo_total)
+    print("Ótimo (programação dinâmica):", problema.motor.plano_otimo()[1])
+    print("Tempo de execução:", round(time.time() - t0, 6))
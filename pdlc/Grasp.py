@@ -0,0 +1,209 @@
+"""
+GRASP Paralelo para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+============================================================================
+
+Descrição:
+----------
+Greedy Randomized Adaptive Search Procedure: cada iteração monta um plano com a construção
+gulosa aleatorizada (ConstrutorPlano.construir_aleatorio, que sorteia o fim de cada lote entre
+os `tamanho_rcl` de menor custo médio) e o leva a um ótimo local com a busca local de
+movimento.py. As iterações são independentes e são distribuídas, em lotes de `iter_por_lote`,
+entre processos trabalhadores.
+
+O processo principal mantém uma elite com os `tamanho_elite` melhores ótimos locais distintos.
+O custo de entrada na elite (o melhor custo, com tamanho_elite=1) fica em memória compartilhada
+com os trabalhadores, que só devolvem os planos capazes de entrar nela; a comunicação entre os
+processos não cresce com o número de iterações.
+
+A elite serve de conjunto de pontos de partida diversos para o Simulated Annealing e o Particle
+Swarm (parâmetro plano_inicial de ambos).
+
+Usa o mesmo ProblemaLote (custo de estoque exponencial) do Simulated Annealing.
+"""
+
+import os
+import random
+import time
+
+from .movimento import TIPOS, busca_local
+from .PDLC import ConstrutorPlano
+from .plano import Plano
+from .progresso import Progresso, Prazo
+from .SimulatedAnnealing import ProblemaLote
+
+
+class OtimizadorPlano:
+    def __init__(self, problema: ProblemaLote, tamanho_rcl: int = 3, estrategia: str = "melhor", tipos=TIPOS):
+        """
+        - tamanho_rcl: tamanho da lista restrita de candidatos da construção (1 torna a construção determinística)
+        - estrategia, tipos: estratégia e movimentos da busca local (ver movimento.busca_local)
+        """
+        self.problema = problema
+        self.construtor = ConstrutorPlano(problema)
+        self.tamanho_rcl = tamanho_rcl
+        self.estrategia = estrategia
+        self.tipos = tipos
+        self.elite = []  # (custo, plano) dos melhores ótimos locais distintos, do melhor para o pior
+
+    def iteracao(self, rng=random, prazo: Prazo = None) -> tuple[Plano, float]:
+        """Uma iteração do GRASP: construção aleatorizada seguida de busca local (interrompida no fim do prazo)"""
+        plano = self.construtor.construir_aleatorio(self.tamanho_rcl, rng)
+        return busca_local(plano, self.problema.avaliador, self.estrategia, self.tipos, prazo=prazo)
+
+    def lote(self, iteracoes: int, rng=random, limiar=None, tamanho_elite: int = 10,
+             prazo: Prazo = None) -> tuple[list[tuple[float, Plano]], int]:
+        """
+        Executa até `iteracoes` iterações, parando antes se o prazo se esgotar, e devolve até
+        tamanho_elite ótimos locais distintos, do melhor para o pior, descartando os de custo não
+        menor que limiar() (o custo de entrada na elite), junto com o número de iterações executadas.
+        """
+        encontrados = {}
+        executadas = 0
+        while executadas < iteracoes and not (prazo is not None and prazo.esgotado()):
+            plano, custo = self.iteracao(rng, prazo)
+            executadas += 1
+            if limiar is not None and custo >= limiar():
+                continue
+            encontrados.setdefault(plano.fins.tobytes(), (custo, plano))
+        return sorted(encontrados.values(), key=lambda item: item[0])[:tamanho_elite], executadas
+
+    def atualizar_elite(self, candidatos: list[tuple[float, Plano]], tamanho_elite: int) -> bool:
+        """Acrescenta os candidatos distintos à elite, mantendo os tamanho_elite melhores; devolve se o melhor mudou"""
+        melhor = self.elite[0][0] if self.elite else float('inf')
+        vistos = {plano.fins.tobytes() for _, plano in self.elite}
+        for custo, plano in candidatos:
+            chave = plano.fins.tobytes()
+            if chave not in vistos:
+                vistos.add(chave)
+                self.elite.append((custo, plano))
+        self.elite.sort(key=lambda item: item[0])
+        del self.elite[tamanho_elite:]
+        return bool(self.elite) and self.elite[0][0] < melhor
+
+    def limiar_elite(self, tamanho_elite: int) -> float:
+        return self.elite[-1][0] if len(self.elite) >= tamanho_elite else float('inf')
+
+    def grasp(self, iteracoes: int = None, temp_exec=60, num_processos: int = None, iter_por_lote: int = 10,
+              tamanho_elite: int = 10, semente=None, progresso: Progresso = None):
+        """
+        Executa iterações do GRASP até completar `iteracoes` (None: sem limite) ou esgotar temp_exec
+        segundos, e devolve o melhor plano encontrado. Os melhores planos distintos ficam em self.elite.
+
+        - num_processos: processos trabalhadores (padrão: CPUs); com 1 tudo roda no próprio processo
+        - iter_por_lote: iterações por tarefa enviada a um trabalhador
+        - semente: cada lote usa um gerador próprio derivado dela, de modo que os planos gerados não
+          dependem de qual trabalhador executou o lote (a ordem em que chegam à elite pode depender)
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        num_processos = num_processos or os.cpu_count() or 1
+        semente = random.getrandbits(64) if semente is None else semente
+        self.elite = []
+
+        prazo = Prazo(temp_exec)
+        num_iter = 0
+        progresso.iniciar()
+        if num_processos == 1:
+            num_lote = 0
+            while (iteracoes is None or num_iter < iteracoes) and not prazo.esgotado():
+                tamanho = iter_por_lote if iteracoes is None else min(iter_por_lote, iteracoes - num_iter)
+                rng = random.Random(f"{semente}-{num_lote}")
+                candidatos, executadas = self.lote(tamanho, rng, lambda: self.limiar_elite(tamanho_elite),
+                                                   tamanho_elite, prazo)
+                self.atualizar_elite(candidatos, tamanho_elite)
+                num_iter += executadas
+                num_lote += 1
+                # O prazo pode se esgotar já na primeira iteração do lote, que então não devolve candidatos
+                if self.elite:
+                    progresso.informar(num_iter, self.elite[0][0])
+        else:
+            num_iter = self._grasp_paralelo(iteracoes, prazo, num_processos, iter_por_lote, tamanho_elite, semente,
+                                            progresso)
+
+        melhor_custo, melhor_plano = self.elite[0] if self.elite else (float('inf'), Plano())
+        progresso.finalizar(num_iter, melhor_custo, elite=len(self.elite))
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+    def _grasp_paralelo(self, iteracoes, prazo: Prazo, num_processos: int, iter_por_lote: int, tamanho_elite: int,
+                        semente, progresso: Progresso) -> int:
+        # O multiprocessing só é carregado por quem usa o modo paralelo
+        import multiprocessing
+        from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+        limiar = multiprocessing.Value('d', float('inf'))
+        max_pendentes = 2 * num_processos
+        submetidas = 0
+        num_lote = 0
+        num_iter = 0
+        with ProcessPoolExecutor(max_workers=num_processos, initializer=_iniciar_trabalhador,
+                                 initargs=(self, limiar)) as executor:
+            pendentes = set()
+            while True:
+                while (len(pendentes) < max_pendentes and (iteracoes is None or submetidas < iteracoes)
+                       and not prazo.esgotado()):
+                    tamanho = iter_por_lote if iteracoes is None else min(iter_por_lote, iteracoes - submetidas)
+                    pendentes.add(executor.submit(_executar_lote, f"{semente}-{num_lote}", tamanho, tamanho_elite,
+                                                  prazo))
+                    submetidas += tamanho
+                    num_lote += 1
+
+                if not pendentes:
+                    break
+
+                # Até o prazo a espera acorda nele; depois, só pelos lotes que ainda terminam
+                restante = prazo.fim - time.monotonic()
+                prontos, pendentes = wait(pendentes, timeout=restante if restante > 0 else None,
+                                          return_when=FIRST_COMPLETED)
+                for futuro in prontos:
+                    candidatos, executadas = futuro.result()
+                    self.atualizar_elite(candidatos, tamanho_elite)
+                    limiar.value = self.limiar_elite(tamanho_elite)
+                    num_iter += executadas
+
+                # No fim do prazo os lotes ainda na fila são cancelados; os que já estão em
+                # execução veem o mesmo prazo e param na iteração seguinte
+                if prazo.esgotado():
+                    for futuro in pendentes:
+                        futuro.cancel()
+                    pendentes = {futuro for futuro in pendentes if not futuro.cancelled()}
+                if self.elite:
+                    progresso.informar(num_iter, self.elite[0][0])
+        return num_iter
+
+
+_otimizador_trabalhador = None
+_limiar_trabalhador = None
+
+
+def _iniciar_trabalhador(otimizador: OtimizadorPlano, limiar):
+    """Recebe o otimizador (com o problema) e o limiar compartilhado uma única vez em cada processo do pool"""
+    global _otimizador_trabalhador, _limiar_trabalhador
+    _otimizador_trabalhador = otimizador
+    _limiar_trabalhador = limiar
+
+
+def _executar_lote(semente: str, iteracoes: int, tamanho_elite: int, prazo: Prazo):
+    """O prazo é o do processo principal: time.monotonic() é o mesmo relógio em todos os processos da máquina"""
+    rng = random.Random(semente)
+    limiar = _limiar_trabalhador
+    return _otimizador_trabalhador.lote(iteracoes, rng, lambda: limiar.value, tamanho_elite, prazo)
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    from .SimulatedAnnealing import OtimizadorPlano as OtimizadorSA
+
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+
+    t0 = time.time()
+    otimizador = OtimizadorPlano(problema, tamanho_rcl=3)
+    melhor_plano, custo_total = otimizador.grasp(temp_exec=10, semente=0)
+    print("GRASP:", custo_total, f"({round(time.time() - t0, 6)}s)")
+    print("Elite:", [custo for custo, _ in otimizador.elite])
+
+    # A elite como ponto de partida do Simulated Annealing
+    _, custo_sa = OtimizadorSA(problema).simulated_annealing(temp_exec=5, plano_inicial=otimizador.elite[0][1])
+    print("Simulated Annealing a partir do GRASP:", custo_sa)
+    print("Ótimo (programação dinâmica):", problema.motor.plano_otimo()[1])
@@ -0,0 +1,133 @@
+"""
+Instância do Problema de Dimensionamento de Lotes Capacitado (PDLC) e Construção Gulosa
+=======================================================================================
+
+Descrição:
+----------
+PDLC guarda os dados de uma instância e o motor de custos dos lotes (ver motorCusto.py), e é
+a classe usada por todos os otimizadores: o ProblemaLote do Simulated Annealing, da Busca Tabu
+e do teste.py é o próprio PDLC, e o do Particle Swarm é o PDLC com o custo de estoque linear.
+ConstrutorPlano monta a solução gulosa por custo médio a partir de qualquer um deles, ou a sua
+versão aleatorizada com lista restrita de candidatos (RCL) usada pelo GRASP (ver Grasp.py).
+
+modo_custo escolhe o modelo de custo:
+- "exato": custo de estoque exponencial, em inteiros exatos;
+- "float": o mesmo custo em float, com saturação em infinito em horizontes longos;
+- "linear": custo de estoque linear, o modelo do Particle Swarm.
+
+compacto=True guarda as somas de prefixo em arrays tipados (ver motorCusto.py), para séries de
+demanda muito longas, como as carregadas de um arquivo binário por instanciaBinaria.py.
+"""
+
+import heapq
+import random
+
+from .instrumentacao import Instrumentacao
+from .motorCusto import CacheCusto, MotorCusto, MotorCustoFloat, MotorCustoLinear
+from .plano import Plano
+
+MOTORES = {
+    "exato": MotorCusto,
+    "float": MotorCustoFloat,
+    "linear": MotorCustoLinear,
+}
+
+
+class PDLC:
+
+    def __init__(self, demanda: list[int], custo_fixo: int, custo_estoque: int, capacidade: int, tamanho_cache: int = 0,
+                 modo_custo: str = "exato", compacto: bool = False):
+        if modo_custo not in MOTORES:
+            raise ValueError(f"Modo de custo desconhecido: {modo_custo}")
+        self.demanda = demanda
+        self.custo_fixo = custo_fixo
+        self.custo_estoque = custo_estoque
+        self.capacidade = capacidade
+        self.modo_custo = modo_custo
+        self.compacto = compacto
+        self.motor = MOTORES[modo_custo](demanda, custo_fixo, custo_estoque, capacidade, compacto=compacto)
+
+        # Com tamanho_cache > 0 os custos dos lotes passam por um cache de até tamanho_cache entradas
+        self.cache = CacheCusto(self.motor, tamanho_cache) if tamanho_cache > 0 else None
+        self.avaliador = self.cache if self.cache is not None else self.motor
+
+    def estender(self, novas_demandas: list[int]):
+        """Acrescenta períodos ao fim do horizonte, estendendo as tabelas do motor sem reconstruí-las"""
+        self.motor.estender(novas_demandas)
+        if self.cache is not None:
+            self.cache.estender()
+
+    def custo(self, i: int, j: int) -> float:
+        return self.avaliador.custo(i, j)
+
+    def custo_total_plano(self, plano: list[tuple[int, int]]) -> float:
+        return self.avaliador.custo_total_plano(plano)
+
+    def custo_medio(self, i: int, j: int) -> float:
+        return self.custo(i, j) / (j - i + 1)
+
+
+class ConstrutorPlano:
+    def __init__(self, problema: PDLC, parada_antecipada: bool = False):
+        self.problema = problema
+        # Com parada_antecipada=True cada lote é encerrado assim que o custo médio para de cair (Silver-Meal)
+        self.parada_antecipada = parada_antecipada
+
+    def algoritmo_construtivo(self, plano_atual: list[tuple[int, int]]) -> list[tuple[int, int]]:
+        inicio = plano_atual[-1][1] + 1 if plano_atual else 0
+        if inicio >= len(self.problema.demanda):
+            return plano_atual
+
+        # Custo médio acumulado incrementalmente, parando na primeira violação de capacidade
+        fim = self.problema.motor.melhor_fim(inicio, self.parada_antecipada)
+        plano_atual.append((inicio, fim))
+        return plano_atual
+
+    def construir(self, instrumentacao: Instrumentacao = None) -> Plano:
+        """Construção gulosa direto na representação compacta"""
+        if instrumentacao is not None:
+            instrumentacao.envolver(self.problema.motor, "melhor_fim", fase="construcao", contador="lotes_construidos")
+            try:
+                return self.construir()
+            finally:
+                instrumentacao.restaurar()
+
+        plano = Plano()
+        inicio = 0
+        while inicio < len(self.problema.demanda):
+            fim = self.problema.motor.melhor_fim(inicio, self.parada_antecipada)
+            plano.fins.append(fim)
+            inicio = fim + 1
+        return plano
+
+    def construcao_gulosa(self, instrumentacao: Instrumentacao = None) -> list[tuple[int, int]]:
+        return self.construir(instrumentacao).para_tuplas()
+
+    def candidatos(self, inicio: int, tamanho_rcl: int) -> list[int]:
+        """
+        Lista restrita de candidatos: os `tamanho_rcl` fins do lote iniciado em `inicio` com menor
+        custo médio por período, do melhor para o pior (empates pelo lote mais curto). Com
+        tamanho_rcl=1 é o fim escolhido pela construção gulosa.
+        """
+        custo = self.problema.motor.custo
+        infinito = float('inf')
+
+        def medios():
+            for fim in range(inicio, len(self.problema.demanda)):
+                custo_lote = custo(inicio, fim)
+                # O custo só cresce com o fim: daqui em diante todos os lotes são inviáveis
+                if custo_lote == infinito:
+                    return
+                yield custo_lote / (fim - inicio + 1), fim
+
+        return [fim for _, fim in heapq.nsmallest(tamanho_rcl, medios())] or [inicio]
+
+    def construir_aleatorio(self, tamanho_rcl: int = 3, rng=random) -> Plano:
+        """Construção gulosa aleatorizada: cada lote termina em um fim sorteado da lista restrita de candidatos"""
+        plano = Plano()
+        inicio = 0
+        while inicio < len(self.problema.demanda):
+            fim = rng.choice(self.candidatos(inicio, tamanho_rcl))
+            plano.fins.append(fim)
+            inicio = fim + 1
+        return plano
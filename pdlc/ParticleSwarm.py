@@ -0,0 +1,287 @@
+import random
+import time
+
+from .checkpoint import Checkpoint
+from .historico import HistoricoCustos
+from .instrumentacao import Instrumentacao
+from .PDLC import PDLC, ConstrutorPlano
+from .plano import Plano
+from .progresso import Progresso, Prazo
+
+class ProblemaLote(PDLC):
+    """O PDLC com o custo de estoque linear do Particle Swarm (ver PDLC.py)"""
+
+    def __init__(self, demanda: list[int], custo_fixo: int, custo_estoque: int, capacidade: int, tamanho_cache: int = 0,
+                 modo_custo: str = "linear", compacto: bool = False):
+        super().__init__(demanda, custo_fixo, custo_estoque, capacidade, tamanho_cache, modo_custo, compacto)
+
+class Particula:
+    def __init__(self, problema: ProblemaLote, plano: Plano):
+        self.problema = problema
+        self.T = len(problema.demanda) - 1
+        self.vetor = self.plano_p_vetor(plano)
+        self.vel = [random.uniform(-1, 1) for _ in range(len(self.vetor))]
+        
+        # Limites para evitar overflow
+        self.max_vel = 5.0
+        self.min_pos = 0
+        self.max_pos = self.T
+        
+        self.custo_melhor_local = self.calcular_custo()
+        self.melhor_local = self.vetor.copy()
+
+    def plano_p_vetor(self, plano: Plano) -> list[int]:
+        return plano.fins[:-1].tolist()
+
+    def decodificar(self) -> Plano:
+        i = 0
+        plano = Plano()
+        for variavel in self.vetor:
+            # Limita o valor entre 0 e T
+            valor_limitado = max(self.min_pos, min(self.max_pos, variavel))
+            j = int(round(valor_limitado))
+            j = max(i, min(j, self.T))
+            plano.fins.append(j)
+            i = j + 1
+
+        if i <= self.T:
+            plano.fins.append(self.T)
+        return plano
+
+    def get_plano(self) -> list[tuple[int, int]]:
+        return self.decodificar().para_tuplas()
+
+    def calcular_custo(self) -> float:
+        plano = self.decodificar()
+        if not plano.fins or plano.fins[-1] != self.T:
+            return float('inf')
+        return plano.custo(self.problema)
+    
+    def atualizar(self, w: float, c1: float, c2: float, melhor_global_pos: list[float], melhor_global_custo: float):
+        for i in range(len(self.vetor)):
+            r1, r2 = random.random(), random.random()
+            inercia = w * self.vel[i]
+            cognitivo = c1 * r1 * (self.melhor_local[i] - self.vetor[i])
+            social = c2 * r2 * (melhor_global_pos[i] - self.vetor[i])
+            
+            # Atualiza velocidade com limite
+            self.vel[i] = max(-self.max_vel, min(self.max_vel, inercia + cognitivo + social))
+            
+            # Atualiza posição com limite
+            self.vetor[i] = max(self.min_pos, min(self.max_pos, self.vetor[i] + self.vel[i]))
+        
+        custo_atual = self.calcular_custo()
+        if custo_atual < self.custo_melhor_local:
+            self.custo_melhor_local = custo_atual
+            self.melhor_local = self.vetor.copy()
+            
+        return custo_atual
+
+
+
+class OtimizadorPlano:
+    def __init__(self, problema: ProblemaLote, num_particulas: int, vetorizado: bool = False,
+                 plano_inicial: Plano = None):
+        """plano_inicial: o enxame é semeado com este plano (intacto na primeira partícula) em vez do guloso"""
+        self.problema = problema
+        self.construtor = ConstrutorPlano(problema)
+        self.num_particulas = num_particulas
+        
+        # Gera plano inicial guloso
+        plano_guloso = plano_inicial if plano_inicial is not None else self.construtor.construir()
+        
+        # Inicializa partículas
+        self.particulas = []
+        self.enxame = None
+        if vetorizado:
+            # Enxame inteiro em matrizes NumPy (import tardio: dependência opcional)
+            from .enxameVetorizado import Enxame
+            planos = [self.perturbar_plano(plano_guloso) for _ in range(num_particulas)]
+            if plano_inicial is not None:
+                planos[0] = plano_inicial
+            self.enxame = Enxame(problema, planos, semente=random.getrandbits(64))
+        else:
+            for k in range(num_particulas):
+                # Cria pequenas variações do plano guloso para diversidade
+                plano_perturbado = self.perturbar_plano(plano_guloso)
+                if k == 0 and plano_inicial is not None:
+                    plano_perturbado = plano_inicial
+                self.particulas.append(Particula(problema, plano_perturbado))
+        
+        # Inicializa melhor global
+        self.melhor_global_pos = None
+        self.melhor_global_custo = float('inf')
+        self.atualizar_melhor_global()
+
+    def perturbar_plano(self, plano: Plano) -> Plano:
+        plano = plano.copia()
+        if len(plano) <= 1:
+            return plano
+            
+        index = random.randint(0, len(plano)-2)
+        minimo, maximo = plano.inicio(index), plano.fins[index+1]-1
+        plano.deslocar(index, random.randint(minimo, maximo))
+        return plano
+
+    def atualizar_melhor_global(self):
+        if self.enxame is not None:
+            indice = int(self.enxame.custo_melhor_local.argmin())
+            if self.enxame.custo_melhor_local[indice] < self.melhor_global_custo:
+                self.melhor_global_pos = self.enxame.melhor_local[indice].copy()
+                self.melhor_global = self.enxame.get_plano(self.melhor_global_pos)
+                self.melhor_global_custo = self.problema.custo_total_plano(self.melhor_global)
+            return
+
+        for particula in self.particulas:
+            custo = particula.custo_melhor_local
+            if custo < self.melhor_global_custo:
+                self.melhor_global_custo = custo
+                self.melhor_global_pos = particula.melhor_local.copy()
+                self.melhor_global = particula.get_plano()
+
+    def PSO(self, temp_exec: int, w: float, c1: float, c2: float, historico: HistoricoCustos = None,
+            progresso: Progresso = None, verificar_tempo_a_cada: int = 1,
+            instrumentacao: Instrumentacao = None, checkpoint: Checkpoint = None,
+            retomar: dict = None) -> tuple[list[tuple[int, int]], float]:
+        """
+        - instrumentacao: se informada, recebe contadores e tempos por fase da execução
+        - checkpoint: grava periodicamente o estado do enxame (ver checkpoint.py)
+        - retomar: estado lido de um checkpoint; o enxame (que deve ter sido criado com o mesmo
+          número de partículas e modo) continua exatamente de onde ele foi gravado, descontando
+          de temp_exec o tempo já gasto
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        num_iter, decorrido = 0, 0.0
+        if retomar is not None:
+            num_iter, decorrido = retomar["iteracoes"], retomar["tempo"]
+            self.restaurar_estado(retomar)
+            progresso.mensagem("Retomando do checkpoint:", num_iter, "iterações")
+        progresso.mensagem("Melhor Custo Global Semi-guloso:", self.melhor_global_custo)
+
+        if instrumentacao is not None:
+            self.instrumentar(instrumentacao)
+
+        prazo = Prazo(temp_exec - decorrido, verificar_tempo_a_cada)
+        progresso.iniciar()
+        iter_inicial = num_iter
+        inicio_laco = time.perf_counter()
+        try:
+            while not prazo.esgotado():
+                # Atualiza o enxame vetorizado de uma vez só
+                if self.enxame is not None:
+                    self.enxame.atualizar(w, c1, c2, self.melhor_global_pos)
+
+                # Atualiza cada partícula
+                for particula in self.particulas:
+                    particula.atualizar(w, c1, c2, self.melhor_global_pos, self.melhor_global_custo)
+            
+                # Atualiza melhor global
+                self.atualizar_melhor_global()
+                if historico is not None:
+                    historico.registrar(self.melhor_global_custo)
+
+                num_iter += 1
+                progresso.informar(num_iter, self.melhor_global_custo)
+
+                if checkpoint is not None:
+                    checkpoint.talvez_salvar(lambda: {**self.estado(), "iteracoes": num_iter,
+                                                      "tempo": decorrido + time.perf_counter() - inicio_laco})
+
+            if checkpoint is not None:
+                checkpoint.finalizar()
+        finally:
+            # Desfaz os envoltórios mesmo se a busca for interrompida por uma exceção
+            if instrumentacao is not None:
+                self.fechar_instrumentacao(instrumentacao, num_iter - iter_inicial,
+                                           time.perf_counter() - inicio_laco)
+
+        progresso.finalizar(num_iter, self.melhor_global_custo)
+        return self.melhor_global, self.melhor_global_custo
+
+    def estado(self) -> dict:
+        """Retrato do enxame para um checkpoint: cópias das posições, velocidades e melhores, e os geradores"""
+        estado = {
+            "vetorizado": self.enxame is not None,
+            "num_particulas": self.num_particulas,
+            "melhor_global_pos": self.melhor_global_pos.copy(),
+            "melhor_global": list(self.melhor_global),
+            "melhor_global_custo": self.melhor_global_custo,
+            "rng": random.getstate(),
+        }
+        if self.enxame is not None:
+            enxame = self.enxame
+            estado.update(pos=enxame.pos.copy(), vel=enxame.vel.copy(), melhor_local=enxame.melhor_local.copy(),
+                          custo_melhor_local=enxame.custo_melhor_local.copy(),
+                          rng_enxame=enxame.rng.bit_generator.state)
+        else:
+            estado["particulas"] = [(particula.vetor.copy(), particula.vel.copy(), particula.melhor_local.copy(),
+                                     particula.custo_melhor_local) for particula in self.particulas]
+        return estado
+
+    def restaurar_estado(self, estado: dict):
+        if estado["vetorizado"] != (self.enxame is not None) or estado["num_particulas"] != self.num_particulas:
+            raise ValueError("Checkpoint de um enxame com outro número de partículas ou modo (vetorizado ou não)")
+
+        self.melhor_global_pos = estado["melhor_global_pos"]
+        self.melhor_global = estado["melhor_global"]
+        self.melhor_global_custo = estado["melhor_global_custo"]
+        random.setstate(estado["rng"])
+        if self.enxame is not None:
+            enxame = self.enxame
+            enxame.pos, enxame.vel = estado["pos"], estado["vel"]
+            enxame.melhor_local, enxame.custo_melhor_local = estado["melhor_local"], estado["custo_melhor_local"]
+            enxame.rng.bit_generator.state = estado["rng_enxame"]
+        else:
+            for particula, (vetor, vel, melhor_local, custo_melhor_local) in zip(self.particulas, estado["particulas"]):
+                particula.vetor, particula.vel = vetor, vel
+                particula.melhor_local, particula.custo_melhor_local = melhor_local, custo_melhor_local
+
+    def instrumentar(self, instrumentacao: Instrumentacao):
+        """Envolve os passos de cada varredura (ver instrumentacao.py); desfeito por fechar_instrumentacao"""
+        if self.enxame is not None:
+            instrumentacao.envolver(self.enxame, "atualizar", fase="atualizacao")
+            instrumentacao.envolver(self.enxame, "calcular_custos", fase="decodificacao_custo",
+                                    inviavel="planos_inviaveis")
+        for particula in self.particulas:
+            instrumentacao.envolver(particula, "atualizar", fase="atualizacao")
+            instrumentacao.envolver(particula, "calcular_custo", fase="decodificacao_custo", inviavel="planos_inviaveis")
+        instrumentacao.envolver(self, "atualizar_melhor_global", fase="melhor_global")
+        instrumentacao.envolver(self.problema, "custo", fase="motor_custo", contador="avaliacoes")
+        instrumentacao.observar_cache(self.problema.cache)
+        # Os tempos acumulam entre execuções com a mesma Instrumentacao; fechar_instrumentacao desconta estes
+        self._tempos_iniciais = dict(instrumentacao.tempos)
+
+    def fechar_instrumentacao(self, instrumentacao: Instrumentacao, num_iter: int, tempo_laco: float):
+        """num_iter e tempo_laco são os desta execução, mesmo retomada de um checkpoint"""
+        instrumentacao.restaurar()
+        contadores, tempos = instrumentacao.contadores, instrumentacao.tempos
+        contadores["iteracoes"] += num_iter
+        contadores["planos_avaliados"] += num_iter * self.num_particulas
+
+        # O que sobra do laço é a contabilidade (histórico e progresso)
+        tempos["laco"] += tempo_laco
+        instrumentacao.chamadas["laco"] += 1
+        inicial = self._tempos_iniciais
+        fases = sum(tempos[fase] - inicial.get(fase, 0.0) for fase in ("atualizacao", "melhor_global"))
+        tempos["registro"] += tempo_laco - fases
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+    
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+    otimizador = OtimizadorPlano(problema, num_particulas=100)
+
+    t0 = time.time()
+    melhor_plano, custo_total = otimizador.PSO(
+        temp_exec=60,
+        w=0.8,
+        c1=1.7,
+        c2=1.2
+    )
+
+    print("Melhor plano:", melhor_plano)
+    print("Custo total:", custo_total)
+    print("Tempo de execução:", round(time.time() - t0, 4), "segundos")
\ No newline at end of file
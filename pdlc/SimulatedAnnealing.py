@@ -0,0 +1,508 @@
+"""
+Busca Local com Simulated Annealing para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+===================================================================================================
+
+Descrição:
+----------
+Implementação de uma heurística de busca local baseada no método de *Simulated Annealing* para o
+Problema de Dimensionamento de Lotes Capacitado (PDLC). O algoritmo parte de uma solução inicial
+gerada por um algoritmo guloso construtivo e realiza perturbações na solução buscando escapar de
+mínimos locais, com o objetivo de encontrar planos de produção com menor custo total (custos fixos
+de produção + custos de estocagem), respeitando a capacidade máxima de produção.
+
+Autor(es):
+----------
+- Bernardo Ramos
+- Matheus Citeli
+"""
+
+
+
+import math
+import random
+import time
+
+from .checkpoint import Checkpoint
+from .historico import HistoricoCustos
+from .instrumentacao import Instrumentacao
+from .motorCusto import probabilidade_aceitacao
+from .PDLC import PDLC, ConstrutorPlano
+from .plano import Plano
+from .progresso import Progresso, Prazo
+
+# O ProblemaLote do Simulated Annealing é o PDLC com o custo de estoque exponencial (ver PDLC.py)
+ProblemaLote = PDLC
+
+class OtimizadorPlano:
+    def __init__(self, problema: ProblemaLote):
+        self.problema = problema
+
+    def deslocamento(self, plano: Plano, rng=random) -> tuple[int, int]:
+        """Sorteia um deslocamento da fronteira entre os lotes index e index+1, devolvendo (index, novo fim do lote index)"""
+        index = rng.randint(0, len(plano)-2)
+        minimo, maximo = plano.inicio(index), plano.fins[index+1]-1
+        return index, rng.randint(minimo, maximo)
+
+    def delta_deslocamento(self, plano: Plano, index: int, fim: int) -> float:
+        """Variação do custo total do plano ao aplicar o deslocamento, recalculando apenas os dois lotes afetados"""
+        custo = self.problema.custo
+        inicio, fim_atual, fim_proximo = plano.inicio(index), plano.fins[index], plano.fins[index+1]
+        antigo = custo(inicio, fim_atual) + custo(fim_atual + 1, fim_proximo)
+        novo = custo(inicio, fim) + custo(fim + 1, fim_proximo)
+        return novo - antigo
+
+    def aplicar_deslocamento(self, plano: Plano, index: int, fim: int):
+        """Aplica o deslocamento no próprio plano"""
+        plano.deslocar(index, fim)
+
+    def cadeia(self, plano: Plano, custo_atual: float, T: float, iteracoes: int, rng=random):
+        """Executa iteracoes passos de Metropolis à temperatura fixa T, alterando o plano no lugar"""
+        melhor_plano = plano.copia()
+        melhor_custo = custo_atual
+        if len(plano) < 2:
+            return plano, custo_atual, melhor_plano, melhor_custo
+
+        for _ in range(iteracoes):
+            index, fim = self.deslocamento(plano, rng)
+            delta = self.delta_deslocamento(plano, index, fim)
+
+            if delta < 0 or rng.random() < probabilidade_aceitacao(delta, T):
+                self.aplicar_deslocamento(plano, index, fim)
+                custo_atual += delta
+
+                if custo_atual < melhor_custo:
+                    melhor_plano = plano.copia()
+                    melhor_custo = custo_atual
+
+        return plano, custo_atual, melhor_plano, melhor_custo
+
+    def simulated_annealing(self, T_inicial=10000, T_min=1e-6, alpha=0.99, iter_por_temp=500, temp_exec=60,
+                            historico: HistoricoCustos = None, progresso: Progresso = None, verificar_tempo_a_cada=1,
+                            plano_inicial: Plano = None, instrumentacao: Instrumentacao = None,
+                            checkpoint: Checkpoint = None, retomar: dict = None):
+        """
+        - plano_inicial: parte deste plano (que não é alterado) em vez da solução gulosa
+        - instrumentacao: se informada, recebe contadores e tempos por fase da execução
+        - checkpoint: grava periodicamente o estado da busca (ver checkpoint.py)
+        - retomar: estado lido de um checkpoint; a busca continua exatamente de onde ele foi
+          gravado, descontando de temp_exec o tempo já gasto
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        decorrido = 0.0
+        if retomar is not None:
+            plano_atual, custo_atual = Plano(retomar["plano"]), retomar["custo"]
+            melhor_plano, melhor_custo = Plano(retomar["melhor_plano"]), retomar["melhor_custo"]
+            T, num_iter, decorrido = retomar["temperatura"], retomar["iteracoes"], retomar["tempo"]
+            random.setstate(retomar["rng"])
+            progresso.mensagem("Retomando do checkpoint:", num_iter, "iterações")
+        else:
+            if plano_inicial is not None:
+                plano_atual = plano_inicial.copia()
+            else:
+                plano_atual = ConstrutorPlano(self.problema).construir(instrumentacao)
+            progresso.mensagem("Solução gulosa:", plano_atual.para_tuplas())
+
+            melhor_plano = plano_atual.copia()
+            custo_atual = plano_atual.custo(self.problema)
+            progresso.mensagem("Custo:", custo_atual)
+
+            melhor_custo = custo_atual
+            T = T_inicial
+
+            num_iter = 0
+
+        # Com um único lote não há fronteira a deslocar
+        if len(plano_atual) < 2:
+            return melhor_plano.para_tuplas(), melhor_custo
+
+        if instrumentacao is not None:
+            self.instrumentar(instrumentacao)
+
+        # O relógio só é consultado a cada verificar_tempo_a_cada temperaturas
+        prazo = Prazo(temp_exec - decorrido, verificar_tempo_a_cada)
+        progresso.iniciar()
+        iter_inicial = num_iter
+        inicio_laco = time.perf_counter()
+        try:
+            while T > T_min and not prazo.esgotado():
+                for _ in range(iter_por_temp):
+
+                    num_iter += 1
+                
+                    index, fim = self.deslocamento(plano_atual)
+                    delta = self.delta_deslocamento(plano_atual, index, fim)
+
+                    if delta < 0 or random.random() < probabilidade_aceitacao(delta, T):
+                        self.aplicar_deslocamento(plano_atual, index, fim)
+                        custo_atual += delta
+
+                        if custo_atual < melhor_custo:
+                            melhor_plano = plano_atual.copia()
+                            melhor_custo = custo_atual
+
+                    if historico is not None:
+                        historico.registrar(custo_atual)
+
+                progresso.informar(num_iter, melhor_custo, temperatura=T)
+                T *= alpha
+
+                if checkpoint is not None:
+                    checkpoint.talvez_salvar(lambda: {
+                        "plano": plano_atual.copia().fins, "custo": custo_atual,
+                        "melhor_plano": melhor_plano.copia().fins, "melhor_custo": melhor_custo,
+                        "temperatura": T, "iteracoes": num_iter, "rng": random.getstate(),
+                        "tempo": decorrido + time.perf_counter() - inicio_laco,
+                    })
+
+            if checkpoint is not None:
+                checkpoint.finalizar()
+        finally:
+            # Desfaz os envoltórios mesmo se a busca for interrompida por uma exceção
+            if instrumentacao is not None:
+                self.fechar_instrumentacao(instrumentacao, num_iter - iter_inicial,
+                                           time.perf_counter() - inicio_laco)
+
+        progresso.finalizar(num_iter, melhor_custo, temperatura=T)
+        progresso.mensagem("Temperatura Final:", T)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+    def instrumentar(self, instrumentacao: Instrumentacao):
+        """Envolve os passos de cada iteração (ver instrumentacao.py); desfeito por fechar_instrumentacao"""
+        instrumentacao.envolver(self, "deslocamento", fase="movimento", contador="movimentos_propostos")
+        instrumentacao.envolver(self, "delta_deslocamento", fase="delta", inviavel="movimentos_inviaveis")
+        instrumentacao.envolver(self, "aplicar_deslocamento", fase="aplicacao", contador="movimentos_aceitos")
+        instrumentacao.envolver(self.problema, "custo", fase="motor_custo", contador="avaliacoes")
+        instrumentacao.observar_cache(self.problema.cache)
+        # Os tempos acumulam entre execuções com a mesma Instrumentacao; fechar_instrumentacao desconta estes
+        self._tempos_iniciais = dict(instrumentacao.tempos)
+
+    def fechar_instrumentacao(self, instrumentacao: Instrumentacao, num_iter: int, tempo_laco: float):
+        """num_iter e tempo_laco são os desta execução, mesmo retomada de um checkpoint"""
+        instrumentacao.restaurar()
+        contadores, tempos = instrumentacao.contadores, instrumentacao.tempos
+        contadores["iteracoes"] += num_iter
+        contadores["movimentos_rejeitados"] = contadores["movimentos_propostos"] - contadores["movimentos_aceitos"]
+
+        # O que sobra do laço é o teste de aceitação e a contabilidade (melhor plano, histórico, progresso)
+        tempos["laco"] += tempo_laco
+        instrumentacao.chamadas["laco"] += 1
+        inicial = self._tempos_iniciais
+        fases = sum(tempos[fase] - inicial.get(fase, 0.0) for fase in ("movimento", "delta", "aplicacao"))
+        tempos["aceitacao_e_registro"] += tempo_laco - fases
+
+    def temperatura_inicial(self, plano: Plano, aceitacao=0.8, amostras=200, rng=random) -> float:
+        """
+        Temperatura em que uma piora sorteada a partir do plano é aceita, em média, com probabilidade
+        `aceitacao`. Como os deltas variam em várias ordens de grandeza, a média de exp(-delta / T)
+        é resolvida por bisseção em escala logarítmica, em vez de usar a média dos deltas.
+        """
+        pioras = []
+        for _ in range(amostras):
+            delta = self.delta_deslocamento(plano, *self.deslocamento(plano, rng))
+            if 0 < delta < float('inf'):
+                pioras.append(delta)
+        if not pioras:
+            return 1.0
+
+        def taxa(T):
+            return sum(probabilidade_aceitacao(delta, T) for delta in pioras) / len(pioras)
+
+        log_min, log_max = math.log(min(pioras)) - 10, math.log(max(pioras)) + 10
+        for _ in range(60):
+            meio = (log_min + log_max) / 2
+            if taxa(math.exp(meio)) < aceitacao:
+                log_min = meio
+            else:
+                log_max = meio
+        return math.exp(log_max)
+
+    def simulated_annealing_adaptativo(self, temp_exec=60, alpha=0.99, iter_por_temp=500, aceitacao_inicial=0.8,
+                                       taxa_max=0.6, taxa_min=0.01, paciencia=20, max_reaquecimentos=5,
+                                       aceitacao_reaquecimento=0.3, historico: HistoricoCustos = None,
+                                       progresso: Progresso = None, verificar_tempo_a_cada=1,
+                                       plano_inicial: Plano = None):
+        """
+        Simulated Annealing com resfriamento adaptativo:
+
+        - A temperatura inicial é estimada a partir de deltas sorteados (ver temperatura_inicial).
+        - A cada iter_por_temp iterações é medida a taxa de aceitação das pioras. Acima de taxa_max o
+          plano está praticamente passeando ao acaso e a temperatura cai alpha ** 4; abaixo disso cai alpha.
+        - Reaquecimento: após `paciencia` temperaturas seguidas com taxa abaixo de taxa_min (ou ao
+          chegar a uma temperatura desprezível) sem melhorar o melhor custo, a busca volta ao melhor
+          plano, com a temperatura reestimada a partir dele para aceitar pioras com probabilidade
+          aceitacao_reaquecimento (nunca abaixo da temperatura em que ele foi encontrado).
+        - Parada antecipada: encerra após max_reaquecimentos reaquecimentos seguidos sem nenhuma melhora
+          (None desliga a parada antecipada e só o prazo encerra a busca).
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        if plano_inicial is not None:
+            plano_atual = plano_inicial.copia()
+        else:
+            plano_atual = ConstrutorPlano(self.problema).construir()
+        custo_atual = plano_atual.custo(self.problema)
+        progresso.mensagem("Custo inicial:", custo_atual)
+
+        melhor_plano, melhor_custo = plano_atual.copia(), custo_atual
+        if len(plano_atual) < 2:
+            return melhor_plano.para_tuplas(), melhor_custo
+
+        T = T_melhor = self.temperatura_inicial(plano_atual, aceitacao_inicial)
+        T_min = T * 1e-12
+        progresso.mensagem("Temperatura inicial:", T)
+
+        num_iter = 0
+        congeladas = 0
+        reaquecimentos = 0
+        sem_melhora = 0  # reaquecimentos seguidos sem melhora
+
+        prazo = Prazo(temp_exec, verificar_tempo_a_cada)
+        progresso.iniciar()
+        while (max_reaquecimentos is None or sem_melhora < max_reaquecimentos) and not prazo.esgotado():
+            pioras = aceitas = 0
+            melhorou = False
+            for _ in range(iter_por_temp):
+
+                num_iter += 1
+
+                index, fim = self.deslocamento(plano_atual)
+                delta = self.delta_deslocamento(plano_atual, index, fim)
+
+                if delta > 0:
+                    pioras += 1
+                if delta < 0 or random.random() < probabilidade_aceitacao(delta, T):
+                    self.aplicar_deslocamento(plano_atual, index, fim)
+                    custo_atual += delta
+                    if delta > 0:
+                        aceitas += 1
+
+                    if custo_atual < melhor_custo:
+                        melhor_plano = plano_atual.copia()
+                        melhor_custo = custo_atual
+                        T_melhor = T
+                        sem_melhora = 0
+                        melhorou = True
+
+                if historico is not None:
+                    historico.registrar(custo_atual)
+
+            taxa = aceitas / pioras if pioras else 0.0
+            congeladas = 0 if melhorou or taxa >= taxa_min else congeladas + 1
+            if congeladas >= paciencia or T < T_min:
+                plano_atual, custo_atual = melhor_plano.copia(), melhor_custo
+                # A temperatura do melhor plano costuma estar perto do congelamento: reaquecer só até
+                # ela quase não tira a busca do mesmo vale
+                T = max(T_melhor, self.temperatura_inicial(melhor_plano, aceitacao_reaquecimento))
+                congeladas = 0
+                reaquecimentos += 1
+                sem_melhora += 1
+            else:
+                T *= alpha ** 4 if taxa > taxa_max else alpha
+
+            progresso.informar(num_iter, melhor_custo, temperatura=T, aceitacao=round(taxa, 3))
+
+        progresso.finalizar(num_iter, melhor_custo, temperatura=T, reaquecimentos=reaquecimentos)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+    def simulated_annealing_lotes(self, K=256, estrategia="sequencial", T_inicial=10000, T_min=1e-6, alpha=0.99,
+                                  iter_por_temp=500, temp_exec=60, progresso: Progresso = None,
+                                  verificar_tempo_a_cada=1, plano_inicial: Plano = None):
+        """
+        Simulated Annealing com K deslocamentos propostos por passo, avaliados de uma vez com NumPy
+        (ver deslocamentoVetorizado.py). Requer o NumPy, importado só aqui.
+
+        - estrategia="sequencial": as propostas passam pelo teste de Metropolis na ordem em que foram
+          sorteadas. Uma proposta vizinha (index a uma posição ou menos) de outra já aceita no mesmo
+          passo é descartada, pois seu delta foi calculado sobre fronteiras que mudaram; as demais
+          continuam exatas.
+        - estrategia="melhor": só a proposta de menor delta passa pelo teste de Metropolis.
+
+        iter_por_temp conta propostas avaliadas, de modo que a temperatura cai no mesmo ritmo, por
+        avaliação, do simulated_annealing; com iter_por_temp menor que K, cada passo reduz a temperatura
+        por alpha ** (K / iter_por_temp). Os deltas são calculados em ponto flutuante (com as tabelas
+        do MotorCustoFloat); o custo devolvido é recalculado pelo motor do problema.
+        """
+        import numpy as np
+
+        from .deslocamentoVetorizado import DeslocamentosVetorizados
+
+        if estrategia not in ("sequencial", "melhor"):
+            raise ValueError(f"Estratégia desconhecida: {estrategia}")
+
+        progresso = progresso if progresso is not None else Progresso()
+        if plano_inicial is not None:
+            plano_atual = plano_inicial.copia()
+        else:
+            plano_atual = ConstrutorPlano(self.problema).construir()
+        custo_atual = plano_atual.custo(self.problema)
+        progresso.mensagem("Custo inicial:", custo_atual)
+        if len(plano_atual) < 2:
+            return plano_atual.para_tuplas(), custo_atual
+
+        deslocamentos = DeslocamentosVetorizados(self.problema, semente=random.getrandbits(64))
+        rng = deslocamentos.rng
+        fins = np.array(plano_atual.fins, dtype=np.int64)
+        melhor_fins, melhor_custo = fins.copy(), custo_atual
+        # Marca, dentro de um passo, as fronteiras já alteradas
+        alteradas = np.zeros(len(fins) + 1, dtype=bool)
+        passos_por_temp = max(1, iter_por_temp // K)
+        # Redução da temperatura a cada passos_por_temp passos: alpha por iter_por_temp propostas avaliadas
+        resfriamento = alpha ** (passos_por_temp * K / iter_por_temp)
+
+        num_iter = 0
+        T = T_inicial
+        prazo = Prazo(temp_exec, verificar_tempo_a_cada)
+        progresso.iniciar()
+        while T > T_min and not prazo.esgotado():
+            for _ in range(passos_por_temp):
+                indices, novos, deltas = deslocamentos.propor(fins, K)
+                num_iter += K
+
+                if estrategia == "melhor":
+                    k = int(np.argmin(deltas))
+                    delta = deltas[k]
+                    if delta < 0 or rng.random() < probabilidade_aceitacao(delta, T):
+                        fins[indices[k]] = novos[k]
+                        custo_atual += delta
+                else:
+                    # Teste de Metropolis de todas as propostas de uma vez; só as aceitas passam pelo laço
+                    with np.errstate(over="ignore", invalid="ignore"):
+                        aceitas = (deltas < 0) | (rng.random(K) < np.exp(-deltas / T))
+                    candidatas = np.flatnonzero(aceitas)
+                    if len(candidatas) == 0:
+                        continue
+                    for k in candidatas.tolist():
+                        index = indices[k]
+                        if alteradas[index] or alteradas[index - 1] or alteradas[index + 1]:
+                            continue
+                        alteradas[index] = True
+                        fins[index] = novos[k]
+                        custo_atual += deltas[k]
+                    alteradas[indices[candidatas]] = False
+
+                # O melhor plano é conferido ao fim de cada passo, não a cada proposta aceita
+                if custo_atual < melhor_custo:
+                    melhor_fins, melhor_custo = fins.copy(), custo_atual
+
+            progresso.informar(num_iter, melhor_custo, temperatura=T)
+            T *= resfriamento
+
+        melhor_plano = Plano(melhor_fins.tolist())
+        melhor_custo = melhor_plano.custo(self.problema)
+        progresso.finalizar(num_iter, melhor_custo, temperatura=T)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+    def simulated_annealing_paralelo(self, num_cadeias=4, T_inicial=10000, T_min=1e-6, alpha=0.99, iter_por_temp=500,
+                                     temp_exec=60, troca=True, semente=None, progresso: Progresso = None):
+        """
+        Executa num_cadeias cadeias de Simulated Annealing em processos separados, cada uma com seu
+        próprio gerador de números aleatórios, e devolve o melhor plano encontrado entre todas.
+
+        - troca=True: parallel tempering. As cadeias ficam em temperaturas fixas, em escala geométrica
+          de T_inicial até T_min, e a cada iter_por_temp iterações cadeias vizinhas tentam trocar de
+          estado pelo critério de Metropolis.
+        - troca=False: multi-start. Cada cadeia é um Simulated Annealing independente, resfriado por
+          alpha a cada iter_por_temp iterações até T_min.
+        """
+        # O multiprocessing só é carregado por quem usa as cadeias paralelas
+        from concurrent.futures import ProcessPoolExecutor
+
+        progresso = progresso if progresso is not None else Progresso()
+        construtor = ConstrutorPlano(self.problema)
+        plano_guloso = construtor.construir()
+        custo_guloso = plano_guloso.custo(self.problema)
+        progresso.mensagem("Custo guloso:", custo_guloso)
+        if len(plano_guloso) < 2:
+            return plano_guloso.para_tuplas(), custo_guloso
+
+        rng = random.Random(semente)
+        if troca and num_cadeias > 1:
+            razao = (T_min / T_inicial) ** (1 / (num_cadeias - 1))
+            temperaturas = [T_inicial * razao ** k for k in range(num_cadeias)]
+        else:
+            temperaturas = [T_inicial] * num_cadeias
+
+        # Estado de cada cadeia: (plano, custo, estado do gerador)
+        estados = [(plano_guloso.copia(), custo_guloso, random.Random(rng.getrandbits(64)).getstate())
+                   for _ in range(num_cadeias)]
+        melhor_plano, melhor_custo = plano_guloso, custo_guloso
+
+        num_iter = 0
+        num_trocas = 0
+        rodada = 0
+        prazo = Prazo(temp_exec)
+        progresso.iniciar()
+        with ProcessPoolExecutor(max_workers=num_cadeias, initializer=_iniciar_trabalhador,
+                                 initargs=(self.problema,)) as executor:
+            while (troca or temperaturas[0] > T_min) and not prazo.esgotado():
+                futuros = [executor.submit(_executar_cadeia, plano, custo, T, iter_por_temp, estado)
+                           for (plano, custo, estado), T in zip(estados, temperaturas)]
+
+                estados = []
+                for futuro in futuros:
+                    plano, custo, melhor_plano_cadeia, melhor_custo_cadeia, estado = futuro.result()
+                    estados.append((plano, custo, estado))
+                    if melhor_custo_cadeia < melhor_custo:
+                        melhor_plano, melhor_custo = melhor_plano_cadeia, melhor_custo_cadeia
+                num_iter += iter_por_temp * num_cadeias
+                rodada += 1
+
+                if troca:
+                    # Alterna entre os pares (0,1), (2,3)... e (1,2), (3,4)...
+                    for k in range(rodada % 2, num_cadeias - 1, 2):
+                        custo_k, custo_prox = estados[k][1], estados[k+1][1]
+                        diferenca = 1 / temperaturas[k+1] - 1 / temperaturas[k]
+                        T_troca = 1 / diferenca if diferenca > 0 else float('inf')
+                        if custo_k <= custo_prox or rng.random() < probabilidade_aceitacao(custo_k - custo_prox, T_troca):
+                            estados[k], estados[k+1] = estados[k+1], estados[k]
+                            num_trocas += 1
+                else:
+                    temperaturas = [T * alpha for T in temperaturas]
+
+                progresso.informar(num_iter, melhor_custo, trocas=num_trocas)
+
+        progresso.finalizar(num_iter, melhor_custo, trocas=num_trocas)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        if troca:
+            progresso.mensagem("Numero de trocas:", num_trocas)
+        return melhor_plano.para_tuplas(), melhor_custo
+
+
+_otimizador_trabalhador = None
+
+
+def _iniciar_trabalhador(problema: ProblemaLote):
+    """Monta o otimizador uma única vez em cada processo do pool"""
+    global _otimizador_trabalhador
+    _otimizador_trabalhador = OtimizadorPlano(problema)
+
+
+def _executar_cadeia(plano, custo, T, iteracoes, estado_rng):
+    rng = random.Random()
+    rng.setstate(estado_rng)
+    resultado = _otimizador_trabalhador.cadeia(plano, custo, T, iteracoes, rng)
+    return resultado + (rng.getstate(),)
+
+# Exemplo de uso
+if __name__ == "__main__":
+    random.seed(42)
+    demanda = [ random.randint(1, 50) for _ in range(100) ]
+
+    
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+    otimizador = OtimizadorPlano(problema)
+
+    t0 = time.time()
+    melhor_plano, custo_total = otimizador.simulated_annealing(
+        T_inicial=10000,
+        T_min=1e-6, 
+        alpha=0.999, 
+        iter_por_temp=100, 
+        temp_exec=60
+    )
+
+    print("Melhor plano:", melhor_plano)
+    print("Custo total:", custo_total)
+    print("Tempo de execução:", round(time.time() - t0, 6))
@@ -0,0 +1,18 @@
+"""
+Metaheurísticas para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+============================================================================
+
+Descrição:
+----------
+Pacote com os otimizadores e as ferramentas do PDLC, um módulo por assunto:
+
+- PDLC, motorCusto, plano, movimento: a instância, o motor de custos, a representação dos planos
+  e a vizinhança de movimentos;
+- SimulatedAnnealing, BuscaTabu, ParticleSwarm, Grasp, enxameIlhas, horizonteRolante,
+  algoritmoConstrutivo, silverMeal: os otimizadores;
+- benchmark, resolverInstancias, instanciaBinaria, linhaComando: benchmark, resolução em massa,
+  formato binário de instâncias e a linha de comando `pdlc`.
+
+Importar o pacote não importa nenhum dos módulos: cada um é carregado só por quem o usa
+(`from pdlc.SimulatedAnnealing import OtimizadorPlano`).
+"""
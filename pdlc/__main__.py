@@ -0,0 +1,7 @@
+"""python -m pdlc: a mesma linha de comando do script `pdlc` (ver linhaComando.py)"""
+
+import sys
+
+from .linhaComando import main
+
+sys.exit(main())
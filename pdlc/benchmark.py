@@ -0,0 +1,323 @@
+"""
+Benchmark dos Algoritmos para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+======================================================================================
+
+Descrição:
+----------
+Gera famílias de instâncias reproduzíveis (semente fixa por instância), variando o tamanho do
+horizonte, a variância da demanda, o aperto da capacidade e a razão entre custo fixo e custo de
+estoque, e executa sobre elas o guloso construtivo, o Silver-Meal, o Simulated Annealing, a
+Busca Tabu, o Particle Swarm e as soluções exatas. Para cada execução registra o custo, o gap de otimalidade,
+o tempo até a solução, iterações e avaliações por segundo e o pico de memória (tracemalloc),
+gravando uma linha JSON por execução.
+
+Cada algoritmo otimiza o modelo de custo do seu próprio módulo, por isso o gap é sempre medido
+contra a solução exata do mesmo modelo:
+
+- exponencial: ProblemaLote de SimulatedAnnealing.py (guloso, sa, sa_adaptativo, sa_lotes, grasp, tabu, exato)
+- linear: ProblemaLote de ParticleSwarm.py (guloso, pso, pso_ilhas, exato)
+- silver_meal: funções de silverMeal.py (silver_meal, wagner_whitin)
+
+Com a medição de memória ligada os tempos incluem o custo do tracemalloc; para comparar
+apenas tempos use --sem-memoria.
+
+Uso:
+----
+    python -m pdlc.benchmark --horizontes 50 200 1000 --tempo 5 --saida resultados.jsonl
+    pdlc bench --horizontes 50 200 1000 --tempo 5 --saida resultados.jsonl
+"""
+
+import argparse
+import importlib.util
+import itertools
+import json
+import math
+import os
+import random
+import time
+import tracemalloc
+
+from . import BuscaTabu
+from . import enxameIlhas
+from . import Grasp
+from . import ParticleSwarm
+from . import silverMeal
+from . import SimulatedAnnealing
+from .progresso import Progresso
+
+
+def gerar_instancia(horizonte: int, variancia: float, aperto: float, razao_custos: float, repeticao: int = 0,
+                    semente: int = 0, demanda_media: int = 25, custo_estoque: int = 2) -> dict:
+    """
+    Instância da família (horizonte, variancia, aperto, razao_custos). A semente é derivada dos
+    parâmetros, então a mesma instância é gerada independentemente das outras famílias pedidas.
+
+    - variancia: amplitude da demanda em torno da média, como fração da média
+    - aperto: capacidade em múltiplos da demanda média (nunca abaixo da maior demanda)
+    - razao_custos: custo fixo dividido pelo custo de estoque de uma demanda média
+    """
+    familia = {"horizonte": horizonte, "variancia": variancia, "aperto": aperto, "razao_custos": razao_custos,
+               "repeticao": repeticao}
+    rng = random.Random(f"{semente}-{horizonte}-{variancia}-{aperto}-{razao_custos}-{repeticao}")
+
+    amplitude = round(variancia * demanda_media)
+    demanda = [rng.randint(max(0, demanda_media - amplitude), demanda_media + amplitude) for _ in range(horizonte)]
+    return {
+        "familia": familia,
+        "semente": semente,
+        "demanda": demanda,
+        "custo_fixo": round(razao_custos * custo_estoque * demanda_media),
+        "custo_estoque": custo_estoque,
+        "capacidade": max(max(demanda), round(aperto * demanda_media)),
+    }
+
+
+def gerar_familias(horizontes, variancias, apertos, razoes, repeticoes=1, semente=0):
+    for horizonte, variancia, aperto, razao, repeticao in itertools.product(horizontes, variancias, apertos, razoes,
+                                                                            range(repeticoes)):
+        yield gerar_instancia(horizonte, variancia, aperto, razao, repeticao, semente)
+
+
+def _parametros(instancia: dict) -> tuple:
+    return instancia["demanda"], instancia["custo_fixo"], instancia["custo_estoque"], instancia["capacidade"]
+
+
+def _tempo_ate_melhor(eventos: list[dict], custo: float):
+    for evento in eventos:
+        if evento["melhor_custo"] <= custo:
+            return evento["tempo"]
+    return None
+
+
+def executar_guloso(modulo, instancia: dict, **_) -> dict:
+    problema = modulo.ProblemaLote(*_parametros(instancia))
+    plano = modulo.ConstrutorPlano(problema).construcao_gulosa()
+    return {"custo": problema.custo_total_plano(plano)}
+
+
+def executar_exato(modulo, instancia: dict, **_) -> dict:
+    _, custo = modulo.ProblemaLote(*_parametros(instancia)).motor.plano_otimo()
+    return {"custo": custo}
+
+
+def executar_sa(instancia: dict, tempo: float, semente: int, **_) -> dict:
+    random.seed(semente)
+    problema = SimulatedAnnealing.ProblemaLote(*_parametros(instancia))
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = SimulatedAnnealing.OtimizadorPlano(problema).simulated_annealing(
+        T_inicial=10000, T_min=1e-6, alpha=0.999, iter_por_temp=100, temp_exec=tempo, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_sa_adaptativo(instancia: dict, tempo: float, semente: int, **_) -> dict:
+    random.seed(semente)
+    problema = SimulatedAnnealing.ProblemaLote(*_parametros(instancia))
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = SimulatedAnnealing.OtimizadorPlano(problema).simulated_annealing_adaptativo(
+        temp_exec=tempo, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_sa_lotes(instancia: dict, tempo: float, semente: int, **_) -> dict:
+    random.seed(semente)
+    problema = SimulatedAnnealing.ProblemaLote(*_parametros(instancia))
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = SimulatedAnnealing.OtimizadorPlano(problema).simulated_annealing_lotes(
+        K=256, T_inicial=10000, T_min=1e-6, alpha=0.999, iter_por_temp=100, temp_exec=tempo, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_grasp(instancia: dict, tempo: float, semente: int, **_) -> dict:
+    problema = SimulatedAnnealing.ProblemaLote(*_parametros(instancia))
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = Grasp.OtimizadorPlano(problema).grasp(temp_exec=tempo, semente=semente, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_tabu(instancia: dict, tempo: float, semente: int, **_) -> dict:
+    random.seed(semente)
+    problema = BuscaTabu.ProblemaLote(*_parametros(instancia))
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = BuscaTabu.OtimizadorPlano(problema).busca_tabu(temp_exec=tempo, progresso=progresso)
+
+    final = eventos[-1]
+    return {"custo": custo, "iteracoes": final["iteracoes"], "avaliacoes": final["avaliacoes"],
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_pso(instancia: dict, tempo: float, semente: int, num_particulas: int = 100, **_) -> dict:
+    random.seed(semente)
+    problema = ParticleSwarm.ProblemaLote(*_parametros(instancia))
+    vetorizado = importlib.util.find_spec("numpy") is not None
+    otimizador = ParticleSwarm.OtimizadorPlano(problema, num_particulas, vetorizado=vetorizado)
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = otimizador.PSO(temp_exec=tempo, w=0.8, c1=1.7, c2=1.2, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes * num_particulas,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_pso_ilhas(instancia: dict, tempo: float, semente: int, num_particulas: int = 100, **_) -> dict:
+    """PSO em ilhas, uma por CPU, com as num_particulas divididas entre elas"""
+    random.seed(semente)
+    problema = ParticleSwarm.ProblemaLote(*_parametros(instancia))
+    vetorizado = importlib.util.find_spec("numpy") is not None
+    num_ilhas = os.cpu_count() or 1
+    otimizador = enxameIlhas.OtimizadorPlano(problema, num_ilhas, max(1, num_particulas // num_ilhas),
+                                             vetorizado=vetorizado)
+    eventos = []
+    progresso = Progresso(a_cada_ms=50, silencioso=True, callback=eventos.append)
+    _, custo = otimizador.PSO(temp_exec=tempo, w=0.8, c1=1.7, c2=1.2, semente=semente, progresso=progresso)
+
+    iteracoes = eventos[-1]["iteracoes"]
+    return {"custo": custo, "iteracoes": iteracoes, "avaliacoes": iteracoes * otimizador.particulas_por_ilha,
+            "tempo_ate_melhor": _tempo_ate_melhor(eventos, custo)}
+
+
+def executar_silver_meal(instancia: dict, **_) -> dict:
+    demanda, custo_fixo, custo_estoque, capacidade = _parametros(instancia)
+    _, custo = silverMeal.silver_meal(demanda, capacidade, custo_fixo, custo_estoque)
+    return {"custo": custo}
+
+
+def executar_wagner_whitin(instancia: dict, **_) -> dict:
+    demanda, custo_fixo, custo_estoque, capacidade = _parametros(instancia)
+    _, custo = silverMeal.wagner_whitin(demanda, capacidade, custo_fixo, custo_estoque)
+    return {"custo": custo}
+
+
+# modelo -> (algoritmo exato de referência, {algoritmo: função})
+MODELOS = {
+    "exponencial": ("exato", {
+        "exato": lambda instancia, **kw: executar_exato(SimulatedAnnealing, instancia),
+        "guloso": lambda instancia, **kw: executar_guloso(SimulatedAnnealing, instancia),
+        "sa": executar_sa,
+        "sa_adaptativo": executar_sa_adaptativo,
+        # sa_lotes usa o mesmo resfriamento por proposta avaliada do sa (alpha=0.999 a cada 100)
+        "sa_lotes": executar_sa_lotes,
+        "grasp": executar_grasp,
+        "tabu": executar_tabu,
+    }),
+    "linear": ("exato", {
+        "exato": lambda instancia, **kw: executar_exato(ParticleSwarm, instancia),
+        "guloso": lambda instancia, **kw: executar_guloso(ParticleSwarm, instancia),
+        "pso": executar_pso,
+        "pso_ilhas": executar_pso_ilhas,
+    }),
+    "silver_meal": ("wagner_whitin", {
+        "wagner_whitin": executar_wagner_whitin,
+        "silver_meal": executar_silver_meal,
+    }),
+}
+
+
+def medir(funcao, medir_memoria: bool = True, **kwargs) -> dict:
+    if medir_memoria:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        resultado = funcao(**kwargs)
+    except Exception as erro:
+        resultado = {"erro": f"{type(erro).__name__}: {erro}"}
+    resultado["tempo"] = time.perf_counter() - t0
+    resultado["memoria_pico"] = None
+    if medir_memoria:
+        resultado["memoria_pico"] = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+    return resultado
+
+
+def _numero(valor):
+    """Custos infinitos viram null no JSON"""
+    return None if isinstance(valor, float) and math.isinf(valor) else valor
+
+
+def executar_benchmark(instancias, algoritmos=None, tempo: float = 5, semente: int = 0, medir_memoria: bool = True):
+    """Gera um registro por (instância, algoritmo); `algoritmos` filtra por nome, como "sa" ou "guloso" """
+    for instancia in instancias:
+        for modelo, (referencia, funcoes) in MODELOS.items():
+            otimo = None
+            for algoritmo, funcao in funcoes.items():
+                if algoritmos and algoritmo not in algoritmos and algoritmo != referencia:
+                    continue
+
+                resultado = medir(funcao, medir_memoria, instancia=instancia, tempo=tempo, semente=semente)
+                custo = resultado.get("custo")
+                if algoritmo == referencia:
+                    otimo = custo
+                    if algoritmos and algoritmo not in algoritmos:
+                        continue
+
+                gap = None
+                if custo is not None and otimo not in (None, 0, float('inf')) and custo != float('inf'):
+                    gap = (custo - otimo) / otimo
+
+                tempo_ate_melhor = resultado.get("tempo_ate_melhor") or resultado["tempo"]
+                iteracoes = resultado.get("iteracoes")
+                yield {
+                    **instancia["familia"],
+                    "semente": instancia["semente"],
+                    "modelo": modelo,
+                    "algoritmo": algoritmo,
+                    "custo": _numero(custo),
+                    "otimo": _numero(otimo),
+                    "gap": gap,
+                    "tempo": resultado["tempo"],
+                    "tempo_ate_melhor": tempo_ate_melhor,
+                    "iteracoes": iteracoes,
+                    "iter_por_seg": iteracoes / resultado["tempo"] if iteracoes else None,
+                    "avaliacoes_por_seg": resultado["avaliacoes"] / resultado["tempo"] if iteracoes else None,
+                    "memoria_pico": resultado["memoria_pico"],
+                    "erro": resultado.get("erro"),
+                }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark dos algoritmos para o PDLC")
+    parser.add_argument("--horizontes", type=int, nargs="+", default=[50, 200])
+    parser.add_argument("--variancias", type=float, nargs="+", default=[0.2, 0.8])
+    parser.add_argument("--apertos", type=float, nargs="+", default=[3, 10])
+    parser.add_argument("--razoes", type=float, nargs="+", default=[2, 10])
+    parser.add_argument("--repeticoes", type=int, default=1)
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--tempo", type=float, default=5, help="orçamento em segundos do SA e do PSO")
+    parser.add_argument("--algoritmos", nargs="+", default=None,
+                        help="exato, guloso, sa, sa_adaptativo, sa_lotes, grasp, tabu, pso, pso_ilhas, silver_meal, wagner_whitin (padrão: todos)")
+    parser.add_argument("--sem-memoria", action="store_true", help="não mede o pico de memória")
+    parser.add_argument("--saida", default="resultados_benchmark.jsonl")
+    args = parser.parse_args(argv)
+
+    instancias = gerar_familias(args.horizontes, args.variancias, args.apertos, args.razoes, args.repeticoes,
+                                args.semente)
+    with open(args.saida, "w") as saida:
+        for registro in executar_benchmark(instancias, args.algoritmos, args.tempo, args.semente,
+                                           not args.sem_memoria):
+            saida.write(json.dumps(registro) + "\n")
+            saida.flush()
+            gap = "-" if registro["gap"] is None else f"{registro['gap']:.2%}"
+            print(f"T={registro['horizonte']:<6} var={registro['variancia']:<4} aperto={registro['aperto']:<4} "
+                  f"razao={registro['razao_custos']:<4} {registro['modelo']:<12} {registro['algoritmo']:<14} "
+                  f"gap={gap:<8} tempo={registro['tempo']:.4f}s", registro["erro"] or "")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,94 @@
+"""
+Checkpoints das Execuções Longas do Simulated Annealing e do Particle Swarm
+==========================================================================
+
+Descrição:
+----------
+Permite retomar uma execução interrompida (processo morto, máquina preemptível) exatamente do
+ponto em que o último checkpoint foi gravado.
+
+Os otimizadores chamam Checkpoint.talvez_salvar nos pontos naturais de verificação (a cada
+temperatura no Simulated Annealing, a cada varredura do enxame no Particle Swarm). Só quando
+passam `a_cada_s` segundos desde a última gravação o estado é montado, no próprio laço, como
+um retrato: planos copiados por copy-on-write, matrizes do enxame copiadas e o estado dos
+geradores de números aleatórios. A serialização e a escrita no disco ficam em uma thread
+separada, sem parar a busca.
+
+O arquivo é binário (pickle, com os planos em array('l') e as matrizes NumPy em bytes crus) e é
+trocado de forma atômica: a gravação vai para um arquivo temporário, que só substitui o anterior
+depois de completo, de modo que uma interrupção no meio da escrita mantém o checkpoint anterior.
+
+Um erro na gravação (disco cheio, permissão) não se perde na thread: é relançado pela próxima
+chamada a salvar() ou finalizar(), e portanto pelo otimizador, que chama finalizar() ao terminar.
+
+Uso:
+----
+    checkpoint = Checkpoint("sa.ckpt", a_cada_s=60)
+    otimizador.simulated_annealing(..., checkpoint=checkpoint)
+
+    # depois da interrupção, no novo processo:
+    otimizador.simulated_annealing(..., checkpoint=checkpoint, retomar=Checkpoint.carregar("sa.ckpt"))
+"""
+
+import os
+import threading
+import time
+
+VERSAO = 1
+
+
+class Checkpoint:
+    def __init__(self, arquivo: str, a_cada_s: float = 60):
+        self.arquivo = arquivo
+        self.a_cada_s = a_cada_s
+        self.proximo = time.monotonic() + a_cada_s
+        self.gravados = 0
+        self._escritor = None
+        self._erro = None
+
+    def talvez_salvar(self, montar_estado):
+        """Grava o estado devolvido por montar_estado() se o intervalo já passou"""
+        if time.monotonic() >= self.proximo:
+            self.salvar(montar_estado())
+
+    def salvar(self, estado: dict):
+        # Uma gravação por vez, na ordem em que foram pedidas
+        self.finalizar()
+        self._escritor = threading.Thread(target=self._gravar, args=(estado,))
+        self._escritor.start()
+        self.proximo = time.monotonic() + self.a_cada_s
+
+    def _gravar(self, estado: dict):
+        import pickle
+
+        try:
+            dados = pickle.dumps({"versao": VERSAO, **estado}, protocol=pickle.HIGHEST_PROTOCOL)
+            temporario = self.arquivo + ".tmp"
+            with open(temporario, "wb") as saida:
+                saida.write(dados)
+                saida.flush()
+                os.fsync(saida.fileno())
+            os.replace(temporario, self.arquivo)
+            self.gravados += 1
+        except Exception as erro:
+            # Guardado para finalizar(): uma exceção na thread só chegaria ao threading.excepthook
+            self._erro = erro
+
+    def finalizar(self):
+        """Espera a gravação em andamento terminar e relança o erro dela, se houver"""
+        if self._escritor is not None:
+            self._escritor.join()
+            self._escritor = None
+        if self._erro is not None:
+            erro, self._erro = self._erro, None
+            raise erro
+
+    @staticmethod
+    def carregar(arquivo: str) -> dict:
+        import pickle
+
+        with open(arquivo, "rb") as entrada:
+            estado = pickle.load(entrada)
+        if estado.get("versao") != VERSAO:
+            raise ValueError(f"Checkpoint com versão {estado.get('versao')} não suportada (esperada {VERSAO})")
+        return estado
@@ -0,0 +1,88 @@
+"""
+Deslocamentos Vetorizados para o Simulated Annealing do PDLC
+============================================================
+
+Descrição:
+----------
+Sorteia K deslocamentos de fronteira de uma vez e calcula o delta de custo de todos eles em
+poucas operações NumPy, em vez de um deslocamento por vez em Python. O custo dos lotes usa as
+tabelas do MotorCustoFloat (soma de prefixo normalizada, potências e último período com demanda
+positiva), copiadas para vetores float64, com a mesma saturação em infinito acima do limite.
+
+O plano de trabalho fica em um vetor int64 com os fins dos lotes; deslocamentos não mudam o
+número de lotes, então o vetor tem tamanho fixo durante a busca.
+
+Depende do NumPy, que só é importado quando o modo em lote é usado.
+"""
+
+import numpy as np
+
+from .motorCusto import MotorCustoFloat
+
+
+class DeslocamentosVetorizados:
+    def __init__(self, problema, semente: int = None):
+        motor = problema.motor
+        if not isinstance(motor, MotorCustoFloat):
+            motor = MotorCustoFloat(problema.demanda, problema.custo_fixo, problema.custo_estoque, problema.capacidade,
+                                   compacto=motor.compacto)
+
+        h = motor.custo_estoque
+        if not (motor.crescente or h == 0 or h == 1):
+            raise ValueError("O modo em lote requer custo_estoque > 1, 0 ou 1")
+
+        self.rng = np.random.default_rng(semente)
+        self.n = motor.n
+        self.custo_fixo = float(motor.custo_fixo)
+        self.capacidade = motor.capacidade
+        self.crescente = motor.crescente
+        self.custo_estoque = h
+        self.demanda_acumulada = np.array(motor.demanda_acumulada, dtype=np.int64)
+        if self.crescente:
+            self.limite = motor.limite
+            self.max_expoente = len(motor.potencias) - 2
+            self.potencias = np.array(motor.potencias)
+            self.inversas = np.array(motor.inversas)
+            self.normalizada = np.array(motor.normalizada)
+            self.ultimo_positivo = np.array(motor.ultimo_positivo, dtype=np.int64)
+
+    def custos(self, inicios: np.ndarray, fins: np.ndarray) -> np.ndarray:
+        """Custo dos lotes (inicios, fins) elemento a elemento, com inicio <= fim < n"""
+        acumulada = self.demanda_acumulada
+        carregada = acumulada[fins + 1] - acumulada[inicios + 1]
+
+        if not self.crescente:
+            custos = np.full(len(inicios), self.custo_fixo)
+            if self.custo_estoque == 1:
+                custos += carregada
+        else:
+            # Só até a última demanda positiva do lote os termos contam
+            u = self.ultimo_positivo[fins + 1]
+            m = u - inicios
+            m_valido = np.minimum(np.maximum(m, 0), self.max_expoente)
+            ponderada = self.potencias[m_valido + 1] * (
+                self.normalizada[u + 1] - self.normalizada[inicios + 1] * self.inversas[m_valido])
+            custos = self.custo_fixo + np.where(m > 0, ponderada, 0.0)
+            custos[(m > self.max_expoente) | (custos > self.limite)] = np.inf
+
+        custos[carregada > self.capacidade] = np.inf
+        return custos
+
+    def propor(self, fins: np.ndarray, K: int) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sorteia K deslocamentos da fronteira entre os lotes index e index+1, como
+        OtimizadorPlano.deslocamento, e devolve (indices, novos fins, deltas).
+        """
+        indices = self.rng.integers(0, len(fins) - 1, K)
+        inicios = np.where(indices > 0, fins[indices - 1] + 1, 0)
+        fins_atuais, fins_proximos = fins[indices], fins[indices + 1]
+        novos = self.rng.integers(inicios, fins_proximos)
+
+        # Os quatro lotes de cada proposta (dois antigos, dois novos) em uma única avaliação
+        custos = self.custos(np.concatenate((inicios, fins_atuais + 1, inicios, novos + 1)),
+                             np.concatenate((fins_atuais, fins_proximos, novos, fins_proximos))).reshape(4, K)
+        with np.errstate(invalid="ignore"):
+            deltas = (custos[2] + custos[3]) - (custos[0] + custos[1])
+        # Dois lotes inviáveis dão inf - inf: a proposta continua inviável
+        deltas[np.isnan(deltas)] = np.inf
+        return indices, novos, deltas
@@ -0,0 +1,320 @@
+"""
+Particle Swarm em Ilhas para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+====================================================================================
+
+Descrição:
+----------
+Modelo de ilhas do Particle Swarm: `num_ilhas` sub-enxames (o OtimizadorPlano de
+ParticleSwarm.py, vetorizado ou não) rodam cada um em um processo e trocam as suas melhores
+posições por um quadro em memória compartilhada (multiprocessing.shared_memory), sem serializar
+nada entre os processos durante a busca.
+
+O quadro tem uma faixa de float64 por ilha: versão, custo, iterações e a melhor posição da ilha.
+A cada `intervalo_migracao` varreduras a ilha publica a sua melhor posição na própria faixa e lê
+as faixas das vizinhas; se a melhor vizinha for melhor que o seu melhor global, ela substitui a
+pior partícula da ilha e passa a guiar o enxame. Nenhuma ilha espera pelas outras: a leitura é
+feita com o que estiver publicado no momento, e a versão (ímpar durante a escrita) descarta as
+faixas lidas no meio de uma publicação.
+
+Dentro da ilha o PSO também é assíncrono: no modo não vetorizado cada partícula atualiza o
+melhor global assim que melhora, e as seguintes da mesma varredura já são guiadas por ele, em vez
+de uma varredura completa seguida da busca pelo melhor entre todas as partículas.
+
+Topologias de migração (com quem cada ilha troca posições):
+- "anel": as ilhas anterior e seguinte;
+- "von_neumann": as quatro vizinhas em uma grade toroidal (a mais quadrada que divide num_ilhas);
+- "global": todas as outras ilhas.
+
+Usa o mesmo ProblemaLote (custo de estoque linear) do Particle Swarm.
+"""
+
+import math
+import os
+import random
+from array import array
+
+from .ParticleSwarm import OtimizadorPlano as OtimizadorEnxame
+from .ParticleSwarm import ProblemaLote
+from .PDLC import ConstrutorPlano
+from .plano import Plano
+from .progresso import Progresso, Prazo
+
+
+def vizinhos_anel(indice: int, num_ilhas: int) -> list[int]:
+    return sorted({(indice - 1) % num_ilhas, (indice + 1) % num_ilhas} - {indice})
+
+
+def grade(num_ilhas: int) -> tuple[int, int]:
+    """(linhas, colunas) da grade mais quadrada com num_ilhas ilhas; com um número primo a grade é uma linha só"""
+    linhas = max(d for d in range(1, math.isqrt(num_ilhas) + 1) if num_ilhas % d == 0)
+    return linhas, num_ilhas // linhas
+
+
+def vizinhos_von_neumann(indice: int, num_ilhas: int) -> list[int]:
+    linhas, colunas = grade(num_ilhas)
+    linha, coluna = divmod(indice, colunas)
+    vizinhos = {((linha - 1) % linhas) * colunas + coluna, ((linha + 1) % linhas) * colunas + coluna,
+                linha * colunas + (coluna - 1) % colunas, linha * colunas + (coluna + 1) % colunas}
+    return sorted(vizinhos - {indice})
+
+
+def vizinhos_global(indice: int, num_ilhas: int) -> list[int]:
+    return [outra for outra in range(num_ilhas) if outra != indice]
+
+
+TOPOLOGIAS = {
+    "anel": vizinhos_anel,
+    "von_neumann": vizinhos_von_neumann,
+    "global": vizinhos_global,
+}
+
+
+class QuadroMigracao:
+    """
+    Melhores posições das ilhas em memória compartilhada. Criado pelo processo principal (nome=None)
+    e aberto pelo nome em cada ilha; só quem criou remove a memória (fechar(remover=True)).
+    """
+
+    CAMPOS = 3  # versão, custo, iterações; a posição vem em seguida
+
+    def __init__(self, num_ilhas: int, dimensao: int, nome: str = None):
+        # Import tardio: só o modelo de ilhas usa memória compartilhada
+        from multiprocessing import shared_memory
+
+        self.num_ilhas = num_ilhas
+        self.dimensao = dimensao
+        self.faixa = self.CAMPOS + dimensao
+        tamanho = 8 * num_ilhas * self.faixa
+        criar = nome is None
+        self.memoria = shared_memory.SharedMemory(name=nome, create=criar, size=tamanho if criar else 0)
+        self.nome = self.memoria.name
+        self._bytes = self.memoria.buf[:tamanho]
+        self.valores = self._bytes.cast('d')
+        if criar:
+            for ilha in range(num_ilhas):
+                inicio = ilha * self.faixa
+                self.valores[inicio:inicio + self.CAMPOS] = array('d', [0, float('inf'), 0])
+
+    def publicar(self, ilha: int, custo: float, num_iter: int, pos):
+        """Grava a melhor posição da ilha; só a própria ilha escreve na sua faixa"""
+        valores, inicio = self.valores, ilha * self.faixa
+        versao = valores[inicio]
+        valores[inicio] = versao + 1  # ímpar: escrita em andamento
+        valores[inicio + 1] = custo
+        valores[inicio + 2] = num_iter
+        valores[inicio + self.CAMPOS:inicio + self.faixa] = array('d', pos)
+        valores[inicio] = versao + 2
+
+    def ler(self, ilha: int, tentativas: int = 4):
+        """
+        (custo, iterações, posição) publicados pela ilha, ou None se ela ainda não publicou ou se
+        todas as tentativas cruzaram com uma escrita (a leitura nunca espera pela outra ilha)
+        """
+        valores, inicio = self.valores, ilha * self.faixa
+        for _ in range(tentativas):
+            versao = valores[inicio]
+            if versao % 2:
+                continue
+            custo, num_iter = valores[inicio + 1], valores[inicio + 2]
+            pos = valores[inicio + self.CAMPOS:inicio + self.faixa].tolist()
+            if valores[inicio] == versao:
+                return (custo, int(num_iter), pos) if versao else None
+        return None
+
+    def resumo(self) -> tuple[float, int]:
+        """Melhor custo publicado e total de iterações das ilhas, lidos sem consistência entre as faixas"""
+        valores, faixa = self.valores, self.faixa
+        custos = [valores[ilha * faixa + 1] for ilha in range(self.num_ilhas)]
+        iteracoes = [valores[ilha * faixa + 2] for ilha in range(self.num_ilhas)]
+        return min(custos), int(sum(iteracoes))
+
+    def fechar(self, remover: bool = False):
+        self.valores.release()
+        self._bytes.release()
+        self.memoria.close()
+        if remover:
+            self.memoria.unlink()
+
+
+class Ilha:
+    """Um sub-enxame do modelo de ilhas: varreduras assíncronas e troca de posições pelo quadro"""
+
+    def __init__(self, indice: int, enxame: OtimizadorEnxame, quadro: QuadroMigracao, vizinhos: list[int]):
+        self.indice = indice
+        self.enxame = enxame
+        self.quadro = quadro
+        self.vizinhos = vizinhos
+        self.publicado = float('inf')
+        self.imigrantes = 0
+
+    def varrer(self, w: float, c1: float, c2: float):
+        enxame = self.enxame
+        if enxame.enxame is not None:
+            enxame.enxame.atualizar(w, c1, c2, enxame.melhor_global_pos)
+            enxame.atualizar_melhor_global()
+            return
+
+        # As partículas seguintes da varredura já são guiadas pelo novo melhor global
+        for particula in enxame.particulas:
+            particula.atualizar(w, c1, c2, enxame.melhor_global_pos, enxame.melhor_global_custo)
+            if particula.custo_melhor_local < enxame.melhor_global_custo:
+                enxame.melhor_global_custo = particula.custo_melhor_local
+                enxame.melhor_global_pos = particula.melhor_local.copy()
+                enxame.melhor_global = particula.get_plano()
+
+    def publicar(self, num_iter: int):
+        custo = self.enxame.melhor_global_custo
+        if custo < self.publicado:
+            self.quadro.publicar(self.indice, custo, num_iter, self.enxame.melhor_global_pos)
+            self.publicado = custo
+
+    def migrar(self, num_iter: int):
+        """Publica o melhor da ilha e recebe o melhor das vizinhas, se ele for melhor"""
+        self.publicar(num_iter)
+        lidos = [self.quadro.ler(vizinha) for vizinha in self.vizinhos]
+        lidos = [lido for lido in lidos if lido is not None]
+        if not lidos:
+            return
+        custo, _, pos = min(lidos, key=lambda lido: lido[0])
+        if custo < self.enxame.melhor_global_custo:
+            self.receber(pos)
+
+    def receber(self, pos: list[float]):
+        """
+        O imigrante substitui a pior partícula da ilha. O custo é recalculado aqui, de modo que
+        mesmo uma posição lida incompleta só entra como uma partícula qualquer.
+        """
+        enxame = self.enxame
+        self.imigrantes += 1
+        if enxame.enxame is not None:
+            matrizes = enxame.enxame
+            pior = int(matrizes.custo_melhor_local.argmax())
+            matrizes.pos[pior] = pos
+            matrizes.melhor_local[pior] = pos
+            matrizes.custo_melhor_local[pior] = matrizes.calcular_custos(matrizes.pos[pior:pior + 1])[0]
+            enxame.atualizar_melhor_global()
+            return
+
+        pior = max(enxame.particulas, key=lambda particula: particula.custo_melhor_local)
+        pior.vetor = list(pos)
+        pior.melhor_local = list(pos)
+        pior.custo_melhor_local = pior.calcular_custo()
+        if pior.custo_melhor_local < enxame.melhor_global_custo:
+            enxame.melhor_global_custo = pior.custo_melhor_local
+            enxame.melhor_global_pos = pior.melhor_local.copy()
+            enxame.melhor_global = pior.get_plano()
+
+
+def _executar_ilha(indice: int, nome_quadro: str, num_ilhas: int, vizinhos: list[int], problema: ProblemaLote,
+                   plano_base: Plano, num_particulas: int, vetorizado: bool, temp_exec: float, w: float, c1: float,
+                   c2: float, intervalo_migracao: int, verificar_tempo_a_cada: int, semente):
+    """Corpo de uma ilha, no seu próprio processo. Devolve (plano, custo, iterações, imigrantes recebidos)"""
+    random.seed(f"{semente}-{indice}")
+    quadro = QuadroMigracao(num_ilhas, len(plano_base.fins) - 1, nome_quadro)
+    try:
+        prazo = Prazo(temp_exec, verificar_tempo_a_cada)
+        ilha = Ilha(indice, OtimizadorEnxame(problema, num_particulas, vetorizado, plano_base), quadro, vizinhos)
+        num_iter = 0
+        while not prazo.esgotado():
+            ilha.varrer(w, c1, c2)
+            num_iter += 1
+            if num_iter % intervalo_migracao == 0:
+                ilha.migrar(num_iter)
+
+        # Última publicação, com o total de iterações da ilha
+        ilha.publicado = float('inf')
+        ilha.publicar(num_iter)
+        enxame = ilha.enxame
+        return enxame.melhor_global, enxame.melhor_global_custo, num_iter, ilha.imigrantes
+    finally:
+        quadro.fechar()
+
+
+class OtimizadorPlano:
+    def __init__(self, problema: ProblemaLote, num_ilhas: int = None, particulas_por_ilha: int = 50,
+                 topologia: str = "anel", intervalo_migracao: int = 10, vetorizado: bool = False,
+                 plano_inicial: Plano = None):
+        """
+        - num_ilhas: sub-enxames, cada um em um processo (padrão: CPUs); com 1 a ilha roda no próprio processo
+        - topologia: "anel", "von_neumann" ou "global" (ver TOPOLOGIAS)
+        - intervalo_migracao: varreduras de cada ilha entre duas trocas com as vizinhas
+        - vetorizado, plano_inicial: como no OtimizadorPlano de ParticleSwarm.py, em todas as ilhas
+        """
+        if topologia not in TOPOLOGIAS:
+            raise ValueError(f"Topologia desconhecida: {topologia}")
+        self.problema = problema
+        self.num_ilhas = num_ilhas or os.cpu_count() or 1
+        self.particulas_por_ilha = particulas_por_ilha
+        self.topologia = topologia
+        self.intervalo_migracao = max(1, intervalo_migracao)
+        self.vetorizado = vetorizado
+
+        # Todas as ilhas partem do mesmo plano, e portanto têm posições da mesma dimensão
+        self.plano_base = plano_inicial if plano_inicial is not None else ConstrutorPlano(problema).construir()
+        self.ilhas = []  # (custo, iterações, imigrantes recebidos) de cada ilha na última execução
+
+    def vizinhos(self, indice: int) -> list[int]:
+        return TOPOLOGIAS[self.topologia](indice, self.num_ilhas)
+
+    def PSO(self, temp_exec: float, w: float, c1: float, c2: float, semente=None, progresso: Progresso = None,
+            verificar_tempo_a_cada: int = 1) -> tuple[list[tuple[int, int]], float]:
+        """
+        Roda as ilhas por temp_exec segundos e devolve o melhor plano entre elas. Com semente, cada
+        ilha usa um gerador derivado dela; como as migrações dependem do ritmo de cada processo,
+        só a execução com uma ilha é reproduzível.
+        """
+        progresso = progresso if progresso is not None else Progresso()
+        semente = random.getrandbits(64) if semente is None else semente
+        quadro = QuadroMigracao(self.num_ilhas, len(self.plano_base.fins) - 1)
+        try:
+            argumentos = [(indice, quadro.nome, self.num_ilhas, self.vizinhos(indice), self.problema,
+                           self.plano_base, self.particulas_por_ilha, self.vetorizado, temp_exec, w, c1, c2,
+                           self.intervalo_migracao, verificar_tempo_a_cada, semente)
+                          for indice in range(self.num_ilhas)]
+            progresso.iniciar()
+            if self.num_ilhas == 1:
+                resultados = [_executar_ilha(*argumentos[0])]
+            else:
+                resultados = self._executar_paralelo(argumentos, quadro, progresso)
+            custo_publicado, num_iter = quadro.resumo()
+        finally:
+            quadro.fechar(remover=True)
+
+        self.ilhas = [(custo, iteracoes, imigrantes) for _, custo, iteracoes, imigrantes in resultados]
+        melhor_plano, melhor_custo, _, _ = min(resultados, key=lambda resultado: resultado[1])
+        progresso.finalizar(num_iter, melhor_custo, ilhas=self.num_ilhas)
+        progresso.mensagem("Numero de iterações:", num_iter)
+        return melhor_plano, melhor_custo
+
+    def _executar_paralelo(self, argumentos: list[tuple], quadro: QuadroMigracao, progresso: Progresso) -> list:
+        # O multiprocessing só é carregado por quem usa mais de uma ilha
+        from concurrent.futures import FIRST_EXCEPTION, ProcessPoolExecutor, wait
+
+        with ProcessPoolExecutor(max_workers=len(argumentos)) as executor:
+            pendentes = {executor.submit(_executar_ilha, *args) for args in argumentos}
+            futuros = list(pendentes)
+            while pendentes:
+                prontos, pendentes = wait(pendentes, timeout=0.05, return_when=FIRST_EXCEPTION)
+                for futuro in prontos:
+                    futuro.result()
+                # O progresso acompanha o quadro, sem comunicação com as ilhas
+                custo, num_iter = quadro.resumo()
+                progresso.informar(num_iter, custo)
+        return [futuro.result() for futuro in futuros]
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    import time
+
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+
+    for topologia in TOPOLOGIAS:
+        t0 = time.time()
+        otimizador = OtimizadorPlano(problema, num_ilhas=4, particulas_por_ilha=25, topologia=topologia)
+        _, custo_total = otimizador.PSO(temp_exec=10, w=0.8, c1=1.7, c2=1.2, semente=0,
+                                        progresso=Progresso(silencioso=True))
+        print(f"{topologia}: {custo_total} ({round(time.time() - t0, 2)}s)", "ilhas:", otimizador.ilhas)
+    print("Ótimo (programação dinâmica):", problema.motor.plano_otimo()[1])
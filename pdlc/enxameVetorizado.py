@@ -0,0 +1,105 @@
+"""
+Enxame Vetorizado para o Particle Swarm do PDLC
+===============================================
+
+Descrição:
+----------
+Versão do enxame do Particle Swarm em que posições, velocidades e melhores posições locais
+de todas as partículas ficam em matrizes NumPy (uma linha por partícula). A atualização do
+enxame, a decodificação das posições em fins de lote e o cálculo do custo dos planos são
+feitos em poucas operações sobre as matrizes inteiras, usando as somas de prefixo do
+MotorCustoLinear, em vez de um laço em Python por partícula e por dimensão.
+
+Depende do NumPy, que só é importado quando o modo vetorizado é usado.
+"""
+
+import numpy as np
+
+from .plano import Plano
+
+
+class Enxame:
+    def __init__(self, problema, planos: list[Plano], semente: int = None):
+        motor = problema.motor
+        self.problema = problema
+        self.T = len(problema.demanda) - 1
+        self.rng = np.random.default_rng(semente)
+
+        # Limites para evitar overflow
+        self.max_vel = 5.0
+        self.min_pos = 0
+        self.max_pos = self.T
+
+        # Somas de prefixo do motor linear (cabem exatamente em float64)
+        self.demanda_acumulada = np.array(motor.demanda_acumulada, dtype=float)
+        self.ponderada_acumulada = np.array(motor.ponderada_acumulada, dtype=float)
+        self.custo_fixo = motor.custo_fixo
+        self.custo_estoque = motor.custo_estoque
+        self.capacidade = motor.capacidade
+
+        self.pos = np.array([plano.fins[:-1] for plano in planos], dtype=float).reshape(len(planos), -1)
+        self.vel = self.rng.uniform(-1, 1, self.pos.shape)
+
+        self.custo_melhor_local = self.calcular_custos(self.pos)
+        self.melhor_local = self.pos.copy()
+
+    def decodificar(self, pos: np.ndarray) -> np.ndarray:
+        """Fins de lote de cada partícula: fim[k] = max(fim[k-1] + 1, round(pos[k]))"""
+        arredondado = np.rint(np.clip(pos, self.min_pos, self.max_pos)).astype(np.int64)
+        k = np.arange(pos.shape[1])
+        return k + np.maximum.accumulate(arredondado - k, axis=1)
+
+    def custo_lotes(self, inicios: np.ndarray, fins: np.ndarray) -> np.ndarray:
+        """Custo dos lotes (inicios, fins) elemento a elemento; índices devem estar em [0, T]"""
+        acumulada, ponderada = self.demanda_acumulada, self.ponderada_acumulada
+        carregada = acumulada[fins + 1] - acumulada[inicios + 1]
+        estoque = (ponderada[fins + 1] - ponderada[inicios + 1]) - inicios * carregada
+        custos = self.custo_fixo + self.custo_estoque * estoque
+        custos[acumulada[fins + 1] - acumulada[inicios] > self.capacidade] = np.inf
+        return custos
+
+    def calcular_custos(self, pos: np.ndarray) -> np.ndarray:
+        """Custo total do plano de cada partícula"""
+        num_particulas, dimensao = pos.shape
+        if dimensao == 0:
+            return np.full(num_particulas, float(self.problema.custo(0, self.T)))
+
+        fins = self.decodificar(pos)
+        # Fins passando de T geram um lote fora do horizonte: plano inviável
+        invalido = fins[:, -1] > self.T
+        fins = np.minimum(fins, self.T)
+
+        inicios = np.empty_like(fins)
+        inicios[:, 0] = 0
+        inicios[:, 1:] = np.minimum(fins[:, :-1] + 1, self.T)
+        custos = self.custo_lotes(inicios, fins).sum(axis=1)
+
+        # Último lote (fim + 1, T), presente quando o último fim não chega a T
+        ultimo = fins[:, -1] < self.T
+        inicio_ultimo = fins[ultimo, -1] + 1
+        custos[ultimo] += self.custo_lotes(inicio_ultimo, np.full_like(inicio_ultimo, self.T))
+
+        custos[invalido] = np.inf
+        return custos
+
+    def get_plano(self, posicao: np.ndarray) -> list[tuple[int, int]]:
+        plano = Plano(self.decodificar(posicao[np.newaxis, :])[0].tolist())
+        if len(plano) == 0 or plano.fins[-1] < self.T:
+            plano.fins.append(self.T)
+        return plano.para_tuplas()
+
+    def atualizar(self, w: float, c1: float, c2: float, melhor_global_pos: np.ndarray) -> np.ndarray:
+        r1 = self.rng.random(self.pos.shape)
+        r2 = self.rng.random(self.pos.shape)
+
+        # Atualiza velocidades e posições do enxame inteiro, com limites
+        self.vel = w * self.vel + c1 * r1 * (self.melhor_local - self.pos) + c2 * r2 * (melhor_global_pos - self.pos)
+        np.clip(self.vel, -self.max_vel, self.max_vel, out=self.vel)
+        self.pos += self.vel
+        np.clip(self.pos, self.min_pos, self.max_pos, out=self.pos)
+
+        custos = self.calcular_custos(self.pos)
+        melhorou = custos < self.custo_melhor_local
+        self.custo_melhor_local[melhorou] = custos[melhorou]
+        self.melhor_local[melhorou] = self.pos[melhorou]
+        return custos
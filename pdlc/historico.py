@@ -0,0 +1,74 @@
+"""
+Histórico de Custos para as Metaheurísticas do PDLC
+===================================================
+
+Descrição:
+----------
+Registro da convergência (custo por iteração) com memória fixa, usado pelo Simulated Annealing
+e pelo Particle Swarm. As amostras ficam em um array('d') de tamanho máximo `capacidade`;
+quando ele enche, metade das amostras é descartada (fica uma a cada duas) e o passo de
+amostragem dobra, de modo que o histórico sempre cobre a execução inteira com resolução
+uniforme.
+
+Opcionalmente, as amostras aceitas são gravadas em um arquivo texto à medida que chegam
+("iteracao custo" por linha). Para desligar o registro basta não passar um histórico ao
+otimizador. O gráfico é um passo separado (plotar) e só então importa o matplotlib.
+"""
+
+from array import array
+
+
+class HistoricoCustos:
+    def __init__(self, capacidade: int = 4096, arquivo: str = None):
+        self.capacidade = max(2, capacidade)
+        self.custos = array('d')
+        self.passo = 1
+        self.num_registros = 0
+        self.arquivo = open(arquivo, 'w') if arquivo else None
+
+    def registrar(self, custo: float):
+        if self.num_registros % self.passo == 0:
+            if len(self.custos) == self.capacidade:
+                # Mantém uma amostra a cada duas e passa a amostrar com o dobro do passo
+                del self.custos[1::2]
+                self.passo *= 2
+
+            if self.num_registros % self.passo == 0:
+                try:
+                    custo = float(custo)
+                except OverflowError:
+                    custo = float('inf')
+                self.custos.append(custo)
+                if self.arquivo is not None:
+                    self.arquivo.write(f"{self.num_registros} {custo!r}\n")
+
+        self.num_registros += 1
+
+    def iteracoes(self) -> range:
+        """Iteração correspondente a cada amostra guardada"""
+        return range(0, len(self.custos) * self.passo, self.passo)
+
+    def fechar(self):
+        if self.arquivo is not None:
+            self.arquivo.close()
+            self.arquivo = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def plotar(historico: HistoricoCustos, titulo: str = "Evolução do custo", rotulo: str = "Custo ao longo das iterações"):
+    import matplotlib.pyplot as plt
+
+    plt.figure(figsize=(10, 4))
+    plt.plot(historico.iteracoes(), historico.custos, label=rotulo)
+    plt.xlabel("Iterações")
+    plt.ylabel("Custo")
+    plt.title(titulo)
+    plt.grid(True)
+    plt.legend()
+    plt.tight_layout()
+    plt.show()
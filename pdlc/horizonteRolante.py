@@ -0,0 +1,152 @@
+"""
+Replanejamento em Horizonte Rolante para o PDLC
+===============================================
+
+Descrição:
+----------
+Mantém o plano de uma instância cuja previsão de demanda chega aos poucos: a cada chamada de
+avancar() alguns períodos novos são acrescentados ao fim do horizonte e o plano é reotimizado
+apenas perto do fim, em vez de resolver o horizonte inteiro de novo.
+
+- O problema é estendido no lugar (ProblemaLote.estender): as somas de prefixo do motor
+  ganham só as entradas dos períodos novos.
+- Os períodos novos entram no plano com lotes gulosos, e a reotimização fica restrita a uma
+  janela com os últimos `janela` períodos (alinhada a uma fronteira de lote). A janela é
+  resolvida como uma instância própria, parte do melhor plano anterior (warm start) e só é
+  trocada se o resultado for melhor.
+- Os lotes que terminam antes de `congelar_ate` ficam congelados (já comprometidos) e não são
+  mais alterados, mesmo que caiam dentro da janela.
+
+O custo total é mantido incrementalmente: o custo de um lote não depende dos períodos depois
+dele, então só os lotes da janela precisam ser recalculados. Cada replanejamento custa tempo
+proporcional aos períodos novos e ao tamanho da janela, não ao horizonte inteiro.
+
+Funciona com o ProblemaLote do Simulated Annealing (algoritmo="sa") e do Particle Swarm
+(algoritmo="pso").
+"""
+
+import random
+import time
+from array import array
+
+from . import ParticleSwarm
+from . import SimulatedAnnealing
+from .plano import Plano
+from .progresso import Progresso
+
+
+class HorizonteRolante:
+    def __init__(self, problema, janela: int = 200, algoritmo: str = "sa", **parametros):
+        """
+        - problema: ProblemaLote com a demanda conhecida até agora (é estendido no lugar)
+        - janela: número de períodos do fim do horizonte reotimizados a cada avanço
+        - parametros: repassados ao otimizador (ver _reotimizar_sa e _reotimizar_pso)
+        """
+        self.problema = problema
+        self.janela = janela
+        self.algoritmo = algoritmo
+        self.parametros = parametros
+
+        self.plano = Plano()
+        self.custo = 0
+        self.congelados = 0  # lotes no início do plano que não podem mais ser alterados
+        self._completar_plano()
+
+    def _completar_plano(self):
+        """Cobre com lotes gulosos os períodos ainda fora do plano"""
+        motor = self.problema.motor
+        inicio = self.plano.fins[-1] + 1 if self.plano.fins else 0
+        while inicio < motor.n:
+            fim = motor.melhor_fim(inicio)
+            self.plano.fins.append(fim)
+            self.custo += self.problema.custo(inicio, fim)
+            inicio = fim + 1
+
+    def congelar(self, congelar_ate: int):
+        """Congela os lotes que terminam antes do período `congelar_ate`"""
+        fins = self.plano.fins
+        while self.congelados < len(fins) and fins[self.congelados] < congelar_ate:
+            self.congelados += 1
+
+    def inicio_janela(self) -> int:
+        """Índice do primeiro lote da janela: o que contém o período n - janela, ou o primeiro não congelado"""
+        fins = self.plano.fins
+        limite = self.problema.motor.n - self.janela
+        k = len(fins)
+        while k > self.congelados and fins[k - 1] >= limite:
+            k -= 1
+        return k
+
+    def avancar(self, novas_demandas: list[int], congelar_ate: int = None, temp_exec: float = 1,
+                progresso: Progresso = None) -> tuple[list[tuple[int, int]], float]:
+        """
+        Acrescenta os períodos novos, congela os lotes comprometidos e reotimiza a janela.
+        Devolve o plano do horizonte inteiro e o seu custo.
+        """
+        self.problema.estender(novas_demandas)
+        self._completar_plano()
+        if congelar_ate is not None:
+            self.congelar(congelar_ate)
+
+        # Com um lote só na janela não há fronteira a mover
+        k = self.inicio_janela()
+        if len(self.plano) - k >= 2:
+            self._reotimizar(k, temp_exec, progresso)
+        return self.plano.para_tuplas(), self.custo
+
+    def _reotimizar(self, k: int, temp_exec: float, progresso: Progresso):
+        fins = self.plano.fins
+        inicio = self.plano.inicio(k)
+        custo_janela = sum(self.problema.custo(self.plano.inicio(m), fins[m]) for m in range(k, len(fins)))
+
+        # A janela vira uma instância própria começando no período 0; os custos dos lotes não mudam
+        # com o deslocamento, pois só dependem da distância ao início do lote
+        problema = self.problema
+        subproblema = type(problema)(problema.demanda[inicio:], problema.custo_fixo, problema.custo_estoque,
+                                     problema.capacidade, modo_custo=problema.modo_custo,
+                                     compacto=problema.compacto)
+        plano_inicial = Plano(array('l', [fim - inicio for fim in fins[k:]]))
+        progresso = progresso if progresso is not None else Progresso(silencioso=True)
+
+        if self.algoritmo == "pso":
+            plano, custo = self._reotimizar_pso(subproblema, plano_inicial, temp_exec, progresso)
+        else:
+            plano, custo = self._reotimizar_sa(subproblema, plano_inicial, temp_exec, progresso)
+
+        if custo < custo_janela:
+            del fins[k:]
+            fins.extend(fim + inicio for _, fim in plano)
+            self.custo += custo - custo_janela
+
+    def _reotimizar_sa(self, subproblema, plano_inicial: Plano, temp_exec: float, progresso: Progresso):
+        parametros = {"T_inicial": 10000, "T_min": 1e-6, "alpha": 0.999, "iter_por_temp": 100, **self.parametros}
+        otimizador = SimulatedAnnealing.OtimizadorPlano(subproblema)
+        return otimizador.simulated_annealing(temp_exec=temp_exec, progresso=progresso, plano_inicial=plano_inicial,
+                                              **parametros)
+
+    def _reotimizar_pso(self, subproblema, plano_inicial: Plano, temp_exec: float, progresso: Progresso):
+        parametros = {"w": 0.8, "c1": 1.7, "c2": 1.2, **self.parametros}
+        num_particulas = parametros.pop("num_particulas", 100)
+        vetorizado = parametros.pop("vetorizado", False)
+        otimizador = ParticleSwarm.OtimizadorPlano(subproblema, num_particulas, vetorizado, plano_inicial)
+        return otimizador.PSO(temp_exec=temp_exec, progresso=progresso, **parametros)
+
+
+# Exemplo de uso: 30 dias, cada um trazendo a previsão de mais 10 períodos
+if __name__ == "__main__":
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+    problema = SimulatedAnnealing.ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500)
+
+    rolante = HorizonteRolante(problema, janela=60)
+    t0 = time.time()
+    for dia in range(30):
+        novas = [random.randint(1, 50) for _ in range(10)]
+        # Os lotes dos próximos 10 períodos a partir de hoje já foram liberados para produção
+        plano, custo = rolante.avancar(novas, congelar_ate=10 * dia + 10, temp_exec=0.2)
+        print(f"Dia {dia:>2}: {len(demanda)} períodos, {len(plano)} lotes ({rolante.congelados} congelados), "
+              f"custo {custo}")
+
+    print("Custo recalculado:", problema.custo_total_plano(plano))
+    print("Ótimo (programação dinâmica):", problema.motor.plano_otimo()[1])
+    print("Tempo de execução:", round(time.time() - t0, 6))
@@ -0,0 +1,234 @@
+"""
+Formato Binário de Instâncias do PDLC
+=====================================
+
+Descrição:
+----------
+Guarda uma instância em um arquivo binário: um cabeçalho fixo de 64 bytes com os custos e a
+capacidade, seguido da demanda como inteiros de 64 bits contíguos (little-endian). Séries de
+milhões de períodos ocupam 8 bytes por período, sem o custo de um objeto Python por valor.
+
+Cabeçalho (struct "<4sIqqqqq", completado com zeros até 64 bytes):
+
+    mágico b"PDLC" | versão | número de períodos | custo_fixo | custo_estoque | capacidade
+
+O custo de estoque é guardado como a fração exata numerador / denominador (ver
+MotorCusto), de modo que um custo fracionário volta do arquivo com o mesmo valor com que foi
+gravado; com denominador 1 ele é lido como inteiro.
+
+abrir_instancia() mapeia o arquivo em memória (mmap) e expõe a demanda como um memoryview sobre
+o próprio mapeamento: nada é copiado, e só as páginas lidas são trazidas do disco. O problema
+montado a partir dela usa tabelas de prefixo compactas (PDLC com compacto=True) e, no modelo
+exponencial, o motor float (modo_custo="float"), cujas tabelas são todas de largura fixa: carregar
+a instância e montar as somas de prefixo usam cerca de 24 bytes por período. O motor "exato"
+continua disponível pedindo modo_custo="exato", mas guarda um inteiro Python por período.
+
+importar_csv() converte uma série de um CSV para o formato binário em fluxo, um bloco de valores
+por vez, sem carregar o CSV inteiro.
+
+Uso:
+----
+    python -m pdlc.instanciaBinaria vendas.csv vendas.pdlc --coluna demanda --custo-fixo 200 --custo-estoque 5 --capacidade 500
+    pdlc importar vendas.csv vendas.pdlc --coluna demanda --custo-fixo 200 --custo-estoque 5 --capacidade 500
+
+    with abrir_instancia("vendas.pdlc") as instancia:
+        problema = instancia.problema(modo_custo="float")
+"""
+
+import argparse
+import csv
+import mmap
+import struct
+import sys
+from array import array
+
+MAGICO = b"PDLC"
+VERSAO = 2
+CABECALHO = struct.Struct("<4sIqqqqq")
+TAMANHO_CABECALHO = 64
+TIPO = 'q'  # inteiros de 64 bits com sinal
+
+
+def salvar_instancia(arquivo: str, demanda, custo_fixo: int, custo_estoque: int, capacidade: int,
+                     tamanho_bloco: int = 65536) -> int:
+    """Grava a instância no formato binário; `demanda` pode ser qualquer iterável de inteiros. Devolve o número de períodos"""
+    numerador, denominador = _fracao(custo_estoque)
+    with open(arquivo, "wb") as saida:
+        saida.write(bytes(TAMANHO_CABECALHO))
+        n = 0
+        bloco = array(TIPO)
+        for valor in demanda:
+            bloco.append(valor)
+            if len(bloco) >= tamanho_bloco:
+                n += _gravar_bloco(saida, bloco)
+        n += _gravar_bloco(saida, bloco)
+
+        # O número de períodos só é conhecido no fim: o cabeçalho é escrito por último
+        saida.seek(0)
+        saida.write(CABECALHO.pack(MAGICO, VERSAO, n, custo_fixo, numerador, denominador, capacidade))
+    return n
+
+
+def _fracao(custo_estoque) -> tuple[int, int]:
+    """custo_estoque como (numerador, denominador) de 64 bits, ou ValueError se a fração não couber no cabeçalho"""
+    razao = getattr(custo_estoque, "as_integer_ratio", None)
+    numerador, denominador = razao() if razao is not None else float(custo_estoque).as_integer_ratio()
+    if not (-2 ** 63 <= numerador < 2 ** 63 and denominador < 2 ** 63):
+        raise ValueError(f"Custo de estoque {custo_estoque!r} não cabe no cabeçalho como fração de inteiros de 64 bits")
+    return numerador, denominador
+
+
+def _gravar_bloco(saida, bloco: array) -> int:
+    n = len(bloco)
+    if sys.byteorder != "little":
+        bloco.byteswap()
+    bloco.tofile(saida)
+    del bloco[:]
+    return n
+
+
+def ler_csv(arquivo: str, coluna=0, cabecalho: bool = None, delimitador: str = ","):
+    """
+    Gera os valores de demanda de uma coluna do CSV, linha a linha. `coluna` é o índice ou, se o
+    CSV tiver cabeçalho, o nome da coluna; por padrão há cabeçalho só quando a coluna é dada pelo nome.
+    """
+    if cabecalho is None:
+        cabecalho = isinstance(coluna, str)
+    with open(arquivo, newline="") as entrada:
+        leitor = csv.reader(entrada, delimiter=delimitador)
+        if cabecalho:
+            nomes = next(leitor, [])
+            if isinstance(coluna, str):
+                if coluna not in nomes:
+                    raise ValueError(f"Coluna {coluna!r} não encontrada no cabeçalho de {arquivo}")
+                coluna = nomes.index(coluna)
+
+        for linha in leitor:
+            if not linha:
+                continue
+            try:
+                yield int(linha[coluna])
+            except (ValueError, IndexError):
+                raise ValueError(f"{arquivo}, linha {leitor.line_num}: demanda inválida {linha!r}") from None
+
+
+def importar_csv(arquivo_csv: str, arquivo: str, custo_fixo: int, custo_estoque: int, capacidade: int, coluna=0,
+                 cabecalho: bool = None, delimitador: str = ",") -> int:
+    """Converte a série de um CSV (ver ler_csv) para o formato binário, em fluxo. Devolve o número de períodos"""
+    return salvar_instancia(arquivo, ler_csv(arquivo_csv, coluna, cabecalho, delimitador),
+                            custo_fixo, custo_estoque, capacidade)
+
+
+class InstanciaBinaria:
+    """
+    Instância aberta por abrir_instancia. `demanda` é um memoryview somente leitura sobre o
+    arquivo mapeado; fechar() (ou o fim do bloco with) libera a demanda e desfaz o mapeamento, e
+    depois disso nem ela nem os problemas montados a partir dela podem ser usados. Fatias da
+    demanda (as do horizonte rolante, por exemplo) são memoryviews próprios: continuam válidas
+    depois de fechar() e mantêm o mapeamento até serem liberadas. Por ser somente leitura, a
+    demanda mapeada não pode ser estendida (PDLC.estender).
+    """
+
+    def __init__(self, arquivo: str):
+        with open(arquivo, "rb") as entrada:
+            self._mapa = mmap.mmap(entrada.fileno(), 0, access=mmap.ACCESS_READ)
+
+        if len(self._mapa) < TAMANHO_CABECALHO:
+            self._mapa.close()
+            raise ValueError(f"{arquivo} não é uma instância do PDLC (arquivo curto demais)")
+        magico, versao, n, self.custo_fixo, numerador, denominador, self.capacidade = \
+            CABECALHO.unpack_from(self._mapa)
+        if magico != MAGICO:
+            self._mapa.close()
+            raise ValueError(f"{arquivo} não é uma instância do PDLC")
+        if versao != VERSAO:
+            self._mapa.close()
+            raise ValueError(f"Instância com versão {versao} não suportada (esperada {VERSAO})")
+        if len(self._mapa) < TAMANHO_CABECALHO + 8 * n:
+            self._mapa.close()
+            raise ValueError(f"{arquivo} está truncado: {n} períodos no cabeçalho")
+        self.custo_estoque = numerador if denominador == 1 else numerador / denominador
+
+        self.arquivo = arquivo
+        self.n = n
+        dados = memoryview(self._mapa)[TAMANHO_CABECALHO:TAMANHO_CABECALHO + 8 * n]
+        if sys.byteorder == "little":
+            self.demanda = dados.cast(TIPO)
+        else:
+            # Sem como reinterpretar os bytes no lugar, a demanda é copiada e convertida
+            copia = array(TIPO, dados.tobytes())
+            copia.byteswap()
+            self.demanda = copia
+        dados.release()
+
+    def parametros(self) -> tuple:
+        """(demanda, custo_fixo, custo_estoque, capacidade), na ordem do construtor do PDLC"""
+        return self.demanda, self.custo_fixo, self.custo_estoque, self.capacidade
+
+    def problema(self, classe=None, **opcoes):
+        """
+        Monta o problema sobre a demanda mapeada, com tabelas compactas por padrão. `classe` é o
+        ProblemaLote desejado (o PDLC, se omitida); `opcoes` vão para o construtor (modo_custo, tamanho_cache...).
+        No PDLC, cujo padrão é o motor "exato", o motor padrão aqui é o "float"; o ProblemaLote do
+        Particle Swarm mantém o seu motor linear.
+        """
+        from .PDLC import PDLC
+        classe = PDLC if classe is None else classe
+        if classe is PDLC:
+            opcoes.setdefault("modo_custo", "float")
+        opcoes.setdefault("compacto", True)
+        return classe(*self.parametros(), **opcoes)
+
+    def fechar(self):
+        if self._mapa is None:
+            return
+        if isinstance(self.demanda, memoryview):
+            self.demanda.release()
+        try:
+            self._mapa.close()
+        except BufferError:
+            # Ainda há fatias da demanda em uso: o mapeamento é desfeito quando a última for liberada
+            pass
+        self._mapa = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *_):
+        self.fechar()
+
+
+def abrir_instancia(arquivo: str) -> InstanciaBinaria:
+    return InstanciaBinaria(arquivo)
+
+
+def _custo(texto: str):
+    """Custo da linha de comando: inteiro quando possível, para manter o motor exato"""
+    try:
+        return int(texto)
+    except ValueError:
+        return float(texto)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Converte uma série de demanda em CSV para o formato binário do PDLC")
+    parser.add_argument("entrada", help="arquivo CSV")
+    parser.add_argument("saida", help="arquivo binário da instância")
+    parser.add_argument("--coluna", default="0", help="nome ou índice da coluna de demanda (padrão: 0)")
+    parser.add_argument("--cabecalho", action="store_true",
+                        help="pula a primeira linha mesmo com a coluna dada pelo índice (com o nome ela é sempre pulada)")
+    parser.add_argument("--delimitador", default=",")
+    parser.add_argument("--custo-fixo", type=int, required=True)
+    parser.add_argument("--custo-estoque", type=_custo, required=True, help="inteiro ou fracionário (0.5)")
+    parser.add_argument("--capacidade", type=int, required=True)
+    args = parser.parse_args(argv)
+
+    coluna = int(args.coluna) if args.coluna.isdigit() else args.coluna
+    cabecalho = True if args.cabecalho else None
+    n = importar_csv(args.entrada, args.saida, args.custo_fixo, args.custo_estoque, args.capacidade, coluna,
+                     cabecalho, args.delimitador)
+    print(f"{n} períodos gravados em {args.saida}")
+
+
+if __name__ == "__main__":
+    main()
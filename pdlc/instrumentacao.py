@@ -0,0 +1,172 @@
+"""
+Instrumentação dos Otimizadores do PDLC
+=======================================
+
+Descrição:
+----------
+Contadores e tempos por fase, opcionais, para descobrir onde vai o tempo de uma execução.
+Os otimizadores recebem um objeto Instrumentacao (ou None, o padrão) e, quando ele é informado,
+envolvem antes do laço principal os métodos que o laço já chama (sorteio do movimento, cálculo
+do custo, aplicação do movimento, consulta ao motor de custos...) com versões que contam as
+chamadas e acumulam o tempo gasto. Os originais são restaurados no fim da execução. Como nada
+muda dentro dos laços, sem instrumentação o custo é nulo.
+
+Os tempos das fases são inclusivos: o tempo do motor de custos também aparece dentro do tempo
+do cálculo do delta que o chamou.
+
+perfilar() executa qualquer função sob o cProfile e/ou o tracemalloc e devolve o resultado
+junto com um relatório estruturado. Os relatórios são dicionários prontos para json.dumps.
+"""
+
+import time
+from collections import defaultdict
+
+
+class Instrumentacao:
+    def __init__(self):
+        self.contadores = defaultdict(int)
+        self.tempos = defaultdict(float)
+        self.chamadas = defaultdict(int)
+        self._envolvidos = []
+        self._caches = []
+
+    def contar(self, nome: str, n: int = 1):
+        self.contadores[nome] += n
+
+    def fase(self, nome: str):
+        """Context manager que acumula o tempo do bloco na fase `nome`"""
+        return _Fase(self, nome)
+
+    def envolver(self, alvo, atributo: str, fase: str = None, contador: str = None, inviavel: str = None):
+        """
+        Troca alvo.atributo por uma versão que conta as chamadas em `contador`, acumula o tempo em
+        `fase` e conta em `inviavel` os custos infinitos devolvidos (um por chamada, ou cada elemento
+        infinito de um array de custos).
+        """
+        original = getattr(alvo, atributo)
+        proprio = atributo in getattr(alvo, "__dict__", {})
+        tempos, chamadas, contadores = self.tempos, self.chamadas, self.contadores
+        relogio = time.perf_counter
+        infinito = float('inf')
+
+        def envolvido(*args, **kwargs):
+            t0 = relogio()
+            resultado = original(*args, **kwargs)
+            if fase is not None:
+                tempos[fase] += relogio() - t0
+                chamadas[fase] += 1
+            if contador is not None:
+                contadores[contador] += 1
+            if inviavel is not None:
+                # Custos de um enxame vetorizado chegam como um array NumPy
+                contadores[inviavel] += int((resultado == infinito).sum()) if hasattr(resultado, "sum") \
+                    else resultado == infinito
+            return resultado
+
+        setattr(alvo, atributo, envolvido)
+        self._envolvidos.append((alvo, atributo, original, proprio))
+
+    def observar_cache(self, cache):
+        """Inclui no relatório os acertos e falhas do cache a partir de agora"""
+        if cache is not None:
+            self._caches.append((cache, cache.acertos, cache.falhas))
+
+    def restaurar(self):
+        """Desfaz, em ordem inversa, tudo o que foi envolvido"""
+        while self._envolvidos:
+            alvo, atributo, original, proprio = self._envolvidos.pop()
+            if proprio:
+                setattr(alvo, atributo, original)
+            else:
+                delattr(alvo, atributo)
+
+        for cache, acertos, falhas in self._caches:
+            self.contadores["cache_acertos"] += cache.acertos - acertos
+            self.contadores["cache_falhas"] += cache.falhas - falhas
+        self._caches = []
+
+    def relatorio(self) -> dict:
+        return {
+            "contadores": dict(self.contadores),
+            "fases": {nome: {"segundos": segundos, "chamadas": self.chamadas[nome]}
+                      for nome, segundos in self.tempos.items()},
+        }
+
+
+class _Fase:
+    __slots__ = ("instrumentacao", "nome", "inicio")
+
+    def __init__(self, instrumentacao: Instrumentacao, nome: str):
+        self.instrumentacao = instrumentacao
+        self.nome = nome
+
+    def __enter__(self):
+        self.inicio = time.perf_counter()
+        return self
+
+    def __exit__(self, *excecao):
+        self.instrumentacao.tempos[self.nome] += time.perf_counter() - self.inicio
+        self.instrumentacao.chamadas[self.nome] += 1
+        return False
+
+
+def perfilar(funcao, *args, cprofile: bool = True, memoria: bool = False, linhas: int = 20, **kwargs):
+    """
+    Executa funcao(*args, **kwargs) e devolve (resultado, relatorio). O relatório traz o tempo
+    total, as `linhas` funções com maior tempo acumulado segundo o cProfile e, com memoria=True,
+    o pico de memória medido pelo tracemalloc (que deixa a execução bem mais lenta).
+    """
+    # Importados aqui para que usar só a Instrumentacao não carregue o cProfile e o pstats
+    import cProfile
+    import pstats
+    import tracemalloc
+
+    perfil = cProfile.Profile() if cprofile else None
+    if memoria:
+        tracemalloc.start()
+    t0 = time.perf_counter()
+    try:
+        if perfil is not None:
+            perfil.enable()
+        try:
+            resultado = funcao(*args, **kwargs)
+        finally:
+            if perfil is not None:
+                perfil.disable()
+        relatorio = {"tempo": time.perf_counter() - t0}
+        if memoria:
+            relatorio["memoria_pico"] = tracemalloc.get_traced_memory()[1]
+    finally:
+        if memoria:
+            tracemalloc.stop()
+
+    if perfil is not None:
+        estatisticas = pstats.Stats(perfil).stats
+        funcoes = sorted(estatisticas.items(), key=lambda item: item[1][3], reverse=True)[:linhas]
+        relatorio["perfil"] = [
+            {"funcao": f"{arquivo}:{linha}({nome})", "chamadas": chamadas, "tempo_proprio": proprio,
+             "tempo_acumulado": acumulado}
+            for (arquivo, linha, nome), (_, chamadas, proprio, acumulado, _) in funcoes
+        ]
+    return resultado, relatorio
+
+
+# Exemplo de uso
+if __name__ == "__main__":
+    import json
+    import random
+
+    from .progresso import Progresso
+    from .SimulatedAnnealing import OtimizadorPlano, ProblemaLote
+
+    random.seed(42)
+    demanda = [random.randint(1, 50) for _ in range(100)]
+    problema = ProblemaLote(demanda, custo_fixo=200, custo_estoque=5, capacidade=500, tamanho_cache=10_000)
+
+    instrumentacao = Instrumentacao()
+    (_, custo), perfil = perfilar(OtimizadorPlano(problema).simulated_annealing, T_inicial=10000, T_min=1e-6,
+                                  alpha=0.999, iter_por_temp=100, temp_exec=2, progresso=Progresso(silencioso=True),
+                                  instrumentacao=instrumentacao, linhas=5)
+
+    print("Custo total:", custo)
+    print(json.dumps({**instrumentacao.relatorio(), **perfil}, indent=2))
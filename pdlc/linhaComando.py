@@ -0,0 +1,133 @@
+"""
+Linha de Comando do PDLC
+========================
+
+Descrição:
+----------
+Ponto de entrada único (`pdlc`, ver pyproject.toml) para os otimizadores:
+
+- solve: resolve uma instância com o guloso, o Silver-Meal, o SA, a Busca Tabu, o PSO ou o exato
+- bench: benchmark das famílias de instâncias (ver benchmark.py)
+- batch: resolução em massa, em paralelo (ver resolverInstancias.py)
+- importar: converte uma série de demanda em CSV para o formato binário (ver instanciaBinaria.py)
+- carga: mede o tempo de importação de cada módulo em um interpretador novo
+
+Só o módulo do subcomando pedido é importado, e os otimizadores só são importados pelo algoritmo
+que os usa, de modo que `pdlc solve --algoritmo guloso` não paga a importação do PSO nem do NumPy.
+
+Uso:
+----
+    pdlc solve instancia.json --algoritmo sa --tempo 5
+    pdlc solve instancia.pdlc --algoritmo guloso
+    pdlc solve --demanda 22 35 18 42 --custo-fixo 100 --custo-estoque 2 --capacidade 80 --algoritmo exato
+    pdlc bench --horizontes 50 200 --tempo 5
+    pdlc batch instancias.jsonl --algoritmo sa --processos 8
+    pdlc importar vendas.csv vendas.pdlc --coluna demanda --custo-fixo 200 --custo-estoque 5 --capacidade 500
+    pdlc carga
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+# Módulos medidos por `pdlc carga`
+MODULOS = ["PDLC", "SimulatedAnnealing", "BuscaTabu", "ParticleSwarm", "enxameIlhas", "silverMeal",
+           "horizonteRolante", "instanciaBinaria", "resolverInstancias", "benchmark"]
+
+
+def solve(argv=None):
+    from .resolverInstancias import ALGORITMOS, resolver_instancia
+
+    parser = argparse.ArgumentParser(prog="pdlc solve", description="Resolve uma instância do PDLC")
+    parser.add_argument("entrada", nargs="?", default=None,
+                        help="arquivo JSON ou binário (.pdlc) com a instância (- para JSON na entrada padrão); "
+                             "ou use --demanda e os custos")
+    parser.add_argument("--demanda", type=int, nargs="+")
+    parser.add_argument("--custo-fixo", type=int)
+    parser.add_argument("--custo-estoque", type=int)
+    parser.add_argument("--capacidade", type=int)
+    parser.add_argument("--algoritmo", choices=sorted(ALGORITMOS), default="sa")
+    parser.add_argument("--tempo", type=float, default=5, help="orçamento em segundos das metaheurísticas")
+    parser.add_argument("--semente", type=int, default=0)
+    args = parser.parse_args(argv)
+
+    if args.entrada is not None and args.entrada.endswith(".pdlc"):
+        instancia = {"arquivo": args.entrada}
+    elif args.entrada is not None:
+        if args.entrada == "-":
+            instancia = json.load(sys.stdin)
+        else:
+            with open(args.entrada) as entrada:
+                instancia = json.load(entrada)
+    elif None in (args.demanda, args.custo_fixo, args.custo_estoque, args.capacidade):
+        parser.error("informe o arquivo da instância ou --demanda, --custo-fixo, --custo-estoque e --capacidade")
+    else:
+        instancia = {"demanda": args.demanda, "custo_fixo": args.custo_fixo, "custo_estoque": args.custo_estoque,
+                     "capacidade": args.capacidade}
+
+    resultado = resolver_instancia(instancia, args.algoritmo, args.tempo, args.semente)
+    print(json.dumps(resultado))
+    return 1 if resultado["erro"] else 0
+
+
+def bench(argv=None):
+    from . import benchmark
+    return benchmark.main(argv)
+
+
+def batch(argv=None):
+    from . import resolverInstancias
+    return resolverInstancias.main(argv)
+
+
+def importar(argv=None):
+    from . import instanciaBinaria
+    return instanciaBinaria.main(argv)
+
+
+def medir_carga(modulos=MODULOS, repeticoes: int = 5) -> dict:
+    """
+    Menor tempo, em segundos, de `import modulo` em um interpretador novo para cada módulo, dentre
+    `repeticoes` execuções (a primeira também compila os .pyc, por isso o mínimo).
+    """
+    tempos = {}
+    for modulo in modulos:
+        codigo = (f"import time; t0 = time.perf_counter(); import {__package__}.{modulo}; "
+                  "print(time.perf_counter() - t0)")
+        tempos[modulo] = min(float(subprocess.run([sys.executable, "-c", codigo], capture_output=True, text=True,
+                                                  check=True).stdout)
+                             for _ in range(repeticoes))
+    return tempos
+
+
+def carga(argv=None):
+    parser = argparse.ArgumentParser(prog="pdlc carga", description="Mede o tempo de importação dos módulos")
+    parser.add_argument("modulos", nargs="*", default=MODULOS)
+    parser.add_argument("--repeticoes", type=int, default=5)
+    args = parser.parse_args(argv)
+
+    for modulo, segundos in medir_carga(args.modulos, args.repeticoes).items():
+        print(f"{modulo:<22} {segundos * 1000:8.2f} ms")
+    return 0
+
+
+COMANDOS = {
+    "solve": solve,
+    "bench": bench,
+    "batch": batch,
+    "importar": importar,
+    "carga": carga,
+}
+
+
+def main(argv=None):
+    argv = sys.argv[1:] if argv is None else argv
+    if not argv or argv[0] not in COMANDOS:
+        print(f"uso: pdlc {{{','.join(COMANDOS)}}} [opções]  (pdlc <comando> -h para as opções)", file=sys.stderr)
+        return 2
+    return COMANDOS[argv[0]](argv[1:]) or 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
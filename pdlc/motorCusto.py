@@ -0,0 +1,478 @@
+"""
+Motor de Custos para o Problema de Dimensionamento de Lotes Capacitado (PDLC)
+=============================================================================
+
+Descrição:
+----------
+Pré-calcula, uma única vez por instância, as somas de prefixo da demanda e da demanda
+ponderada pelo custo de estoque (além da tabela de potências do custo de estoque), de modo
+que o custo de um lote (i, j) e a verificação de capacidade passem a ser consultas em tempo
+constante, em vez de um laço sobre os períodos do lote.
+
+No modelo exponencial do MotorCusto a soma ponderada recomeça a cada BLOCO períodos: os
+inteiros guardados têm tamanho limitado pelo bloco, e não pelo horizonte, e um lote dentro de
+poucos blocos custa poucas operações sobre eles. O custo de estoque é tratado como a fração
+exata p / q, de modo que custos fracionários (0.5, por exemplo) não dependem de potências que
+estouram ou se anulam em float.
+
+As tabelas são montadas a partir da lista de demanda recebida; se ela for alterada depois,
+é preciso construir um novo motor. A única exceção é acrescentar períodos ao fim do horizonte,
+feito por estender(), que calcula apenas as entradas novas das tabelas.
+
+A demanda pode ser qualquer sequência indexável de inteiros, inclusive um memoryview sobre um
+arquivo mapeado em memória (ver instanciaBinaria.py). Com compacto=True as tabelas de largura
+fixa são guardadas em array('q') / array('d'), com 8 bytes por entrada em vez de um objeto
+Python por entrada, à custa de consultas um pouco mais lentas; é o modo para séries de milhões
+de períodos.
+
+Classes Implementadas:
+---------------------
+- MotorCusto: estoque com custo exponencial (custo_estoque ** (k - i)), usado pelo PDLC,
+  pelo Simulated Annealing e pelo algoritmo construtivo.
+- MotorCustoFloat: o mesmo modelo do MotorCusto em float de largura fixa, com saturação em
+  infinito acima de um limite, para horizontes longos.
+- MotorCustoLinear: estoque com custo linear (custo_estoque * (k - i)), usado pelo
+  Particle Swarm.
+- CacheCusto: cache opcional na frente de um motor, com tabela triangular densa para horizontes
+  pequenos e LRU limitada para horizontes grandes.
+- probabilidade_aceitacao(): exp(-delta / T) do critério de Metropolis, protegido contra overflow.
+"""
+
+import math
+from array import array
+from collections import OrderedDict
+
+
+def _tabela(tipo: str, inicial, compacto: bool):
+    """Tabela de prefixo começando em `inicial`: array do tipo dado com compacto=True, lista caso contrário"""
+    return array(tipo, [inicial]) if compacto else [inicial]
+
+
+class MotorCusto:
+    # Períodos por bloco das somas ponderadas (ver _estender_tabelas)
+    BLOCO = 64
+
+    def __init__(self, demanda: list[int], custo_fixo: int, custo_estoque: int, capacidade: int,
+                 compacto: bool = False):
+        self.demanda = demanda
+        self.custo_fixo = custo_fixo
+        self.custo_estoque = custo_estoque
+        self.capacidade = capacidade
+        self.compacto = compacto
+        self.n = len(demanda)
+
+        # custo_estoque = p / q como fração exata (q = 1 para custos inteiros); com custos
+        # inteiros a divisão pela potência é exata e o custo é inteiro
+        # (int, float e Fraction expõem as_integer_ratio; os demais números passam por float)
+        razao = getattr(custo_estoque, "as_integer_ratio", None)
+        self.p, self.q = razao() if razao is not None else float(custo_estoque).as_integer_ratio()
+        self.divisao_exata = isinstance(custo_estoque, int)
+        B = self.BLOCO
+        # potencias_p[m] = p ** m e potencias_q[m] = q ** m, para m <= BLOCO
+        self.potencias_p = [self.p ** m for m in range(B + 1)]
+        self.potencias_q = [self.q ** m for m in range(B + 1)]
+        # coeficientes[m] = p ** m * q ** (BLOCO - 1 - m): custo_estoque ** m com o denominador comum do bloco
+        self.coeficientes = [self.potencias_p[m] * self.potencias_q[B - 1 - m] for m in range(B)]
+
+        # demanda_acumulada[k] = soma de demanda[:k]
+        # ponderada_bloco[k] = q ** (BLOCO - 1) * soma de demanda[m] * custo_estoque ** (m - s) para s <= m < k,
+        #                      com s o início do bloco do período k - 1
+        # (as somas ponderadas são inteiros de precisão arbitrária e ficam em lista mesmo com compacto=True)
+        self.demanda_acumulada = _tabela('q', 0, compacto)
+        self.ponderada_bloco = [0]
+        self._estender_tabelas(0)
+
+    def _estender_tabelas(self, inicio: int):
+        """
+        Acrescenta às tabelas os períodos de `inicio` em diante. A soma ponderada recomeça a cada
+        BLOCO períodos, de modo que os seus inteiros têm no máximo BLOCO potências do custo de
+        estoque, qualquer que seja o tamanho do horizonte.
+        """
+        B, coeficientes = self.BLOCO, self.coeficientes
+        acumulada, ponderada = self.demanda_acumulada, self.ponderada_bloco
+        for k in range(inicio, self.n):
+            d = self.demanda[k]
+            acumulada.append(acumulada[k] + d)
+            deslocamento = k % B
+            ponderada.append(d * coeficientes[0] if deslocamento == 0 else ponderada[k] + d * coeficientes[deslocamento])
+
+    def estender(self, novas_demandas: list[int]):
+        """
+        Acrescenta períodos ao fim do horizonte (a lista de demanda é estendida no lugar). Só as
+        entradas novas das somas de prefixo são calculadas, em tempo proporcional aos períodos novos;
+        o custo dos lotes já existentes não muda.
+        """
+        inicio = self.n
+        self.demanda.extend(novas_demandas)
+        self.n = len(self.demanda)
+        self._estender_tabelas(inicio)
+
+    def producao(self, i: int, j: int) -> int:
+        """Produção que o lote (i, j) carrega em estoque, isto é, a demanda de i+1 até j"""
+        fim = min(j, self.n - 1)
+        if fim <= i:
+            return 0
+        return self.demanda_acumulada[fim + 1] - self.demanda_acumulada[i + 1]
+
+    def viavel(self, i: int, j: int) -> bool:
+        return self.producao(i, j) <= self.capacidade
+
+    def custo(self, i: int, j: int) -> float:
+        fim = min(j, self.n - 1)
+        if fim <= i:
+            return self.custo_fixo
+
+        if self.demanda_acumulada[fim + 1] - self.demanda_acumulada[i + 1] > self.capacidade:
+            return float('inf')
+
+        if self.custo_estoque == 0:
+            return self.custo_fixo
+
+        # soma de demanda[k] * custo_estoque ** (k - i) para k em (i, fim], calculada em relação ao
+        # início s do bloco do período i + 1 e depois trazida para i (s - 1 <= i < s + BLOCO - 1)
+        B, ponderada = self.BLOCO, self.ponderada_bloco
+        a = i + 1
+        bloco, ultimo_bloco = a // B, fim // B
+        s = bloco * B
+        if bloco == ultimo_bloco:
+            soma = ponderada[fim + 1] - ponderada[a] if a > s else ponderada[fim + 1]
+            blocos = 0
+        else:
+            # Horner sobre os blocos seguintes, do último para o primeiro; com custo fracionário cada
+            # bloco acrescenta q ** BLOCO ao denominador
+            p_bloco, q_bloco = self.potencias_p[B], self.potencias_q[B]
+            soma, escala = ponderada[fim + 1], q_bloco
+            for b in range(ultimo_bloco - 1, bloco, -1):
+                soma = soma * p_bloco + ponderada[(b + 1) * B] * escala
+                escala *= q_bloco
+            parcial = ponderada[s + B] - ponderada[a] if a > s else ponderada[s + B]
+            soma = soma * p_bloco + parcial * escala
+            blocos = ultimo_bloco - bloco
+
+        e = i - s
+        if self.divisao_exata:
+            if e < 0:
+                return self.custo_fixo + soma * self.p
+            return self.custo_fixo + soma // self.potencias_p[e]
+
+        # soma / (q ** (BLOCO - 1) * q ** (BLOCO * blocos)) * custo_estoque ** -e, numa única
+        # divisão de inteiros (arredondada corretamente, mesmo com potências fora da faixa do float)
+        denominador = self.potencias_q[B - 1] * self.potencias_q[B] ** blocos
+        if e < 0:
+            return self.custo_fixo + soma * self.p / (denominador * self.q)
+        return self.custo_fixo + soma * self.potencias_q[e] / (denominador * self.potencias_p[e])
+
+    def custo_total_plano(self, plano: list[tuple[int, int]]) -> float:
+        return sum(self.custo(i, j) for i, j in plano)
+
+    def custo_medio(self, i: int, j: int) -> float:
+        return self.custo(i, j) / (j - i + 1)
+
+    def plano_otimo(self) -> tuple[list[tuple[int, int]], float]:
+        """Plano de menor custo por programação dinâmica sobre os fins de lote (caminho mínimo), em O(n²)"""
+        melhor = [0] + [float('inf')] * self.n  # melhor[j]: menor custo cobrindo os períodos 0..j-1
+        anterior = [0] * (self.n + 1)
+        for i in range(self.n):
+            if melhor[i] == float('inf'):
+                continue
+            for j in range(i, self.n):
+                # A produção só cresce com j: nenhum lote maior a partir de i é viável
+                if not self.viavel(i, j):
+                    break
+                custo = melhor[i] + self.custo(i, j)
+                if custo < melhor[j + 1]:
+                    melhor[j + 1] = custo
+                    anterior[j + 1] = i
+
+        if melhor[self.n] == float('inf'):
+            return [], float('inf')
+
+        plano = []
+        j = self.n
+        while j > 0:
+            plano.append((anterior[j], j - 1))
+            j = anterior[j]
+        plano.reverse()
+        return plano, melhor[self.n]
+
+    def melhor_fim(self, inicio: int, parada_antecipada: bool = False) -> int:
+        """
+        Fim do lote iniciado em `inicio` com menor custo médio por período. O custo é acumulado
+        período a período e a busca para na primeira violação de capacidade; com
+        parada_antecipada=True para também assim que o custo médio deixa de cair (Silver-Meal).
+        """
+        custo = self.custo_fixo
+        producao = 0
+        potencia = 1
+        melhor_fim, melhor_medio = inicio, custo
+        for fim in range(inicio + 1, self.n):
+            producao += self.demanda[fim]
+            if producao > self.capacidade:
+                break
+            potencia *= self.custo_estoque
+            custo += self.demanda[fim] * potencia
+
+            medio = custo / (fim - inicio + 1)
+            if medio < melhor_medio:
+                melhor_fim, melhor_medio = fim, medio
+            elif parada_antecipada:
+                break
+        return melhor_fim
+
+
+class MotorCustoFloat(MotorCusto):
+    """
+    Mesmo modelo do MotorCusto (estoque com custo exponencial), calculado em float de largura fixa.
+    Com custo_estoque > 1 o MotorCusto acumula demanda[m] * custo_estoque ** m em inteiros de
+    precisão arbitrária, que para horizontes longos passam de milhares de bits e tornam cada
+    consulta lenta. Aqui a soma de prefixo é normalizada pelo próprio período,
+
+        normalizada[k] = soma de demanda[m] * custo_estoque ** (m - k) para m < k,
+
+    que fica limitada pela demanda, e o custo do lote volta à escala certa multiplicando por uma
+    potência pré-calculada. Custos acima de `limite` saturam em infinito (o lote é tratado como
+    inviável), o que também limita o tamanho das tabelas de potências.
+
+    Com custo_estoque <= 1 os números não crescem e o cálculo é o do MotorCusto, convertido para float.
+    """
+
+    def __init__(self, demanda: list[int], custo_fixo: int, custo_estoque: int, capacidade: int,
+                 limite: float = 1e300, compacto: bool = False):
+        self.limite = limite
+        self.crescente = custo_estoque > 1
+        if not self.crescente:
+            super().__init__(demanda, custo_fixo, custo_estoque, capacidade, compacto)
+            return
+
+        self.demanda = demanda
+        self.custo_fixo = custo_fixo
+        self.custo_estoque = custo_estoque
+        self.capacidade = capacidade
+        self.compacto = compacto
+        self.n = len(demanda)
+
+        # Maior expoente com custo_estoque ** m <= limite; qualquer demanda positiva mais longe
+        # que isso do início do lote já satura o custo
+        self.max_expoente = int(math.log(limite) / math.log(custo_estoque))
+
+        # potencias[m] = custo_estoque ** m e inversas[m] = custo_estoque ** -m, para m <= max_expoente + 1
+        # ultimo_positivo[k] = último período m < k com demanda positiva (-1 se não houver)
+        self.potencias = [1.0]
+        self.inversas = [1.0]
+        self.demanda_acumulada = _tabela('q', 0, compacto)
+        self.normalizada = _tabela('d', 0.0, compacto)
+        self.ultimo_positivo = _tabela('q', -1, compacto)
+        self._estender_tabelas(0)
+
+    def _estender_tabelas(self, inicio: int):
+        if not self.crescente:
+            super()._estender_tabelas(inicio)
+            return
+
+        h = float(self.custo_estoque)
+        potencias, inversas = self.potencias, self.inversas
+        while len(potencias) < min(self.n, self.max_expoente) + 2:
+            potencias.append(potencias[-1] * h)
+            inversas.append(inversas[-1] / h)
+
+        acumulada, normalizada, ultimo = self.demanda_acumulada, self.normalizada, self.ultimo_positivo
+        for k in range(inicio, self.n):
+            d = self.demanda[k]
+            acumulada.append(acumulada[k] + d)
+            normalizada.append((normalizada[k] + d) / h)
+            ultimo.append(k if d > 0 else ultimo[k])
+
+    def custo(self, i: int, j: int) -> float:
+        if not self.crescente:
+            return float(super().custo(i, j))
+
+        fim = min(j, self.n - 1)
+        if fim <= i:
+            return float(self.custo_fixo)
+
+        if self.demanda_acumulada[fim + 1] - self.demanda_acumulada[i + 1] > self.capacidade:
+            return float('inf')
+
+        # Só até a última demanda positiva do lote os termos contam
+        u = self.ultimo_positivo[fim + 1]
+        if u <= i:
+            return float(self.custo_fixo)
+        m = u - i
+        if m > self.max_expoente:
+            return float('inf')
+
+        # soma de demanda[k] * custo_estoque ** (k - i) para k em (i, u]
+        ponderada = self.potencias[m + 1] * (self.normalizada[u + 1] - self.normalizada[i + 1] * self.inversas[m])
+        custo = self.custo_fixo + ponderada
+        return custo if custo <= self.limite else float('inf')
+
+    def melhor_fim(self, inicio: int, parada_antecipada: bool = False) -> int:
+        if not self.crescente:
+            return super().melhor_fim(inicio, parada_antecipada)
+
+        h = float(self.custo_estoque)
+        custo = float(self.custo_fixo)
+        producao = 0
+        potencia = 1.0
+        melhor_fim, melhor_medio = inicio, custo
+        for fim in range(inicio + 1, self.n):
+            producao += self.demanda[fim]
+            if producao > self.capacidade:
+                break
+            potencia *= h
+            custo += self.demanda[fim] * potencia
+            # O custo só cresce com o fim: daqui em diante todos saturam
+            if custo > self.limite:
+                break
+
+            medio = custo / (fim - inicio + 1)
+            if medio < melhor_medio:
+                melhor_fim, melhor_medio = fim, medio
+            elif parada_antecipada:
+                break
+        return melhor_fim
+
+
+class MotorCustoLinear(MotorCusto):
+    def __init__(self, demanda: list[int], custo_fixo: int, custo_estoque: int, capacidade: int,
+                 compacto: bool = False):
+        self.demanda = demanda
+        self.custo_fixo = custo_fixo
+        self.custo_estoque = custo_estoque
+        self.capacidade = capacidade
+        self.compacto = compacto
+        self.n = len(demanda)
+
+        # demanda_acumulada[k] = soma de demanda[:k]
+        # ponderada_acumulada[k] = soma de demanda[m] * m para m < k
+        self.demanda_acumulada = _tabela('q', 0, compacto)
+        self.ponderada_acumulada = _tabela('q', 0, compacto)
+        self._estender_tabelas(0)
+
+    def _estender_tabelas(self, inicio: int):
+        acumulada, ponderada = self.demanda_acumulada, self.ponderada_acumulada
+        for k in range(inicio, self.n):
+            d = self.demanda[k]
+            acumulada.append(acumulada[k] + d)
+            ponderada.append(ponderada[k] + d * k)
+
+    def producao(self, i: int, j: int) -> int:
+        """Produção total do lote (i, j), incluindo a demanda do próprio período i"""
+        return self.demanda_acumulada[j + 1] - self.demanda_acumulada[i]
+
+    def viavel(self, i: int, j: int) -> bool:
+        if i > j or i < 0 or j >= self.n:
+            return False
+        return self.producao(i, j) <= self.capacidade
+
+    def custo(self, i: int, j: int) -> float:
+        if i > j or i < 0 or j >= self.n:
+            return float('inf')
+
+        if self.demanda_acumulada[j + 1] - self.demanda_acumulada[i] > self.capacidade:
+            return float('inf')
+
+        # soma de demanda[k] * (k - i) para k em (i, j]
+        ponderada = self.ponderada_acumulada[j + 1] - self.ponderada_acumulada[i + 1]
+        carregada = self.demanda_acumulada[j + 1] - self.demanda_acumulada[i + 1]
+        return self.custo_fixo + self.custo_estoque * (ponderada - i * carregada)
+
+    def melhor_fim(self, inicio: int, parada_antecipada: bool = False) -> int:
+        producao = self.demanda[inicio]
+        if producao > self.capacidade:
+            return inicio
+
+        custo = self.custo_fixo
+        melhor_fim, melhor_medio = inicio, custo
+        for fim in range(inicio + 1, self.n):
+            producao += self.demanda[fim]
+            if producao > self.capacidade:
+                break
+            custo += self.demanda[fim] * self.custo_estoque * (fim - inicio)
+
+            medio = custo / (fim - inicio + 1)
+            if medio < melhor_medio:
+                melhor_fim, melhor_medio = fim, medio
+            elif parada_antecipada:
+                break
+        return melhor_fim
+
+
+class CacheCusto:
+    """
+    Memoriza custo(i, j) de um motor. Se a tabela triangular com todos os lotes do horizonte
+    couber em `capacidade` entradas ela é usada diretamente; caso contrário guarda no máximo
+    `capacidade` lotes, descartando o usado há mais tempo (LRU).
+    """
+
+    def __init__(self, motor: MotorCusto, capacidade: int):
+        self.motor = motor
+        self.capacidade = capacidade
+        self.acertos = 0
+        self.falhas = 0
+
+        n = motor.n
+        self.densa = n * (n + 1) // 2 <= capacidade
+        self.tabela = [None] * (n * (n + 1) // 2) if self.densa else OrderedDict()
+
+    def estender(self):
+        """
+        Acompanha um motor que acabou de ser estendido. Os lotes guardados continuam válidos (o custo
+        de um lote não depende dos períodos depois dele), mas a tabela densa é indexada pelo tamanho
+        do horizonte e recomeça vazia (ou dá lugar à LRU, se o horizonte novo não couber nela).
+        """
+        if self.densa:
+            n = self.motor.n
+            self.densa = n * (n + 1) // 2 <= self.capacidade
+            self.tabela = [None] * (n * (n + 1) // 2) if self.densa else OrderedDict()
+
+    def custo(self, i: int, j: int) -> float:
+        n = self.motor.n
+        # Lotes fora do horizonte não são guardados
+        if i < 0 or i > j or j >= n:
+            return self.motor.custo(i, j)
+
+        if self.densa:
+            chave = i * n - i * (i - 1) // 2 + (j - i)
+            valor = self.tabela[chave]
+            if valor is None:
+                self.falhas += 1
+                valor = self.tabela[chave] = self.motor.custo(i, j)
+            else:
+                self.acertos += 1
+            return valor
+
+        chave = (i, j)
+        valor = self.tabela.get(chave)
+        if valor is None:
+            self.falhas += 1
+            valor = self.tabela[chave] = self.motor.custo(i, j)
+            if len(self.tabela) > self.capacidade:
+                self.tabela.popitem(last=False)
+        else:
+            self.acertos += 1
+            self.tabela.move_to_end(chave)
+        return valor
+
+    def custo_total_plano(self, plano: list[tuple[int, int]]) -> float:
+        return sum(self.custo(i, j) for i, j in plano)
+
+    def taxa_acerto(self) -> float:
+        consultas = self.acertos + self.falhas
+        return self.acertos / consultas if consultas else 0.0
+
+
+def probabilidade_aceitacao(delta: float, T: float) -> float:
+    """
+    exp(-delta / T) do critério de Metropolis sem risco de overflow: deltas inteiros grandes demais
+    para virar float, deltas infinitos e temperaturas nulas resultam em probabilidade zero.
+    """
+    if delta <= 0:
+        return 1.0
+    if T <= 0:
+        return 0.0
+    try:
+        return math.exp(-delta / T)
+    except OverflowError:
+        return 0.0
+
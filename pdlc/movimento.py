@@ -0,0 +1,169 @@
+from collections import namedtuple
+from random import randint
+
+from .motorCusto import MotorCusto
+from .plano import Plano
+
+def custo(i: int, j: int, custo_fixo: int, demanda: list[int], custo_estoque: int, capacidade: int,
+          motor: MotorCusto = None) -> float:
+    """
+    Calcula o custo total de um lote do período i ao j. Com o motor de custos da instância a
+    consulta é em tempo constante; sem ele, o custo é somado diretamente da demanda
+    """
+    if motor is not None:
+        return motor.custo(i, j)
+
+    custo_total = custo_fixo  # Custo fixo
+    producao = 0
+
+    k=i+1
+    while k <= j and k < len(demanda):
+        producao += demanda[k]
+        custo_total += demanda[k] * (custo_estoque**(k-i))  # Custo de estoque
+
+        # Se a produção necessária excede a capacidade, retorna infinito
+        if producao > capacidade:
+            return float('inf')
+
+        k+=1
+
+    return custo_total
+
+
+def custo_medio(i, j, custo_fixo, demanda, custo_estoque, capacidade, motor: MotorCusto = None):
+    """Calcula o custo médio por período para um lote do período i ao j"""
+    custo_total = custo(i, j, custo_fixo, demanda, custo_estoque, capacidade, motor)
+    return custo_total / (j - i + 1)
+
+def deslocamento(p1: tuple[int, int], p2: tuple[int, int]) -> list[list[tuple[int, int]]]:
+    
+    deslocamentos =[]
+    # (1,a)(a+1,5) 1<=a<5
+    for i in range(p1[0], p2[1]):
+        #print(f"({p1[0]}, {i}), ({i+1}, {p2[1]})")
+        deslocamentos.append([(p1[0], i), (i+1, p2[1])])
+    
+    return deslocamentos
+
+def vizinhos(plano: list[tuple[int, int]], iteracoes=10):
+    """Gera, sob demanda, os planos vizinhos por deslocamento de fronteiras sorteadas"""
+    if len(plano) < 2:
+        return
+
+    for i in range(iteracoes):
+        index = randint(1, len(plano)-1)
+        for d in deslocamento(plano[index-1], plano[index]):
+            yield plano[:index-1] + d + plano[index+1:]
+
+
+# namedtuple em vez de typing.NamedTuple: importar o typing dobra o tempo de carga do módulo
+class Movimento(namedtuple("Movimento", ("tipo", "indice", "fim", "delta"))):
+    """
+    Descritor de um movimento sobre um Plano, com a variação de custo que ele provoca:
+    - deslocamento: a fronteira entre os lotes indice e indice+1 passa a ser `fim`
+    - divisao: o lote indice é dividido em (inicio, fim) e (fim + 1, fim original)
+    - uniao: os lotes indice e indice+1 viram um só (fim é o fim do lote unido)
+    """
+    __slots__ = ()
+
+
+TIPOS = ("deslocamento", "divisao", "uniao")
+
+
+def movimentos(plano: Plano, avaliador, tipos=TIPOS, indices=None, ignorar=None):
+    """
+    Gera os movimentos da vizinhança do plano, um a um, já com o delta de custo calculado a partir
+    apenas dos lotes afetados. `avaliador` é qualquer objeto com custo(i, j) (problema, motor ou
+    cache). Movimentos que levam a lotes inviáveis (custo infinito) não são gerados. O plano não
+    pode ser alterado enquanto o gerador estiver em uso.
+
+    - indices: restringe a vizinhança aos movimentos sobre esses lotes (padrão: todos)
+    - ignorar: função (tipo, indice, fim) -> bool consultada antes do cálculo do custo; movimentos
+      para os quais ela devolve True nem chegam a ser avaliados
+    """
+    custo = avaliador.custo
+    infinito = float('inf')
+    fins = plano.fins
+
+    for k in (range(len(fins)) if indices is None else indices):
+        inicio, fim_lote = plano.inicio(k), fins[k]
+        custo_lote = custo(inicio, fim_lote)
+
+        if "divisao" in tipos:
+            for fim in range(inicio, fim_lote):
+                if ignorar is not None and ignorar("divisao", k, fim):
+                    continue
+                novo = custo(inicio, fim) + custo(fim + 1, fim_lote)
+                if novo != infinito:
+                    yield Movimento("divisao", k, fim, novo - custo_lote)
+
+        if k + 1 < len(fins):
+            fim_proximo = fins[k+1]
+            antigo = custo_lote + custo(fim_lote + 1, fim_proximo)
+
+            if "deslocamento" in tipos:
+                for fim in range(inicio, fim_proximo):
+                    if fim == fim_lote or (ignorar is not None and ignorar("deslocamento", k, fim)):
+                        continue
+                    novo = custo(inicio, fim) + custo(fim + 1, fim_proximo)
+                    if novo != infinito:
+                        yield Movimento("deslocamento", k, fim, novo - antigo)
+
+            if "uniao" in tipos and (ignorar is None or not ignorar("uniao", k, fim_proximo)):
+                novo = custo(inicio, fim_proximo)
+                if novo != infinito:
+                    yield Movimento("uniao", k, fim_proximo, novo - antigo)
+
+
+def aplicar_movimento(plano: Plano, movimento: Movimento):
+    if movimento.tipo == "deslocamento":
+        plano.deslocar(movimento.indice, movimento.fim)
+    elif movimento.tipo == "divisao":
+        plano.dividir(movimento.indice, movimento.fim)
+    else:
+        plano.unir(movimento.indice)
+
+
+def busca_local(plano: Plano, avaliador, estrategia: str = "melhor", tipos=TIPOS, max_iter: int = None,
+                prazo=None) -> tuple[Plano, float]:
+    """
+    Busca local sobre a vizinhança de movimentos, alterando o plano no lugar até um ótimo local.
+    - estrategia="melhor": aplica, a cada passo, o movimento de menor delta (best-improvement)
+    - estrategia="primeira": aplica o primeiro movimento que melhora o custo (first-improvement)
+    - prazo: Prazo (ver progresso.py) verificado a cada passo; esgotado, devolve o plano como está
+    """
+    custo_atual = plano.custo(avaliador)
+    num_iter = 0
+    while (max_iter is None or num_iter < max_iter) and not (prazo is not None and prazo.esgotado()):
+        if estrategia == "primeira":
+            escolhido = next((m for m in movimentos(plano, avaliador, tipos) if m.delta < 0), None)
+        else:
+            escolhido = min(movimentos(plano, avaliador, tipos), key=lambda m: m.delta, default=None)
+
+        if escolhido is None or escolhido.delta >= 0:
+            break
+
+        aplicar_movimento(plano, escolhido)
+        # Partindo de um plano inviável o custo é infinito e os deltas que o corrigem também (inf - inf):
+        # o custo é recalculado até o plano voltar a ser viável
+        if custo_atual == float('inf'):
+            custo_atual = plano.custo(avaliador)
+        else:
+            custo_atual += escolhido.delta
+        num_iter += 1
+
+    return plano, custo_atual
+
+
+def buscalocal(plano: list[tuple[int, int]], custo_fixo: int, demanda: list[int], custo_estoque: int, capacidade: int,
+               estrategia: str = "melhor") -> list[tuple[int, int]]:
+    """Busca local sobre um plano em tuplas, com o modelo de custo das funções deste módulo"""
+    motor = MotorCusto(demanda, custo_fixo, custo_estoque, capacidade)
+    plano_local, _ = busca_local(Plano.de_tuplas(plano), motor, estrategia)
+    return plano_local.para_tuplas()
+
+
+if __name__ == "__main__":
+    print(deslocamento((1,1), (2,5)))
+    for n in vizinhos( [(0, 2), (3, 4), (5, 6)]):
+        print(n)
@@ -0,0 +1,101 @@
+"""
+Representação Compacta de Planos de Produção do PDLC
+====================================================
+
+Descrição:
+----------
+Um plano é guardado apenas pelos fins dos seus lotes, em um array('l'): o lote k vai de
+fins[k-1] + 1 (ou 0, para o primeiro lote) até fins[k]. Deslocar a fronteira entre dois lotes,
+dividir um lote ou unir dois lotes vizinhos altera o array no lugar, e o custo do plano é
+calculado percorrendo o array, sem montar tuplas.
+
+copia() devolve um retrato do plano que compartilha o array com o original; o array só é
+duplicado quando um dos dois for alterado (copy-on-write), de modo que guardar o melhor plano
+até o momento não custa uma cópia a cada melhora.
+
+A conversão de/para a lista de tuplas (inicio, fim) usada pelos otimizadores fica restrita à
+entrada e à saída deles (de_tuplas e para_tuplas).
+"""
+
+from array import array
+
+
+class Plano:
+    __slots__ = ("fins", "_compartilhado")
+
+    def __init__(self, fins=()):
+        self.fins = fins if isinstance(fins, array) else array('l', fins)
+        self._compartilhado = False
+
+    @classmethod
+    def de_tuplas(cls, plano: list[tuple[int, int]]) -> "Plano":
+        return cls(fim for _, fim in plano)
+
+    def para_tuplas(self) -> list[tuple[int, int]]:
+        plano = []
+        inicio = 0
+        for fim in self.fins:
+            plano.append((inicio, fim))
+            inicio = fim + 1
+        return plano
+
+    def __len__(self) -> int:
+        return len(self.fins)
+
+    def __getitem__(self, k: int) -> tuple[int, int]:
+        if k < 0:
+            k += len(self.fins)
+        return self.inicio(k), self.fins[k]
+
+    def __iter__(self):
+        inicio = 0
+        for fim in self.fins:
+            yield inicio, fim
+            inicio = fim + 1
+
+    def __eq__(self, outro) -> bool:
+        if isinstance(outro, Plano):
+            return self.fins == outro.fins
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Plano({self.para_tuplas()})"
+
+    def inicio(self, k: int) -> int:
+        return self.fins[k-1] + 1 if k > 0 else 0
+
+    def copia(self) -> "Plano":
+        """Retrato do plano; o array só é duplicado na próxima alteração de um dos dois"""
+        retrato = Plano(self.fins)
+        retrato._compartilhado = self._compartilhado = True
+        return retrato
+
+    def _preparar_escrita(self):
+        if self._compartilhado:
+            self.fins = array('l', self.fins)
+            self._compartilhado = False
+
+    def deslocar(self, k: int, fim: int):
+        """Move a fronteira entre os lotes k e k+1 para depois de `fim`"""
+        self._preparar_escrita()
+        self.fins[k] = fim
+
+    def dividir(self, k: int, fim: int):
+        """Divide o lote k em (inicio, fim) e (fim + 1, fim original)"""
+        self._preparar_escrita()
+        self.fins.insert(k, fim)
+
+    def unir(self, k: int):
+        """Une os lotes k e k+1"""
+        self._preparar_escrita()
+        del self.fins[k]
+
+    def custo(self, avaliador) -> float:
+        """Custo total, com `avaliador` sendo qualquer objeto com custo(i, j) (problema, motor ou cache)"""
+        custo = avaliador.custo
+        total = 0
+        inicio = 0
+        for fim in self.fins:
+            total += custo(inicio, fim)
+            inicio = fim + 1
+        return total
@@ -0,0 +1,85 @@
+"""
+Relatório de Progresso e Prazo de Execução das Metaheurísticas do PDLC
+======================================================================
+
+Descrição:
+----------
+Tira a escrita no console de dentro dos laços dos otimizadores. Os otimizadores chamam
+Progresso.informar nos pontos naturais de verificação (a cada temperatura no Simulated
+Annealing, a cada varredura do enxame no Particle Swarm) e o relatório só é emitido a cada
+`a_cada_iter` iterações ou a cada `a_cada_ms` milissegundos, o que vier primeiro. Cada
+relatório traz o melhor custo e a taxa de iterações por segundo, e pode ser impresso, entregue
+a uma função de callback ou ambos; no modo silencioso nada é impresso.
+
+Prazo controla o orçamento de tempo com o relógio monotônico, consultado apenas a cada
+`a_cada` verificações.
+"""
+
+import time
+
+
+class Progresso:
+    def __init__(self, a_cada_iter: int = None, a_cada_ms: float = 1000, silencioso: bool = False, callback=None):
+        self.a_cada_iter = a_cada_iter
+        self.a_cada_ms = a_cada_ms
+        self.silencioso = silencioso
+        self.callback = callback
+        self.iniciar()
+
+    def iniciar(self):
+        self.inicio = time.monotonic()
+        self.ultimo_tempo = self.inicio
+        self.ultima_iter = 0
+
+    def mensagem(self, *args):
+        """Mensagem avulsa do otimizador (solução inicial, resumo final...)"""
+        if not self.silencioso:
+            print(*args)
+
+    def informar(self, num_iter: int, melhor_custo: float, **extras):
+        if self.a_cada_iter is not None and num_iter - self.ultima_iter >= self.a_cada_iter:
+            self.emitir(num_iter, melhor_custo, **extras)
+            return
+
+        if self.a_cada_ms is not None and (time.monotonic() - self.ultimo_tempo) * 1000 >= self.a_cada_ms:
+            self.emitir(num_iter, melhor_custo, **extras)
+
+    def emitir(self, num_iter: int, melhor_custo: float, final: bool = False, **extras):
+        agora = time.monotonic()
+        decorrido = agora - self.inicio
+        dados = {
+            "iteracoes": num_iter,
+            "melhor_custo": melhor_custo,
+            "tempo": decorrido,
+            "iter_por_seg": num_iter / decorrido if decorrido > 0 else 0.0,
+            "final": final,
+            **extras,
+        }
+        self.ultimo_tempo = agora
+        self.ultima_iter = num_iter
+
+        if self.callback is not None:
+            self.callback(dados)
+
+        if not self.silencioso:
+            detalhes = "".join(f"   {chave}: {valor}" for chave, valor in extras.items())
+            print("Melhor Custo:", melhor_custo, f"   it/s: {dados['iter_por_seg']:.0f}" + detalhes, "       ",
+                  end='\n' if final else '\r')
+
+    def finalizar(self, num_iter: int, melhor_custo: float, **extras):
+        self.emitir(num_iter, melhor_custo, final=True, **extras)
+
+
+class Prazo:
+    def __init__(self, segundos: float, a_cada: int = 1):
+        self.fim = time.monotonic() + segundos
+        self.a_cada = max(1, a_cada)
+        self.verificacoes = 0
+        self.esgotou = False
+
+    def esgotado(self) -> bool:
+        if not self.esgotou:
+            self.verificacoes += 1
+            if self.verificacoes % self.a_cada == 0:
+                self.esgotou = time.monotonic() >= self.fim
+        return self.esgotou
@@ -0,0 +1,242 @@
+"""
+Resolução em Massa de Instâncias do PDLC
+========================================
+
+Descrição:
+----------
+Resolve um fluxo de instâncias (uma por SKU/local, por exemplo) distribuindo-as entre processos
+trabalhadores. Os processos do pool são criados uma única vez e reaproveitados entre instâncias,
+com os módulos dos otimizadores (e o NumPy, no PSO vetorizado) já importados pelo inicializador,
+de modo que cada instância paga apenas o próprio tempo de otimização.
+
+As instâncias são lidas sob demanda: no máximo `max_pendentes` ficam submetidas ao pool ao
+mesmo tempo, e cada resultado é devolvido assim que fica pronto (fora da ordem de entrada),
+então nem a entrada nem a saída precisam caber na memória.
+
+Formato de entrada (uma instância JSON por linha, o mesmo gerado por benchmark.py):
+
+    {"id": "sku-1", "demanda": [...], "custo_fixo": 200, "custo_estoque": 5, "capacidade": 500}
+
+Os campos opcionais "algoritmo" e "tempo" substituem, para aquela instância, o algoritmo e o
+orçamento de tempo (em segundos) padrão.
+
+Séries longas podem ficar em um arquivo binário (ver instanciaBinaria.py), indicado no lugar dos
+dados: {"id": "sku-2", "arquivo": "sku-2.pdlc"}.
+
+Uso:
+----
+    python -m pdlc.resolverInstancias instancias.jsonl --algoritmo sa --tempo 5 --processos 8 --saida planos.jsonl
+    pdlc batch instancias.jsonl --algoritmo sa --tempo 5 --processos 8 --saida planos.jsonl
+"""
+
+import argparse
+import importlib
+import importlib.util
+import json
+import math
+import os
+import random
+import sys
+import time
+from contextlib import contextmanager
+
+from .progresso import Progresso
+
+# Os otimizadores só são importados pelo algoritmo que os usa (ver MODULOS), para que carregar
+# este módulo, ou pedir um único algoritmo, não pague a importação de todos eles
+
+
+def resolver_sa(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    from . import SimulatedAnnealing
+    with _problema(instancia, SimulatedAnnealing.ProblemaLote) as problema:
+        return SimulatedAnnealing.OtimizadorPlano(problema).simulated_annealing(
+            T_inicial=10000, T_min=1e-6, alpha=0.999, iter_por_temp=100, temp_exec=tempo,
+            progresso=Progresso(silencioso=True))
+
+
+def resolver_tabu(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    from . import BuscaTabu
+    with _problema(instancia, BuscaTabu.ProblemaLote) as problema:
+        return BuscaTabu.OtimizadorPlano(problema).busca_tabu(temp_exec=tempo, progresso=Progresso(silencioso=True))
+
+
+def resolver_pso(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    from . import ParticleSwarm
+    with _problema(instancia, ParticleSwarm.ProblemaLote) as problema:
+        otimizador = ParticleSwarm.OtimizadorPlano(problema, 100, vetorizado=_numpy_disponivel())
+        return otimizador.PSO(temp_exec=tempo, w=0.8, c1=1.7, c2=1.2, progresso=Progresso(silencioso=True))
+
+
+def resolver_guloso(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    from .PDLC import PDLC, ConstrutorPlano
+    with _problema(instancia, PDLC) as problema:
+        plano = ConstrutorPlano(problema).construir()
+        return plano.para_tuplas(), plano.custo(problema)
+
+
+def resolver_silver_meal(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    """Silver-Meal de silverMeal.py (custo de estoque linear), com o plano convertido para períodos a partir de 0"""
+    from . import silverMeal
+    with _parametros(instancia) as (demanda, custo_fixo, custo_estoque, capacidade):
+        plano, custo = silverMeal.silver_meal(demanda, capacidade, custo_fixo, custo_estoque)
+    return [(inicio - 1, fim - 1) for inicio, fim in plano], custo
+
+
+def resolver_exato(instancia: dict, tempo: float) -> tuple[list[tuple[int, int]], float]:
+    from .PDLC import PDLC
+    with _problema(instancia, PDLC) as problema:
+        return problema.motor.plano_otimo()
+
+
+ALGORITMOS = {
+    "sa": resolver_sa,
+    "tabu": resolver_tabu,
+    "pso": resolver_pso,
+    "guloso": resolver_guloso,
+    "silver_meal": resolver_silver_meal,
+    "exato": resolver_exato,
+}
+
+# Módulos que cada algoritmo importa, carregados de antemão pelos processos do pool
+MODULOS = {
+    "sa": ["SimulatedAnnealing"],
+    "tabu": ["BuscaTabu"],
+    "pso": ["ParticleSwarm"],
+    "guloso": ["PDLC"],
+    "silver_meal": ["silverMeal"],
+    "exato": ["PDLC"],
+}
+
+
+@contextmanager
+def _parametros(instancia: dict):
+    """(demanda, custo_fixo, custo_estoque, capacidade) da instância; um arquivo binário fica aberto só dentro do bloco"""
+    if "arquivo" in instancia:
+        # Instância no formato binário: a demanda fica mapeada do arquivo, sem passar pelo JSON
+        from .instanciaBinaria import abrir_instancia
+        with abrir_instancia(instancia["arquivo"]) as binaria:
+            yield binaria.parametros()
+    else:
+        yield instancia["demanda"], instancia["custo_fixo"], instancia["custo_estoque"], instancia["capacidade"]
+
+
+@contextmanager
+def _problema(instancia: dict, classe):
+    """
+    O problema da instância montado com `classe`. Um arquivo binário fica aberto só dentro do
+    bloco, e o problema é montado por InstanciaBinaria.problema (tabelas compactas e motor float)
+    """
+    if "arquivo" in instancia:
+        from .instanciaBinaria import abrir_instancia
+        with abrir_instancia(instancia["arquivo"]) as binaria:
+            yield binaria.problema(classe)
+    else:
+        yield classe(instancia["demanda"], instancia["custo_fixo"], instancia["custo_estoque"], instancia["capacidade"])
+
+
+def _numpy_disponivel() -> bool:
+    return importlib.util.find_spec("numpy") is not None
+
+
+def _iniciar_trabalhador(algoritmos):
+    """Deixa o processo pronto antes da primeira instância, com os otimizadores (e o NumPy do PSO vetorizado) importados"""
+    for algoritmo in algoritmos:
+        for modulo in MODULOS.get(algoritmo, ()):
+            importlib.import_module("." + modulo, __package__)
+    if "pso" in algoritmos and _numpy_disponivel():
+        from . import enxameVetorizado  # noqa: F401
+
+
+def _resolver(indice: int, instancia: dict, algoritmo: str, tempo: float, semente: int) -> dict:
+    identificador = instancia.get("id", indice)
+    algoritmo = instancia.get("algoritmo", algoritmo)
+    tempo = instancia.get("tempo", tempo)
+    random.seed(f"{semente}-{identificador}")
+
+    resultado = {"id": identificador, "algoritmo": algoritmo, "plano": None, "custo": None, "erro": None}
+    t0 = time.perf_counter()
+    try:
+        plano, custo = ALGORITMOS[algoritmo](instancia, tempo)
+        resultado["plano"] = plano
+        resultado["custo"] = None if math.isinf(custo) else custo
+    except Exception as erro:
+        resultado["erro"] = f"{type(erro).__name__}: {erro}"
+    resultado["tempo"] = time.perf_counter() - t0
+    return resultado
+
+
+def resolver_instancia(instancia: dict, algoritmo: str = "sa", tempo: float = 5, semente: int = 0) -> dict:
+    """Resolve uma única instância no próprio processo, com o mesmo resultado de resolver_instancias"""
+    return _resolver(0, instancia, algoritmo, tempo, semente)
+
+
+def ler_instancias(arquivo):
+    """Lê instâncias de um arquivo JSON Lines (caminho, objeto de arquivo ou "-" para a entrada padrão)"""
+    if arquivo == "-":
+        arquivo = sys.stdin
+    if isinstance(arquivo, (str, os.PathLike)):
+        with open(arquivo) as entrada:
+            yield from ler_instancias(entrada)
+        return
+
+    for linha in arquivo:
+        if linha.strip():
+            yield json.loads(linha)
+
+
+def resolver_instancias(instancias, algoritmo: str = "sa", tempo: float = 5, num_processos: int = None,
+                        max_pendentes: int = None, semente: int = 0, algoritmos=None):
+    """
+    Gera um resultado por instância, na ordem em que ficam prontos. `instancias` é qualquer
+    iterável de dicionários (ver ler_instancias) e só é consumido à medida que há vaga no pool.
+
+    - max_pendentes: instâncias submetidas e ainda não devolvidas (padrão: 2 por processo)
+    - algoritmos: algoritmos que podem aparecer nas instâncias, para o aquecimento dos processos
+    """
+    from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+
+    num_processos = num_processos or os.cpu_count() or 1
+    max_pendentes = max_pendentes or 2 * num_processos
+    algoritmos = set(algoritmos or ()) | {algoritmo}
+
+    instancias = iter(enumerate(instancias))
+    with ProcessPoolExecutor(max_workers=num_processos, initializer=_iniciar_trabalhador,
+                             initargs=(algoritmos,)) as executor:
+        pendentes = set()
+        while True:
+            for indice, instancia in instancias:
+                pendentes.add(executor.submit(_resolver, indice, instancia, algoritmo, tempo, semente))
+                if len(pendentes) >= max_pendentes:
+                    break
+
+            if not pendentes:
+                break
+
+            prontos, pendentes = wait(pendentes, return_when=FIRST_COMPLETED)
+            for futuro in prontos:
+                yield futuro.result()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Resolve várias instâncias do PDLC em paralelo")
+    parser.add_argument("entrada", help="arquivo JSON Lines com uma instância por linha (- para a entrada padrão)")
+    parser.add_argument("--algoritmo", choices=sorted(ALGORITMOS), default="sa")
+    parser.add_argument("--tempo", type=float, default=5, help="orçamento padrão em segundos por instância")
+    parser.add_argument("--processos", type=int, default=None, help="processos trabalhadores (padrão: CPUs)")
+    parser.add_argument("--semente", type=int, default=0)
+    parser.add_argument("--saida", default="-", help="arquivo JSON Lines de saída (padrão: saída padrão)")
+    args = parser.parse_args(argv)
+
+    saida = sys.stdout if args.saida == "-" else open(args.saida, "w")
+    try:
+        for resultado in resolver_instancias(ler_instancias(args.entrada), args.algoritmo, args.tempo,
+                                             args.processos, semente=args.semente, algoritmos=ALGORITMOS):
+            saida.write(json.dumps(resultado) + "\n")
+            saida.flush()
+    finally:
+        if saida is not sys.stdout:
+            saida.close()
+
+
+if __name__ == "__main__":
+    main()
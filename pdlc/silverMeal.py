@@ -0,0 +1,201 @@
+import time
+
+def custo(s, demanda, h, i, j):
+    """Calcula o custo total e estoque máximo para um lote do período i ao j"""
+    custo_total = s  # Custo fixo
+    producao = sum(demanda[i-1:j])  # Produção necessária para cobrir i até j
+    estoque_max = 0
+    estoque_atual = producao
+    
+    for k in range(i, j+1):
+        if k > len(demanda):
+            break
+        estoque_atual -= demanda[k-1]  # Consome a demanda do período
+        custo_total += estoque_atual * h  # Custo de estoque
+        estoque_max = max(estoque_max, estoque_atual)
+    
+    return custo_total, estoque_max
+
+def custo_medio(s, demanda, h, i, j):
+    """Calcula o custo médio por período para um lote do período i ao j"""
+    custo_total, estoque = custo(s, demanda, h, i, j)
+    return custo_total / (j - i + 1), estoque
+
+def calcular_custo_total(plano, demanda, custo_fixo, custo_estoque, capacidade):
+    """Calcula o custo total de um plano de produção"""
+    custo_total = 0
+    for inicio, fim in plano:
+        custo_lote, estoque = custo(custo_fixo, demanda, custo_estoque, inicio, fim)
+        if estoque > capacidade:
+            return float('inf')  # Plano inviável
+        custo_total += custo_lote
+    return custo_total
+
+def limitantes_sufixo(demanda, capacidade, custo_fixo, custo_estoque):
+    """
+    limitante[i]: menor custo para cobrir os períodos i..n sem restrições adicionais (programação
+    dinâmica de trás para frente), com limitante[n + 1] = 0. Qualquer restrição extra só aumenta
+    esse custo, então ele é um limitante inferior válido para o restante de um plano parcial.
+    """
+    n_periodos = len(demanda)
+    limitante = [float('inf')] * (n_periodos + 2)
+    limitante[n_periodos + 1] = 0
+    for i in range(n_periodos, 0, -1):
+        custo_lote = custo_fixo
+        estoque = 0
+        for j in range(i, n_periodos + 1):
+            if j > i:
+                estoque += demanda[j-1]
+                custo_lote += demanda[j-1] * (j - i) * custo_estoque
+            if estoque > capacidade:
+                break
+            limitante[i] = min(limitante[i], custo_lote + limitante[j + 1])
+    return limitante
+
+def backtracking(demanda, capacidade, custo_fixo, custo_estoque, restricao=None, instrumentacao=None):
+    """
+    Busca exata por branch-and-bound sobre as segmentações do horizonte. O custo do plano parcial
+    é mantido ao longo da recursão e um ramo é podado assim que:
+    - o lote recém-acrescentado excede a capacidade (e, com ele, todo lote maior a partir do mesmo início);
+    - o custo parcial mais o limitante inferior do restante (ver limitantes_sufixo) não é menor
+      que o do melhor plano conhecido, que começa como a solução do Silver-Meal;
+    - restricao(plano_parcial) devolve False.
+
+    restricao permite restrições adicionais que a programação dinâmica não trata (por exemplo,
+    períodos sem produção ou um número máximo de lotes). Ela recebe o plano parcial com o lote
+    recém-acrescentado e deve devolver False apenas se nenhum complemento desse plano for aceitável.
+    Se nenhum plano a satisfizer, devolve (None, inf).
+
+    instrumentacao: se informada (ver instrumentacao.py), recebe o tempo da busca e os números de
+    nós visitados e de podas.
+    """
+    n_periodos = len(demanda)
+    limitante = limitantes_sufixo(demanda, capacidade, custo_fixo, custo_estoque)
+
+    # O Silver-Meal só serve de incumbente se todos os seus prefixos respeitarem a restrição
+    melhor_combinacao, menor_custo = silver_meal(demanda, capacidade, custo_fixo, custo_estoque)
+    if restricao is not None and not all(restricao(melhor_combinacao[:k])
+                                         for k in range(1, len(melhor_combinacao) + 1)):
+        melhor_combinacao, menor_custo = None, float('inf')
+
+    contadores = {"nos": 0, "podas_capacidade": 0, "podas_limitante": 0, "podas_restricao": 0}
+
+    def recursao(inicio, custo_parcial, combinacao_atual):
+        nonlocal menor_custo, melhor_combinacao
+        contadores["nos"] += 1
+
+        if inicio > n_periodos:
+            if custo_parcial < menor_custo:
+                menor_custo = custo_parcial
+                melhor_combinacao = combinacao_atual.copy()
+            return
+
+        custo_lote = custo_fixo
+        estoque = 0
+        for fim in range(inicio, n_periodos + 1):
+            if fim > inicio:
+                estoque += demanda[fim-1]
+                custo_lote += demanda[fim-1] * (fim - inicio) * custo_estoque
+            # O estoque só cresce com o fim do lote: nenhum lote maior a partir de inicio é viável
+            if estoque > capacidade:
+                contadores["podas_capacidade"] += 1
+                break
+            if custo_parcial + custo_lote + limitante[fim + 1] >= menor_custo:
+                contadores["podas_limitante"] += 1
+                continue
+
+            combinacao_atual.append((inicio, fim))
+            if restricao is None or restricao(combinacao_atual):
+                recursao(fim + 1, custo_parcial + custo_lote, combinacao_atual)
+            else:
+                contadores["podas_restricao"] += 1
+            combinacao_atual.pop()
+
+    t0 = time.perf_counter()
+    recursao(1, 0, [])
+    if instrumentacao is not None:
+        instrumentacao.tempos["busca"] += time.perf_counter() - t0
+        instrumentacao.chamadas["busca"] += 1
+        for nome, valor in contadores.items():
+            instrumentacao.contar(nome, valor)
+    return melhor_combinacao, menor_custo
+
+def wagner_whitin(demanda, capacidade, custo_fixo, custo_estoque):
+    """Solução exata por programação dinâmica (caminho mínimo sobre os períodos), em O(n²)"""
+    n_periodos = len(demanda)
+    melhor = [0] + [float('inf')] * n_periodos  # melhor[j]: menor custo cobrindo os períodos 1..j
+    anterior = [0] * (n_periodos + 1)            # anterior[j]: início do último lote nesse caminho
+
+    for i in range(1, n_periodos + 1):
+        custo_lote = custo_fixo
+        estoque = 0
+        for j in range(i, n_periodos + 1):
+            if j > i:
+                estoque += demanda[j-1]
+                custo_lote += demanda[j-1] * (j - i) * custo_estoque
+            # O estoque só cresce com j: nenhum lote maior a partir de i é viável
+            if estoque > capacidade:
+                break
+            if melhor[i-1] + custo_lote < melhor[j]:
+                melhor[j] = melhor[i-1] + custo_lote
+                anterior[j] = i
+
+    plano = []
+    j = n_periodos
+    while j > 0:
+        plano.append((anterior[j], j))
+        j = anterior[j] - 1
+    plano.reverse()
+    return plano, melhor[n_periodos]
+
+def silver_meal(demanda, capacidade, custo_fixo, custo_estoque):
+    n_periodos = len(demanda)
+    plano = []
+    i = 1
+    
+    while i <= n_periodos:
+        melhor_custo_medio = float('inf')
+        melhor_j = i
+        
+        for j in range(i, n_periodos + 1):
+            custo_medio_atual, estoque = custo_medio(custo_fixo, demanda, custo_estoque, i, j)
+            
+            if estoque > capacidade:
+                break
+                
+            if custo_medio_atual < melhor_custo_medio:
+                melhor_custo_medio = custo_medio_atual
+                melhor_j = j
+            else:
+                break
+        
+        plano.append((i, melhor_j))
+        i = melhor_j + 1
+    
+    custo_total = calcular_custo_total(plano, demanda, custo_fixo, custo_estoque, capacidade)
+    return plano, custo_total
+
+
+if __name__ == "__main__":
+    # Dados de exemplo
+    demanda = [22, 35, 18, 42, 27, 31, 25, 38, 29, 33, 
+                19, 26, 37, 24, 41, 28, 32, 23, 36, 30, 18, 42, 27, 31,]
+
+    capacidade = 80
+    custo_fixo = 100  # por período
+    custo_estoque = 2  # por unidade por período
+
+    t0 = time.time()
+    solucao, custo_total = silver_meal(demanda, capacidade, custo_fixo, custo_estoque)
+    print(f"Silver Meal ({round(time.time()-t0, 6)}):", solucao, custo_total)
+
+    # Execução da solução exata (programação dinâmica)
+    t0 = time.time()
+    solucao, custo_total = wagner_whitin(demanda, capacidade, custo_fixo, custo_estoque)
+    print(f"Wagner-Whitin ({round(time.time()-t0, 6)}):", solucao, custo_total)
+
+    # Solução exata com uma restrição que a programação dinâmica não trata: sem produção nos períodos 5 e 12
+    t0 = time.time()
+    solucao, custo_total = backtracking(demanda, capacidade, custo_fixo, custo_estoque,
+                                        restricao=lambda plano: plano[-1][0] not in (5, 12))
+    print(f"Branch-and-bound com restrição ({round(time.time()-t0, 6)}):", solucao, custo_total)
\ No newline at end of file
@@ -0,0 +1,238 @@
+"""
+Corretude dos motores de custo, das soluções exatas, do Plano e dos checkpoints, conferida
+contra os laços de custo originais (copiados abaixo) e contra a enumeração de todos os planos
+"""
+
+import itertools
+import random
+
+import pytest
+
+from pdlc import silverMeal
+from pdlc.checkpoint import Checkpoint
+from pdlc.historico import HistoricoCustos
+from pdlc.motorCusto import MotorCusto, MotorCustoFloat, MotorCustoLinear
+from pdlc.plano import Plano
+from pdlc.progresso import Progresso
+from pdlc.SimulatedAnnealing import OtimizadorPlano, ProblemaLote
+
+
+# Laços de custo originais: exponencial (PDLC), linear (Particle Swarm) e Silver-Meal (períodos a partir de 1)
+
+def custo_exponencial(demanda, custo_fixo, custo_estoque, capacidade, i, j):
+    custo_total = custo_fixo
+    producao = 0
+    for k in range(i + 1, j + 1):
+        if k >= len(demanda):
+            break
+        producao += demanda[k]
+        custo_total += demanda[k] * (custo_estoque ** (k - i))
+        if producao > capacidade:
+            return float('inf')
+    return custo_total
+
+
+def custo_linear(demanda, custo_fixo, custo_estoque, capacidade, i, j):
+    if i > j or i < 0 or j >= len(demanda):
+        return float('inf')
+    custo_total = custo_fixo
+    producao = 0
+    for k in range(i, j + 1):
+        producao += demanda[k]
+        if producao > capacidade:
+            return float('inf')
+        if k > i:
+            custo_total += demanda[k] * custo_estoque * (k - i)
+    return custo_total
+
+
+def custo_silver_meal(plano, demanda, custo_fixo, custo_estoque, capacidade):
+    custo_total = 0
+    for inicio, fim in plano:
+        custo_lote = custo_fixo
+        estoque_atual = sum(demanda[inicio-1:fim])
+        estoque_max = 0
+        for k in range(inicio, fim + 1):
+            estoque_atual -= demanda[k-1]
+            custo_lote += estoque_atual * custo_estoque
+            estoque_max = max(estoque_max, estoque_atual)
+        if estoque_max > capacidade:
+            return float('inf')
+        custo_total += custo_lote
+    return custo_total
+
+
+def planos(n):
+    """Todos os planos de n períodos (a partir de 0), como listas de tuplas"""
+    for fronteiras in itertools.product((False, True), repeat=n - 1):
+        fins = [k for k, fronteira in enumerate(fronteiras) if fronteira] + [n - 1]
+        yield Plano(fins).para_tuplas()
+
+
+def instancia(n, semente, capacidade=None):
+    rng = random.Random(semente)
+    demanda = [rng.choice((0, rng.randint(1, 50))) for _ in range(n)]
+    return demanda, rng.randint(50, 300), capacidade if capacidade is not None else rng.randint(60, 400)
+
+
+def _igual(valor, referencia):
+    if referencia == float('inf'):
+        return valor == float('inf')
+    return valor == pytest.approx(referencia, rel=1e-9)
+
+
+def _pares(n, rng, amostras=1500):
+    """Lotes (i, j) a conferir: todos para horizontes curtos, uma amostra para os longos (j pode passar do fim)"""
+    if n * (n + 3) <= amostras:
+        return [(i, j) for i in range(n) for j in range(i, n + 3)]
+    return [(i, rng.randint(i, n + 2)) for i in (rng.randrange(n) for _ in range(amostras))]
+
+
+# Motores de custo
+
+@pytest.mark.parametrize("n", [20, 150])
+@pytest.mark.parametrize("custo_estoque", [0, 1, 2, 3, 0.5, 1.5])
+@pytest.mark.parametrize("compacto", [False, True])
+def test_motor_exponencial(n, custo_estoque, compacto):
+    rng = random.Random(n)
+    for semente, capacidade in ((0, None), (1, 10 ** 9)):
+        demanda, custo_fixo, capacidade = instancia(n, semente, capacidade)
+        motor = MotorCusto(demanda, custo_fixo, custo_estoque, capacidade, compacto=compacto)
+        for i, j in _pares(n, rng):
+            referencia = custo_exponencial(demanda, custo_fixo, custo_estoque, capacidade, i, j)
+            if isinstance(custo_estoque, int):
+                assert motor.custo(i, j) == referencia, (i, j)
+            else:
+                assert _igual(motor.custo(i, j), referencia), (i, j)
+
+
+@pytest.mark.parametrize("custo_estoque", [2, 1.5, 0.5])
+def test_motor_float(custo_estoque):
+    rng = random.Random(0)
+    demanda, custo_fixo, _ = instancia(150, 0)
+    motor = MotorCustoFloat(demanda, custo_fixo, custo_estoque, 10 ** 9)
+    for i, j in _pares(150, rng):
+        assert _igual(motor.custo(i, j), custo_exponencial(demanda, custo_fixo, custo_estoque, 10 ** 9, i, j)), (i, j)
+
+
+@pytest.mark.parametrize("compacto", [False, True])
+def test_motor_linear(compacto):
+    rng = random.Random(0)
+    for semente in range(3):
+        demanda, custo_fixo, capacidade = instancia(60, semente)
+        motor = MotorCustoLinear(demanda, custo_fixo, 3, capacidade, compacto=compacto)
+        for i, j in _pares(60, rng) + [(5, 2), (-1, 3)]:
+            assert motor.custo(i, j) == custo_linear(demanda, custo_fixo, 3, capacidade, i, j), (i, j)
+
+
+def test_motor_estendido():
+    demanda, custo_fixo, _ = instancia(200, 0)
+    motor = MotorCusto(demanda[:70], custo_fixo, 2, 10 ** 9)
+    motor.estender(demanda[70:])
+    rng = random.Random(0)
+    for i, j in _pares(200, rng):
+        assert motor.custo(i, j) == custo_exponencial(demanda, custo_fixo, 2, 10 ** 9, i, j), (i, j)
+
+
+# Soluções exatas contra a enumeração de todos os planos
+
+@pytest.mark.parametrize("n", range(1, 10))
+@pytest.mark.parametrize("classe, custo_estoque, referencia", [
+    (MotorCusto, 2, custo_exponencial),
+    (MotorCusto, 0.5, custo_exponencial),
+    (MotorCustoFloat, 2, custo_exponencial),
+    (MotorCustoLinear, 2, custo_linear),
+])
+def test_plano_otimo(n, classe, custo_estoque, referencia):
+    for semente in range(4):
+        demanda, custo_fixo, capacidade = instancia(n, semente)
+        motor = classe(demanda, custo_fixo, custo_estoque, capacidade)
+        melhor = min(sum(referencia(demanda, custo_fixo, custo_estoque, capacidade, i, j) for i, j in plano)
+                     for plano in planos(n))
+
+        plano, custo = motor.plano_otimo()
+        assert _igual(custo, melhor)
+        if custo != float('inf'):
+            assert plano[0][0] == 0 and plano[-1][1] == n - 1
+            assert all(fim + 1 == inicio for (_, fim), (inicio, _) in zip(plano, plano[1:]))
+            assert _igual(sum(referencia(demanda, custo_fixo, custo_estoque, capacidade, i, j) for i, j in plano),
+                          melhor)
+
+
+@pytest.mark.parametrize("n", range(1, 10))
+def test_wagner_whitin(n):
+    for semente in range(4):
+        demanda, custo_fixo, capacidade = instancia(n, semente)
+        melhor = min(custo_silver_meal([(i + 1, j + 1) for i, j in plano], demanda, custo_fixo, 2, capacidade)
+                     for plano in planos(n))
+
+        plano, custo = silverMeal.wagner_whitin(demanda, capacidade, custo_fixo, 2)
+        assert custo == melhor
+        if custo != float('inf'):
+            assert custo_silver_meal(plano, demanda, custo_fixo, 2, capacidade) == melhor
+
+
+# Plano
+
+def test_plano_copia_isolada():
+    original = Plano([2, 5, 9])
+    retrato = original.copia()
+    assert retrato.fins is original.fins
+
+    original.deslocar(0, 3)
+    assert retrato.para_tuplas() == [(0, 2), (3, 5), (6, 9)]
+    assert original.para_tuplas() == [(0, 3), (4, 5), (6, 9)]
+
+    segundo = retrato.copia()
+    retrato.dividir(2, 7)
+    retrato.unir(0)
+    assert retrato.para_tuplas() == [(0, 5), (6, 7), (8, 9)]
+    assert segundo.para_tuplas() == [(0, 2), (3, 5), (6, 9)]
+    assert original.para_tuplas() == [(0, 3), (4, 5), (6, 9)]
+
+    # Cópias de cópias e alterações repetidas continuam independentes
+    terceiro = segundo.copia()
+    segundo.deslocar(1, 8)
+    segundo.deslocar(1, 7)
+    assert terceiro.para_tuplas() == [(0, 2), (3, 5), (6, 9)]
+    assert segundo.para_tuplas() == [(0, 2), (3, 7), (8, 9)]
+
+
+# Checkpoint
+
+class _Interrupcao(Exception):
+    pass
+
+
+def _sa(problema, **opcoes):
+    return OtimizadorPlano(problema).simulated_annealing(T_inicial=100, T_min=0.01, alpha=0.95, iter_por_temp=50,
+                                                         temp_exec=600, **opcoes)
+
+
+def test_checkpoint_retomado_reproduz_execucao(tmp_path):
+    demanda, custo_fixo, capacidade = instancia(40, 0)
+    problema = ProblemaLote(demanda, custo_fixo, 2, capacidade)
+
+    random.seed(0)
+    completo = HistoricoCustos(capacidade=10 ** 6)
+    esperado = _sa(problema, progresso=Progresso(silencioso=True), historico=completo)
+
+    def interromper(dados):
+        if dados["iteracoes"] >= 300:
+            raise _Interrupcao
+
+    arquivo = str(tmp_path / "sa.ckpt")
+    checkpoint = Checkpoint(arquivo, a_cada_s=0)
+    random.seed(0)
+    with pytest.raises(_Interrupcao):
+        _sa(problema, checkpoint=checkpoint,
+            progresso=Progresso(a_cada_iter=1, a_cada_ms=None, silencioso=True, callback=interromper))
+    checkpoint.finalizar()
+
+    estado = Checkpoint.carregar(arquivo)
+    assert 0 < estado["iteracoes"] < 300
+    random.seed(1)
+    retomado = HistoricoCustos(capacidade=10 ** 6)
+    assert _sa(problema, progresso=Progresso(silencioso=True), historico=retomado, retomar=estado) == esperado
+    # O custo a cada iteração depois do checkpoint é o mesmo da execução sem interrupção
+    assert list(retomado.custos) == list(completo.custos)[estado["iteracoes"]:]
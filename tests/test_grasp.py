@@ -0,0 +1,46 @@
+import random
+
+import pytest
+
+from pdlc import Grasp
+from pdlc.Grasp import OtimizadorPlano
+from pdlc.progresso import Progresso
+from pdlc.SimulatedAnnealing import ProblemaLote
+
+
+def _problema(n=30, semente=0):
+    rng = random.Random(semente)
+    return ProblemaLote([rng.randint(1, 50) for _ in range(n)], custo_fixo=200, custo_estoque=2, capacidade=300)
+
+
+class _PrazoEsgotadoNoLote(Grasp.Prazo):
+    """Prazo que passa pela verificação do laço do grasp e se esgota antes da primeira iteração do lote"""
+
+    def esgotado(self) -> bool:
+        self.verificacoes += 1
+        return self.verificacoes > 1
+
+
+@pytest.mark.parametrize("num_processos", [1, 2])
+def test_grasp_sem_tempo_devolve_sem_solucao(num_processos):
+    otimizador = OtimizadorPlano(_problema())
+    plano, custo = otimizador.grasp(temp_exec=0, num_processos=num_processos, semente=0,
+                                    progresso=Progresso(silencioso=True))
+    assert plano == [] and custo == float('inf')
+    assert otimizador.elite == []
+
+
+def test_grasp_prazo_esgotado_dentro_do_lote(monkeypatch):
+    monkeypatch.setattr(Grasp, "Prazo", _PrazoEsgotadoNoLote)
+    otimizador = OtimizadorPlano(_problema())
+    plano, custo = otimizador.grasp(temp_exec=60, num_processos=1, semente=0,
+                                    progresso=Progresso(a_cada_iter=0, a_cada_ms=None, silencioso=True))
+    assert plano == [] and custo == float('inf')
+
+
+def test_grasp_iteracoes_limitadas():
+    problema = _problema()
+    otimizador = OtimizadorPlano(problema)
+    plano, custo = otimizador.grasp(iteracoes=20, num_processos=1, semente=0, progresso=Progresso(silencioso=True))
+    assert custo == problema.custo_total_plano(plano)
+    assert custo >= problema.motor.plano_otimo()[1]
@@ -0,0 +1,34 @@
+import pytest
+
+from pdlc.instanciaBinaria import abrir_instancia, main, salvar_instancia
+from pdlc.PDLC import PDLC
+
+DEMANDA = [22, 35, 18, 42, 27, 31, 25, 38]
+
+
+@pytest.mark.parametrize("custo_estoque", [2, 0.5, 0.1, 1.25])
+def test_custo_estoque_preservado(tmp_path, custo_estoque):
+    arquivo = str(tmp_path / "instancia.pdlc")
+    salvar_instancia(arquivo, DEMANDA, 100, custo_estoque, 80)
+    with abrir_instancia(arquivo) as instancia:
+        assert instancia.custo_estoque == custo_estoque
+        assert type(instancia.custo_estoque) is type(custo_estoque)
+        assert list(instancia.demanda) == DEMANDA
+        problema = instancia.problema(modo_custo="exato")
+        assert problema.custo(0, 2) == PDLC(DEMANDA, 100, custo_estoque, 80).custo(0, 2)
+
+
+def test_custo_estoque_fora_do_cabecalho(tmp_path):
+    with pytest.raises(ValueError, match="Custo de estoque"):
+        salvar_instancia(str(tmp_path / "instancia.pdlc"), DEMANDA, 100, 1e-30, 80)
+
+
+def test_importar_custo_fracionario(tmp_path):
+    csv = tmp_path / "vendas.csv"
+    csv.write_text("demanda\n" + "\n".join(map(str, DEMANDA)) + "\n")
+    arquivo = str(tmp_path / "vendas.pdlc")
+    main([str(csv), arquivo, "--coluna", "demanda", "--custo-fixo", "100", "--custo-estoque", "0.5",
+          "--capacidade", "80"])
+    with abrir_instancia(arquivo) as instancia:
+        assert instancia.custo_estoque == 0.5
+        assert list(instancia.demanda) == DEMANDA
@@ -0,0 +1,44 @@
+import random
+
+from pdlc import ParticleSwarm, SimulatedAnnealing
+from pdlc.instrumentacao import Instrumentacao
+from pdlc.progresso import Progresso
+
+
+def _demanda(n=40, semente=0):
+    rng = random.Random(semente)
+    return [rng.randint(1, 50) for _ in range(n)]
+
+
+def test_sa_reaproveitando_instrumentacao():
+    problema = SimulatedAnnealing.ProblemaLote(_demanda(), custo_fixo=200, custo_estoque=2, capacidade=300)
+    instrumentacao = Instrumentacao()
+    residuos = []
+    for _ in range(3):
+        antes = instrumentacao.tempos["aceitacao_e_registro"]
+        SimulatedAnnealing.OtimizadorPlano(problema).simulated_annealing(
+            T_inicial=100, T_min=1, alpha=0.9, iter_por_temp=200, progresso=Progresso(silencioso=True),
+            instrumentacao=instrumentacao)
+        residuos.append(instrumentacao.tempos["aceitacao_e_registro"] - antes)
+
+    assert all(residuo > 0 for residuo in residuos)
+    fases = sum(instrumentacao.tempos[fase] for fase in ("movimento", "delta", "aplicacao"))
+    assert abs(fases + sum(residuos) - instrumentacao.tempos["laco"]) < 1e-9
+    assert instrumentacao.chamadas["laco"] == 3
+    assert instrumentacao.contadores["iteracoes"] == 3 * 44 * 200
+
+
+def test_pso_reaproveitando_instrumentacao():
+    problema = ParticleSwarm.ProblemaLote(_demanda(), custo_fixo=200, custo_estoque=2, capacidade=300)
+    instrumentacao = Instrumentacao()
+    residuos = []
+    for _ in range(3):
+        antes = instrumentacao.tempos["registro"]
+        ParticleSwarm.OtimizadorPlano(problema, 10).PSO(temp_exec=0.05, w=0.8, c1=1.7, c2=1.2,
+                                                         progresso=Progresso(silencioso=True),
+                                                         instrumentacao=instrumentacao)
+        residuos.append(instrumentacao.tempos["registro"] - antes)
+
+    assert all(residuo > 0 for residuo in residuos)
+    fases = sum(instrumentacao.tempos[fase] for fase in ("atualizacao", "melhor_global"))
+    assert abs(fases + sum(residuos) - instrumentacao.tempos["laco"]) < 1e-9
@@ -0,0 +1,49 @@
+import json
+
+import pytest
+
+from pdlc.linhaComando import main
+from pdlc.resolverInstancias import ALGORITMOS
+
+# Instâncias resolvidas por um único lote, em que não há fronteira a deslocar
+UM_LOTE = [
+    {"demanda": [5], "custo_fixo": 10, "custo_estoque": 2, "capacidade": 100},
+    {"demanda": [5, 3], "custo_fixo": 100, "custo_estoque": 1, "capacidade": 100},
+]
+
+
+@pytest.mark.parametrize("algoritmo", sorted(ALGORITMOS))
+@pytest.mark.parametrize("instancia", UM_LOTE)
+def test_solve_um_lote(capsys, algoritmo, instancia):
+    argv = ["solve", "--algoritmo", algoritmo, "--tempo", "0.2", "--demanda", *map(str, instancia["demanda"]),
+            "--custo-fixo", str(instancia["custo_fixo"]), "--custo-estoque", str(instancia["custo_estoque"]),
+            "--capacidade", str(instancia["capacidade"])]
+    assert main(argv) == 0
+    resultado = json.loads(capsys.readouterr().out)
+    assert resultado["erro"] is None
+    assert resultado["plano"][0][0] == 0 and resultado["plano"][-1][1] == len(instancia["demanda"]) - 1
+
+
+def test_batch_um_lote(tmp_path, capsys):
+    entrada = tmp_path / "instancias.jsonl"
+    with open(entrada, "w") as arquivo:
+        for algoritmo in ("sa", "tabu", "pso"):
+            for k, instancia in enumerate(UM_LOTE):
+                arquivo.write(json.dumps({"id": f"{algoritmo}-{k}", "algoritmo": algoritmo, **instancia}) + "\n")
+
+    main(["batch", str(entrada), "--tempo", "0.2", "--processos", "1"])
+    resultados = [json.loads(linha) for linha in capsys.readouterr().out.splitlines()]
+    assert len(resultados) == 6
+    assert all(resultado["erro"] is None for resultado in resultados)
+
+
+def test_simulated_annealing_um_lote():
+    from pdlc.plano import Plano
+    from pdlc.SimulatedAnnealing import OtimizadorPlano, ProblemaLote
+
+    problema = ProblemaLote([5, 3], custo_fixo=100, custo_estoque=1, capacidade=100)
+    otimizador = OtimizadorPlano(problema)
+    assert otimizador.simulated_annealing(temp_exec=1) == ([(0, 1)], 103)
+    _, custo, melhor_plano, melhor_custo = otimizador.cadeia(Plano([1]), 103, 10.0, 50)
+    assert custo == melhor_custo == 103
+    assert melhor_plano.para_tuplas() == [(0, 1)]
@@ -0,0 +1,24 @@
+import random
+
+import pytest
+
+from pdlc import algoritmoConstrutivo, movimento
+
+
+@pytest.mark.parametrize("modulo", [algoritmoConstrutivo, movimento])
+def test_custo_avulso_ve_demanda_alterada(modulo):
+    demanda = [10, 20, 30, 40]
+    assert modulo.custo(0, 3, 100, demanda, 2, 1000) == 100 + 20 * 2 + 30 * 4 + 40 * 8
+    demanda[2] = 0
+    assert modulo.custo(0, 3, 100, demanda, 2, 1000) == 100 + 20 * 2 + 40 * 8
+    demanda.append(50)
+    assert modulo.custo(0, 4, 100, demanda, 2, 1000) == 100 + 20 * 2 + 40 * 8 + 50 * 16
+
+
+def test_algoritmo_construtivo_ve_demanda_alterada():
+    rng = random.Random(0)
+    demanda = [rng.randint(1, 50) for _ in range(20)]
+    antes = algoritmoConstrutivo.algoritmo_construtivo([], demanda, 100, 2, 80)
+    demanda[:] = [0] * len(demanda)
+    assert algoritmoConstrutivo.algoritmo_construtivo([], demanda, 100, 2, 80) == [(0, len(demanda) - 1)]
+    assert antes != [(0, len(demanda) - 1)]